@@ -9,7 +9,8 @@ import json
 import time
 from datetime import datetime, timedelta
 from src.db.connection import get_db_cursor
-from src.utils.mq import publish_url, publish_job, publish_daily_job
+from src.utils.job_control import JOB_CONTROL, ProgressThrottle, notify_job_stop
+from src.utils.mq import publish_urls, publish_job, publish_daily_job
 from src.utils.crawler_helper import get_random_headers, random_sleep, parse_naver_date, get_robust_session, extract_json_ld
 from src.analysis.news_filter import RelevanceScorer
 
@@ -59,7 +60,8 @@ class AddressCollector:
     def process_urls(self, urls, stock_code=None, date_hint=None):
         from src.utils.metrics import COLLECTOR_URLS_TOTAL
         
-        count = 0
+        # Collect messages and publish once per page instead of one MQ handshake per URL
+        to_publish = []
         for url in urls:
             url_hash = self.get_url_hash(url)
             with get_db_cursor() as cur:
@@ -75,8 +77,7 @@ class AddressCollector:
                             "INSERT INTO tb_news_mapping (url_hash, stock_code) VALUES (%s, %s) ON CONFLICT DO NOTHING",
                             (url_hash, stock_code)
                         )
-                    publish_url({"url": url, "url_hash": url_hash, "stock_code": stock_code})
-                    count += 1
+                    to_publish.append({"url": url, "url_hash": url_hash, "stock_code": stock_code})
                     COLLECTOR_URLS_TOTAL.inc() # Metric update
                 else:
                     # Existing URL
@@ -103,8 +104,9 @@ class AddressCollector:
                             
                             # Publish to queue for re-scoring (even if content exists)
                             # The BodyCollector will skip crawling if content is present.
-                            publish_url({"url": url, "url_hash": url_hash, "stock_code": stock_code})
-                            count += 1
+                            to_publish.append({"url": url, "url_hash": url_hash, "stock_code": stock_code})
+
+        count = publish_urls(to_publish) if to_publish else 0
         print(f"Published {count} new URLs to MQ.")
 
     def handle_job(self, ch, method, properties, body):
@@ -129,6 +131,8 @@ class AddressCollector:
             )
         
         from src.utils.metrics import BACKTEST_PROGRESS
+        # 같은 job_id로 재시작된 작업이 이전 실행의 중단 플래그를 보지 않도록
+        JOB_CONTROL.forget('job', job_id)
         
         try:
             base_end_date = datetime.now()
@@ -165,22 +169,53 @@ class AddressCollector:
                             if start_i > 0:
                                 print(f"[*] Resuming Job {job_id} [{task_key}] from Step {start_i+1}/{days} (Progress: {stored_progress}%)")
 
+            def write_progress(task_progress, msg):
+                with get_db_cursor() as cur:
+                    row = None
+                    if task_key:
+                        # 한 문장으로 task progress 갱신 + 전체 progress(task 평균) 계산 (SELECT ... FOR UPDATE 왕복 없음)
+                        cur.execute("""
+                            UPDATE jobs SET
+                                params = jsonb_set(params, ARRAY['tasks', %(task_key)s, 'progress'], to_jsonb(%(progress)s::numeric)),
+                                progress = (
+                                    SELECT ROUND(AVG(CASE WHEN t.key = %(task_key)s THEN %(progress)s::numeric
+                                                          ELSE (t.value->>'progress')::numeric END), 2)
+                                    FROM jsonb_each(params->'tasks') t
+                                ),
+                                updated_at = CURRENT_TIMESTAMP, message = %(msg)s
+                            WHERE job_id = %(job_id)s AND params->'tasks' ? %(task_key)s
+                            RETURNING progress
+                        """, {"task_key": task_key, "progress": task_progress, "msg": msg, "job_id": job_id})
+                        row = cur.fetchone()
+                    if row:
+                        global_progress = float(row['progress'])
+                    else:
+                        global_progress = task_progress
+                        cur.execute(
+                            "UPDATE jobs SET progress = %s, updated_at = CURRENT_TIMESTAMP, message = %s WHERE job_id = %s",
+                            (global_progress, msg, job_id)
+                        )
+
+                # Also update Prometheus metric for unified tracking
+                # We prefix Job ID with "J" to distinguish from Verification Job IDs
+                BACKTEST_PROGRESS.labels(job_id=f"J{job_id}", stock_code=stock_code, job_type=job_type).set(global_progress)
+
+            progress_writer = ProgressThrottle(write_progress)
+
             # Loop through days
             for i in range(days):
                 if i < start_i:
                     continue
 
-                # Check for stop request
-                with get_db_cursor() as cur:
-                    cur.execute("SELECT status, params FROM jobs WHERE job_id = %s", (job_id,))
-                    row = cur.fetchone()
-                    if not row or row['status'] == 'stop_requested':
-                        if row and row['status'] == 'stop_requested':
-                            cur.execute("UPDATE jobs SET status = 'stopped', completed_at = CURRENT_TIMESTAMP WHERE job_id = %s", (job_id,))
-                        if ch and method: ch.basic_ack(delivery_tag=method.delivery_tag)
-                        return
-                    
-                    params = row['params']
+                # Check for stop request (LISTEN 신호로 갱신되는 플래그 - 매일 DB 조회하지 않음)
+                if JOB_CONTROL.is_stopped('job', job_id):
+                    progress_writer.flush()  # 재개 시 이어서 시작하도록 마지막 진행률 기록
+                    with get_db_cursor() as cur:
+                        # 삭제된 작업이면 갱신 대상 없음
+                        cur.execute("UPDATE jobs SET status = 'stopped', completed_at = CURRENT_TIMESTAMP WHERE job_id = %s AND status = 'stop_requested'", (job_id,))
+                    JOB_CONTROL.forget('job', job_id)
+                    if ch and method: ch.basic_ack(delivery_tag=method.delivery_tag)
+                    return
                 
                 # Check for zombie reset status (if job was reset to pending externally but we are still running?)
                 # Actually, if we are running, status should be 'running'.
@@ -202,35 +237,14 @@ class AddressCollector:
                     except:
                         pass
                 
-                # Update task-specific progress in JSONB
+                # Update task-specific progress in JSONB (JOB_PROGRESS_INTERVAL초에 한 번, 최신 값만)
                 task_progress = round(((i + 1) / days) * 100, 2)
-                with get_db_cursor() as cur:
-                    cur.execute("SELECT params FROM jobs WHERE job_id = %s FOR UPDATE", (job_id,))
-                    current_params = cur.fetchone()['params']
-                    
-                    if 'tasks' in current_params and task_key and task_key in current_params['tasks']:
-                        current_params['tasks'][task_key]['progress'] = task_progress
-                        all_tasks = current_params['tasks'].values()
-                        global_progress = sum(t['progress'] for t in all_tasks) / len(all_tasks)
-                        
-                        cur.execute(
-                            "UPDATE jobs SET progress = %s, params = %s, updated_at = CURRENT_TIMESTAMP, message = %s WHERE job_id = %s",
-                            (round(global_progress, 2), json.dumps(current_params), msg, job_id)
-                        )
-                    else:
-                        global_progress = task_progress
-                        cur.execute(
-                            "UPDATE jobs SET progress = %s, updated_at = CURRENT_TIMESTAMP, message = %s WHERE job_id = %s",
-                            (global_progress, msg, job_id)
-                        )
-                    
-                    # Also update Prometheus metric for unified tracking
-                    # We prefix Job ID with "J" to distinguish from Verification Job IDs
-                    BACKTEST_PROGRESS.labels(job_id=f"J{job_id}", stock_code=stock_code, job_type=job_type).set(global_progress)
+                progress_writer.update(task_progress, msg)
                 
                 time.sleep(1) # Be gentle
 
             # Finalize Task
+            progress_writer.flush()
             with get_db_cursor() as cur:
                 cur.execute("SELECT params FROM jobs WHERE job_id = %s FOR UPDATE", (job_id,))
                 current_params = cur.fetchone()['params']
@@ -444,6 +458,13 @@ class BodyCollector:
         except Exception as e:
             print(f"[!] Failed to load NewsSummarizer: {e}")
             self.summarizer = None
+        try:
+            from src.nlp.token_store import NewsTokenStore
+            # Tokenize once at collection time; learners/predictors read tb_news_content.keywords
+            self.token_store = NewsTokenStore()
+        except Exception as e:
+            print(f"[!] Failed to load NewsTokenStore: {e}")
+            self.token_store = None
 
     def extract_content(self, html):
         soup = BeautifulSoup(html, 'html.parser')
@@ -509,7 +530,7 @@ class BodyCollector:
             with get_db_cursor() as cur:
                 # 1. Check if content already exists (Light-weight re-scoring optimization)
                 cur.execute(
-                    "SELECT title, content, published_at FROM tb_news_content WHERE url_hash = %s",
+                    "SELECT title, content, published_at, keywords->>'v' AS token_version FROM tb_news_content WHERE url_hash = %s",
                     (url_hash,)
                 )
                 row = cur.fetchone()
@@ -520,6 +541,13 @@ class BodyCollector:
                     title = row['title']
                     content = row['content']
                     parsed_date = row['published_at']
+                    
+                    # Refresh stored tokens if missing or produced by an older tokenizer/dictionary
+                    if self.token_store and content and not self.token_store.is_current(row.get('token_version')):
+                        cur.execute(
+                            "UPDATE tb_news_content SET keywords = %s WHERE url_hash = %s",
+                            (json.dumps(self.token_store.encode(content), ensure_ascii=False), url_hash)
+                        )
                 else:
                     # Content missing: Crawl
                     random_sleep(1, 3) # Be gentle
@@ -585,15 +613,24 @@ class BodyCollector:
                         except Exception as sum_e:
                             print(f"[!] Summarization failed for {url_hash[:8]}: {sum_e}")
 
+                    # Pre-tokenize once (base 1-grams, n-grams are derived by readers)
+                    keywords = None
+                    if self.token_store and content:
+                        try:
+                            keywords = json.dumps(self.token_store.encode(content), ensure_ascii=False)
+                        except Exception as tok_e:
+                            print(f"[!] Tokenization failed for {url_hash[:8]}: {tok_e}")
+
                     cur.execute(
-                        """INSERT INTO tb_news_content (url_hash, title, content, published_at, extracted_content) 
-                           VALUES (%s, %s, %s, %s, %s)
+                        """INSERT INTO tb_news_content (url_hash, title, content, published_at, extracted_content, keywords) 
+                           VALUES (%s, %s, %s, %s, %s, %s)
                            ON CONFLICT (url_hash) DO UPDATE SET 
                            title = EXCLUDED.title, 
                            content = EXCLUDED.content, 
                            published_at = EXCLUDED.published_at,
-                           extracted_content = COALESCE(EXCLUDED.extracted_content, tb_news_content.extracted_content)""",
-                        (url_hash, title, content, parsed_date, extracted_content)
+                           extracted_content = COALESCE(EXCLUDED.extracted_content, tb_news_content.extracted_content),
+                           keywords = EXCLUDED.keywords""",
+                        (url_hash, title, content, parsed_date, extracted_content, keywords)
                     )
 
                 # 2. Mapping & Relevance Scoring (Common for both new/existing content)
@@ -752,7 +789,10 @@ class JobManager:
                 "UPDATE jobs SET status = 'stop_requested' WHERE job_id = %s AND status = 'running'",
                 (job_id,)
             )
-            return cur.rowcount > 0
+            if cur.rowcount > 0:
+                notify_job_stop(cur, 'job', job_id)  # 실행 중인 collector에 즉시 전달 (commit 시점)
+                return True
+            return False
 
     def create_gap_backfill_jobs(self, stock_code):
         # 1. Find the date bounds
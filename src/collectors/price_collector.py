@@ -2,6 +2,7 @@
 import pandas as pd
 from pykrx import stock
 from src.db.connection import get_db_cursor
+from src.utils.calendar import Calendar
 from datetime import datetime, timedelta
 import time
 import logging
@@ -112,6 +113,9 @@ class PriceCollector:
                 rows_updated = cur.rowcount
                 logger.info(f"Settled {rows_updated} predictions for {stock_code} on {target_date}")
 
+            # 새 거래일이 생겼으므로 이 프로세스의 거래일 인덱스 갱신
+            Calendar.invalidate(stock_code)
+
         except Exception as e:
             logger.error(f"Error in PriceCollector for {stock_code}: {e}")
 
@@ -3,6 +3,7 @@ from fastapi import APIRouter, Request, Form
 from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
 from src.utils.docker_control import restart_all_workers, get_container_logs, restart_container
 from src.db.connection import get_db_cursor
+from src.utils.job_control import notify_job_stop
 from src.dashboard.data_helpers import (
     get_jobs_data, get_stock_stats_data, get_overall_stats, get_chart_data,
     get_collection_metrics, get_active_workers_list, get_system_health, get_system_events
@@ -167,6 +168,7 @@ async def delete_job(request: Request, job_id: int):
                  except: pass
         
         cur.execute("DELETE FROM jobs WHERE job_id = %s", (job_id,))
+        notify_job_stop(cur, 'job', job_id)  # 실행 중이던 collector도 중단
     
     if "HX-Request" in request.headers:
         return HTMLResponse(content="")
@@ -318,6 +320,7 @@ async def delete_finished_jobs(request: Request):
 async def delete_job_api(request: Request, job_id: int):
     with get_db_cursor() as cur:
         cur.execute("DELETE FROM jobs WHERE job_id = %s", (job_id,))
+        notify_job_stop(cur, 'job', job_id)
     return HTMLResponse(content="")
 
 @router.delete("/errors/all")
@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Request, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
 from src.db.connection import get_db_cursor
+from src.utils.job_control import notify_job_stop
 from src.dashboard.data_helpers import (
     get_validation_summary, get_validation_history, get_latest_version_dict,
     get_performance_chart_data, get_timeline_dict, get_news_pulse_data,
@@ -605,6 +606,7 @@ async def stop_backtest_job(request: Request, v_job_id: int):
     """실행 중인 백테스트 작업 중단 (Status -> stopped)"""
     with get_db_cursor() as cur:
         cur.execute("UPDATE tb_verification_jobs SET status = 'stopped' WHERE v_job_id = %s", (v_job_id,))
+        notify_job_stop(cur, 'verification', v_job_id)
     # Update row UI
     return await get_backtest_row(request, v_job_id)
 
@@ -632,6 +634,7 @@ async def delete_backtest_job(request: Request, v_job_id: int):
         cur.execute("DELETE FROM tb_awo_checkpoints WHERE v_job_id = %s", (v_job_id,))
         # 3. Delete the job itself
         cur.execute("DELETE FROM tb_verification_jobs WHERE v_job_id = %s", (v_job_id,))
+        notify_job_stop(cur, 'verification', v_job_id)  # 실행 중이던 워커도 중단
         
     return HTMLResponse(content="")
 
@@ -1,6 +1,10 @@
 # src/db/connection.py
 import os
+import time
+import threading
+import weakref
 import psycopg2
+from psycopg2 import pool as pg_pool
 from psycopg2.extras import RealDictCursor
 from contextlib import contextmanager
 from dotenv import load_dotenv
@@ -13,19 +17,198 @@ DB_NAME = os.getenv("DB_NAME", "nsentitrader")
 DB_USER = os.getenv("DB_USER", "myuser")
 DB_PASS = os.getenv("DB_PASS", "mypassword")
 
-@contextmanager
-def get_db_connection():
-    conn = psycopg2.connect(
+# Connection Pool Settings (process-local)
+DB_POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "true").lower() in ("1", "true", "yes")
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # Max seconds to wait for a free connection
+DB_POOL_HEALTHCHECK_IDLE = float(os.getenv("DB_POOL_HEALTHCHECK_IDLE", "30"))  # Ping connections idle longer than this
+
+
+def _connect():
+    return psycopg2.connect(
         host=DB_HOST,
         port=DB_PORT,
         database=DB_NAME,
         user=DB_USER,
         password=DB_PASS
     )
+
+
+class ConnectionPool:
+    """
+    Blocking, health-checked wrapper around psycopg2's ThreadedConnectionPool.
+
+    - Callers wait (up to `timeout`) for a free slot instead of getting PoolError.
+    - Connections idle longer than `healthcheck_idle` are pinged before reuse;
+      broken connections are discarded and replaced transparently.
+    - The pool is bound to the PID that created it. A forked child (AWO
+      ProcessPoolExecutor, verification multiprocessing.Process) never touches
+      the parent's sockets; `get_pool()` builds a fresh pool in the child.
+    """
+
+    def __init__(self, minconn=DB_POOL_MIN, maxconn=DB_POOL_MAX, timeout=DB_POOL_TIMEOUT,
+                 healthcheck_idle=DB_POOL_HEALTHCHECK_IDLE):
+        self.minconn = max(0, min(minconn, maxconn))
+        self.maxconn = max(1, maxconn)
+        self.timeout = timeout
+        self.healthcheck_idle = healthcheck_idle
+        self.pid = os.getpid()
+        self._pool = pg_pool.ThreadedConnectionPool(self.minconn, self.maxconn, host=DB_HOST, port=DB_PORT,
+                                                    database=DB_NAME, user=DB_USER, password=DB_PASS)
+        self._slots = threading.BoundedSemaphore(self.maxconn)
+        # conn -> monotonic time of last return. Keyed by the connection itself: id() values are
+        # reused once a closed connection is freed, so a new connection could inherit a stale time
+        self._last_used = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._in_use = 0
+
+    def _is_healthy(self, conn):
+        if conn.closed:
+            return False
+        last_used = self._last_used.get(conn)
+        if last_used is not None and (time.monotonic() - last_used) < self.healthcheck_idle:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def getconn(self):
+        from src.utils.metrics import DB_POOL_WAIT_SECONDS, DB_POOL_CHECKOUT_ERRORS_TOTAL
+
+        wait_start = time.monotonic()
+        if not self._slots.acquire(timeout=self.timeout):
+            DB_POOL_CHECKOUT_ERRORS_TOTAL.labels(reason='timeout').inc()
+            raise pg_pool.PoolError(f"Timed out after {self.timeout}s waiting for a DB connection (max={self.maxconn})")
+
+        try:
+            # DB 재시작 후에는 유휴 연결 여러 개가 한꺼번에 끊겨 있으므로 정상 연결이 나올 때까지 폐기
+            while True:
+                fresh = not self._pool._pool  # 유휴 연결이 없으면 getconn()이 새로 연결
+                conn = self._pool.getconn()
+                if fresh or self._is_healthy(conn):
+                    break
+                DB_POOL_CHECKOUT_ERRORS_TOTAL.labels(reason='unhealthy').inc()
+                self._last_used.pop(conn, None)
+                self._pool.putconn(conn, close=True)
+        except Exception:
+            self._slots.release()
+            raise
+
+        DB_POOL_WAIT_SECONDS.observe(time.monotonic() - wait_start)
+        with self._lock:
+            self._in_use += 1
+            self._update_gauges()
+        return conn
+
+    def putconn(self, conn, close=False):
+        close = close or conn.closed or conn.get_transaction_status() == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN
+        try:
+            if close:
+                self._last_used.pop(conn, None)
+            else:
+                self._last_used[conn] = time.monotonic()
+            self._pool.putconn(conn, close=close)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+                self._update_gauges()
+            self._slots.release()
+
+    def closeall(self):
+        self._pool.closeall()
+        self._last_used.clear()
+
+    def _update_gauges(self):
+        try:
+            from src.utils.metrics import DB_POOL_CONNECTIONS
+            DB_POOL_CONNECTIONS.labels(state='in_use').set(self._in_use)
+            DB_POOL_CONNECTIONS.labels(state='idle').set(len(self._pool._pool))
+        except Exception:
+            pass
+
+
+_pool = None
+_pool_lock = threading.Lock()
+_inherited_pools = []  # Parent pools seen after fork; kept alive so GC never closes the parent's sockets
+
+
+def get_pool():
+    """Returns the process-local pool, creating it lazily (and again after fork)."""
+    global _pool
+    if _pool is not None and _pool.pid == os.getpid():
+        return _pool
+    with _pool_lock:
+        if _pool is None or _pool.pid != os.getpid():
+            # Inherited pool from the parent: never close it here, closing (or letting GC
+            # deallocate) would send a Terminate message over the parent's sockets.
+            if _pool is not None:
+                _inherited_pools.append(_pool)
+            _pool = ConnectionPool()
+    return _pool
+
+
+def close_pool():
+    """Closes all pooled connections of the current process (e.g. on shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            if _pool.pid == os.getpid():
+                _pool.closeall()
+            else:
+                _inherited_pools.append(_pool)
+        _pool = None
+
+
+def _reset_pool_after_fork():
+    global _pool, _pool_lock
+    if _pool is not None:
+        _inherited_pools.append(_pool)
+    _pool = None
+    _pool_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
+
+@contextmanager
+def get_db_connection():
+    if not DB_POOL_ENABLED:
+        conn = _connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+
+    from src.utils.metrics import DB_POOL_CHECKOUT_SECONDS
+
+    pool = get_pool()
+    conn = pool.getconn()
+    checkout_start = time.monotonic()
+    broken = False
     try:
         yield conn
+    except (psycopg2.OperationalError, psycopg2.InterfaceError):
+        broken = True
+        raise
     finally:
-        conn.close()
+        # Uncommitted work is discarded, same as the old close()-per-call behaviour
+        if not broken and not conn.closed:
+            try:
+                conn.rollback()
+                if conn.autocommit:
+                    conn.autocommit = False
+            except Exception:
+                broken = True
+        DB_POOL_CHECKOUT_SECONDS.observe(time.monotonic() - checkout_start)
+        pool.putconn(conn, close=broken)
+
 
 @contextmanager
 def get_db_cursor():
@@ -0,0 +1,13 @@
+-- 학습 모델 바이너리 artifact: 사전 행(tb_sentiment_dict)을 단어별로 읽지 않고 한 번에 로드
+-- (형식: src/learner/model_artifact.py)
+
+CREATE TABLE IF NOT EXISTS public.tb_model_artifact (
+    stock_code VARCHAR(10),
+    version VARCHAR(20),
+    source VARCHAR(20),
+    format_version INT NOT NULL,
+    payload BYTEA NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (stock_code, version, source),
+    FOREIGN KEY (stock_code, version, source) REFERENCES tb_sentiment_dict_meta(stock_code, version, source) ON DELETE CASCADE
+);
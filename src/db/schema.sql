@@ -37,7 +37,7 @@ CREATE TABLE IF NOT EXISTS tb_news_content (
     title TEXT,
     content TEXT,
     published_at TIMESTAMP,
-    keywords JSONB, -- 전처리된 키워드 리스트
+    keywords JSONB, -- 전처리된 토큰 {"v": tokenizer fingerprint, "t": "공백 구분 1-gram 토큰"}
     FOREIGN KEY (url_hash) REFERENCES tb_news_url(url_hash)
 );
 
@@ -133,6 +133,18 @@ CREATE TABLE IF NOT EXISTS tb_sentiment_dict_meta (
     FOREIGN KEY (stock_code) REFERENCES tb_stock_master(stock_code)
 );
 
+-- 11-1. 학습 모델 바이너리 artifact (src/learner/model_artifact.py, 메타 1행당 1개)
+CREATE TABLE IF NOT EXISTS tb_model_artifact (
+    stock_code VARCHAR(10),
+    version VARCHAR(20),
+    source VARCHAR(20),
+    format_version INT NOT NULL,
+    payload BYTEA NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (stock_code, version, source),
+    FOREIGN KEY (stock_code, version, source) REFERENCES tb_sentiment_dict_meta(stock_code, version, source) ON DELETE CASCADE
+);
+
 -- 12. 시스템 검증(Backtest) 작업 관리
 CREATE TABLE IF NOT EXISTS tb_verification_jobs (
     v_job_id SERIAL PRIMARY KEY,
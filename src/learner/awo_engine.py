@@ -3,21 +3,34 @@ import polars as pl
 import numpy as np
 import os
 import gc
+import multiprocessing
 from datetime import datetime, timedelta
 from concurrent.futures import ProcessPoolExecutor
 from src.learner.validator import WalkForwardValidator
 from src.db.connection import get_db_cursor
+from src.learner.shared_corpus import SharedNewsCorpus
+from src.utils.job_control import JOB_CONTROL, ProgressThrottle
 import json
 
 logger = logging.getLogger(__name__)
 
+# Workers attach to one shared corpus instead of fetching/tokenizing on their own,
+# so the per-worker footprint is only the window slice + model state.
+# The design matrix is float32 CSC by default (LASSO_DTYPE), roughly halving each
+# worker's training peak, hence the higher cap than the former 6.
+AWO_MAX_WORKERS = int(os.getenv("AWO_MAX_WORKERS", "10"))
+# Plain walk-forward runs (WF_CHECK, scripts) split retrain segments across processes
+# instead; that pool is capped by VALIDATION_SEGMENT_MAX_WORKERS (validator.py, default 3)
+# because each segment worker loads a full learner. AWO windows run their segments
+# sequentially (segment_workers=1), so the two caps never multiply.
+
 def _run_window_iteration_worker(args):
     """
     Worker function for parallel AWO window scan.
     """
     (stock_code, use_sector_beta, model_type, w, alphas, 
      start_date, end_date, validation_months, v_job_id, 
-     min_relevance, window_idx, total_windows) = args
+     min_relevance, window_idx, total_windows, corpus_path) = args
     
     # Separate import to avoid circular dependency in workers
     from src.learner.awo_engine import AWOEngine
@@ -25,7 +38,7 @@ def _run_window_iteration_worker(args):
         engine = AWOEngine(stock_code, use_sector_beta=use_sector_beta, model_type=model_type)
         return engine._run_single_window(
             w, alphas, start_date, end_date, validation_months, v_job_id, 
-            min_relevance, window_idx, total_windows
+            min_relevance, window_idx, total_windows, corpus_path=corpus_path
         )
     except Exception as e:
         logger.error(f"Worker Error for window {w}m: {e}", exc_info=True)
@@ -38,22 +51,41 @@ class AWOEngine:
         self.model_type = model_type  # 'tfidf' or 'hybrid'
         self.validator = WalkForwardValidator(stock_code, use_sector_beta=use_sector_beta, model_type=model_type)
 
-    def _save_checkpoint(self, v_job_id, window_months, alpha, hit_rate, mae):
-        """각 윈도우/알파 조합 완료 후 체크포인트 저장 (Job 실패해도 복구 가능)"""
+    def _save_checkpoints(self, v_job_id, window_months, metrics):
+        """
+        윈도우의 alpha 스윕 완료 후 체크포인트를 한 번에 저장 (Job 실패해도 복구 가능)
+        metrics: {alpha: (hit_rate, mae)}
+        """
+        if not metrics:
+            return
+        from psycopg2.extras import execute_values
         try:
             with get_db_cursor() as cur:
-                cur.execute("""
+                execute_values(cur, """
                     INSERT INTO tb_awo_checkpoints 
                     (v_job_id, stock_code, window_months, alpha, hit_rate, mae)
-                    VALUES (%s, %s, %s, %s, %s, %s)
+                    VALUES %s
                     ON CONFLICT (v_job_id, window_months, alpha) 
                     DO UPDATE SET hit_rate = EXCLUDED.hit_rate, mae = EXCLUDED.mae, 
                                   created_at = CURRENT_TIMESTAMP
-                """, (v_job_id, self.stock_code, window_months, alpha, hit_rate, mae))
-            logger.info(f"  [Checkpoint] Saved: {window_months}m, alpha={alpha}")
+                """, [(v_job_id, self.stock_code, window_months, a, hr, mae) for a, (hr, mae) in metrics.items()])
+            logger.info(f"  [Checkpoint] Saved: {window_months}m, alphas={list(metrics)}")
         except Exception as e:
             logger.warning(f"  [Checkpoint] Failed to save: {e}")
 
+    def _load_checkpoints(self, v_job_id, window_months):
+        """{alpha 키: checkpoint row} - 윈도우의 완료된 alpha를 한 번에 조회 (키는 _alpha_key, 컬럼 정밀도 차이 흡수)"""
+        with get_db_cursor() as cur:
+            cur.execute("""
+                SELECT alpha, hit_rate, mae FROM tb_awo_checkpoints 
+                WHERE v_job_id = %s AND window_months = %s
+            """, (v_job_id, window_months))
+            return {self._alpha_key(row['alpha']): row for row in cur.fetchall()}
+
+    @staticmethod
+    def _alpha_key(alpha):
+        return f"{float(alpha):.6g}"
+
     def run_exhaustive_scan(self, validation_months=1, v_job_id=None):
         """
         2차원 그리드 서치 (Window x Alpha) 및 안정성 평가 (Stability Score)
@@ -84,6 +116,7 @@ class AWOEngine:
                     "UPDATE tb_verification_jobs SET status = 'running', started_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP WHERE v_job_id = %s",
                     (v_job_id,)
                 )
+            JOB_CONTROL.forget('verification', v_job_id)  # 재개된 작업: 이전 실행의 중단 플래그 제거
         
         min_relevance = 0
         if v_job_id:
@@ -96,13 +129,25 @@ class AWOEngine:
                         params = json.loads(params)
                     min_relevance = params.get('min_relevance', 0)
 
+        corpus = None
         try:
             total_windows = len(windows)
             
+            # --- Shared Corpus: 가장 넓은 윈도우를 한 번만 조회/토큰화 ---
+            # 모든 윈도우의 뉴스 구간은 최대 윈도우 구간의 부분집합이므로 Worker는 자기 구간만 잘라 사용
+            widest_start = start_date - timedelta(days=max(windows) * 30 + self.validator.learner.lags + 2)
+            logger.info(f"[*] Building shared news corpus for {self.stock_code}: {widest_start} ~ {end_date}")
+            df_corpus = self._fetch_tokenized_news(widest_start, end_date, min_relevance)
+            prices = self.validator.fetch_actual_prices(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+            corpus = SharedNewsCorpus.build(df_corpus, prices=prices)
+            logger.info(f"    Corpus: {corpus.n_docs} docs, {len(corpus.token_ids)} tokens, {len(corpus.vocab_offsets) - 1} vocab ({corpus.path})")
+            del df_corpus
+            gc.collect()
+            
             # --- [PARALLEL_OPT] Phase 10: Multiprocessing on Windows ---
             # Using ProcessPoolExecutor to distribute windows across cores
-            # We limit to 3 workers to stay within 12GB OrbStack RAM limits (1-2GB per worker)
-            max_workers = min(os.cpu_count() or 4, 3) 
+            # RAM cap is set by AWO_MAX_WORKERS (workers share the corpus pages, ~0.3-0.5GB each with float32 designs)
+            max_workers = min(os.cpu_count() or 4, AWO_MAX_WORKERS, total_windows)
             logger.info(f"[*] Starting parallel AWO scan for {self.stock_code} (Workers: {max_workers})")
             
             worker_args = []
@@ -110,10 +155,11 @@ class AWOEngine:
                 worker_args.append((
                     self.stock_code, self.use_sector_beta, self.model_type,
                     w, alphas, start_date, end_date, validation_months,
-                    v_job_id, min_relevance, i, total_windows
+                    v_job_id, min_relevance, i, total_windows, corpus.path
                 ))
             
-            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # spawn: 부모가 corpus 생성에 polars를 사용한 뒤 fork하면 자식의 polars 스레드 풀이 없어 멈춤
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
                 # Using map to collect results in order (though we iterate by w later)
                 worker_results = list(executor.map(_run_window_iteration_worker, worker_args))
             
@@ -244,20 +290,17 @@ class AWOEngine:
                     (str(e), v_job_id)
                 )
             raise e
+        finally:
+            if corpus is not None:
+                corpus.cleanup()
 
-    def _run_single_window(self, w, alphas, start_date, end_date, validation_months, v_job_id, min_relevance, window_idx, total_windows):
-        """
-        [Worker Method] Runs all alphas for a single window.
-        """
-        window_results = {}
-        train_days = w * 30
-        lookback_start = (start_date - timedelta(days=train_days + self.validator.learner.lags + 2))
-        
-        logger.info(f"  [Worker Window {w}m] Fetching news (Index: {window_idx}/{total_windows})")
-        
+    def _fetch_tokenized_news(self, lookback_start, end_date, min_relevance):
+        """관련 뉴스를 조회하여 'tokens' 컬럼이 포함된 DataFrame으로 반환합니다."""
+        learner = self.validator.learner
         with get_db_cursor() as cur:
             cur.execute("""
-                SELECT c.published_at::date as date, c.content, c.extracted_content, c.url_hash
+                SELECT c.published_at::date as date, c.content, c.extracted_content, c.url_hash,
+                       c.keywords->>'v' AS token_version, c.keywords->>'t' AS stored_tokens
                 FROM tb_news_content c
                 JOIN tb_news_mapping m ON c.url_hash = m.url_hash
                 WHERE m.stock_code = %s 
@@ -267,7 +310,7 @@ class AWOEngine:
             """, (self.stock_code, lookback_start, end_date, min_relevance))
             all_news_raw = cur.fetchall()
             
-            if self.validator.learner.use_summary and all_news_raw:
+            if learner.use_summary and all_news_raw:
                 from src.nlp.summarizer import NewsSummarizer
                 NewsSummarizer.bulk_ensure_summaries(all_news_raw)
             
@@ -278,102 +321,118 @@ class AWOEngine:
         del all_news_raw # Immediate cleanup
         
         # [Hybrid v2] Content Selector
-        if self.validator.learner.use_summary and "extracted_content" in df_all_news.columns:
+        if learner.use_summary and "extracted_content" in df_all_news.columns:
             df_all_news = df_all_news.with_columns(
                 pl.coalesce(pl.col("extracted_content"), pl.col("content")).alias("final_content")
             )
         else:
             df_all_news = df_all_news.with_columns(pl.col("content").alias("final_content"))
         
-        if not df_all_news.is_empty():
-            # In worker process, cache is fresh anyway.
-            from src.learner.lasso import TOKEN_CACHE as LOCAL_TOKEN_CACHE
-            LOCAL_TOKEN_CACHE.clear()
-            
-            def get_cached_tokens(content):
-                if content in LOCAL_TOKEN_CACHE:
-                    return LOCAL_TOKEN_CACHE[content]
-                t = self.validator.learner.tokenizer.tokenize(content, n_gram=self.validator.learner.n_gram)
-                if len(LOCAL_TOKEN_CACHE) < 10000:
-                    LOCAL_TOKEN_CACHE[content] = t
-                return t
-            
-            df_all_news = df_all_news.with_columns(
-                pl.col("final_content").map_elements(get_cached_tokens, return_dtype=pl.List(pl.String)).alias("tokens")
-            )
+        from src.learner.lasso import TOKEN_CACHE as LOCAL_TOKEN_CACHE
+        return learner.token_store.add_tokens_column(
+            df_all_news, n_gram=learner.n_gram, content_col="final_content",
+            use_stored=not learner.use_summary, cache=LOCAL_TOKEN_CACHE, cache_limit=10000
+        )
 
-        total_alphas = len(alphas)
-        for a_idx, a in enumerate(alphas):
+    def _run_single_window(self, w, alphas, start_date, end_date, validation_months, v_job_id, min_relevance, window_idx, total_windows, corpus_path=None):
+        """
+        [Worker Method] Runs all alphas for a single window.
+        corpus_path: 부모 프로세스가 만든 SharedNewsCorpus 경로 (없으면 직접 조회/토큰화)
+        """
+        window_results = {}
+        train_days = w * 30
+        lookback_start = (start_date - timedelta(days=train_days + self.validator.learner.lags + 2))
+        prefetched_prices = None
+        
+        if corpus_path:
+            logger.info(f"  [Worker Window {w}m] Attaching shared corpus (Index: {window_idx}/{total_windows})")
+            corpus = SharedNewsCorpus.attach(corpus_path)
+            df_all_news = corpus.to_polars(lookback_start, end_date)
+            prefetched_prices = corpus.prices()
+            del corpus
+        else:
+            logger.info(f"  [Worker Window {w}m] Fetching news (Index: {window_idx}/{total_windows})")
+            df_all_news = self._fetch_tokenized_news(lookback_start, end_date, min_relevance)
+
+        # Resume Check: 체크포인트가 있는 alpha는 건너뜀
+        pending_alphas = []
+        checkpoints = self._load_checkpoints(v_job_id, w)
+        for a in alphas:
             key_str = f"{w}m_{a}_scan"
-            
-            # Resume Check
-            with get_db_cursor() as cur:
-                cur.execute("""
-                    SELECT hit_rate, mae FROM tb_awo_checkpoints 
-                    WHERE v_job_id = %s AND window_months = %s AND alpha = %s
-                """, (v_job_id, w, a))
-                checkpoint = cur.fetchone()
-                if checkpoint:
-                    window_results[a] = {
-                        "hit_rate": float(checkpoint['hit_rate']),
-                        "mae": float(checkpoint['mae']),
-                        "raw_results": []
-                    }
-                    logger.info(f"Skipping completed iteration: {key_str} [Checkpoint]")
-                    continue
+            checkpoint = checkpoints.get(self._alpha_key(a))
+            if checkpoint:
+                window_results[a] = {
+                    "hit_rate": float(checkpoint['hit_rate']),
+                    "mae": float(checkpoint['mae']),
+                    "raw_results": []
+                }
+                logger.info(f"Skipping completed iteration: {key_str} [Checkpoint]")
+            else:
+                pending_alphas.append(a)
 
+        if pending_alphas:
             # Stop Signal Check
             if self._is_stopped(v_job_id):
-                return window_results, "stopped"
+                return w, window_results, "stopped"
 
-            logger.info(f"  [Worker Window {w}m] Alpha={a} ({a_idx+1}/{total_alphas})")
+            logger.info(f"  [Worker Window {w}m] Alpha Path {pending_alphas} (single sweep)")
             
-            # Progress Callback
-            def update_progress(inner_p):
-                # Calculate progress relative to the whole job
-                # Window contribution: 1/total_windows
-                # Alpha contribution inside window: 1/total_alphas
-                current_alpha_base = (window_idx / total_windows) + (a_idx / (total_windows * total_alphas))
-                total_progress = (current_alpha_base + (inner_p / (total_windows * total_alphas))) * 100
-                
-                # DB Update - Use GREATEST to prevent race condition where parallel workers overwrite each other
-                # This ensures progress only ever increases
+            # DB Update - Use GREATEST to prevent race condition where parallel workers overwrite each other
+            # This ensures progress only ever increases
+            def write_progress(total_progress):
                 with get_db_cursor() as cur:
                     cur.execute(
                         "UPDATE tb_verification_jobs SET progress = GREATEST(progress, %s), updated_at = CURRENT_TIMESTAMP WHERE v_job_id = %s",
                         (total_progress, v_job_id)
                     )
+
+            # 매일 호출되는 콜백 -> 최신 값만 JOB_PROGRESS_INTERVAL초에 한 번 기록
+            progress_writer = ProgressThrottle(write_progress)
+
+            # Progress Callback
+            def update_progress(inner_p):
+                # Calculate progress relative to the whole job
+                # Window contribution: 1/total_windows (all alphas are evaluated in one sweep)
+                total_progress = ((window_idx + inner_p) / total_windows) * 100
+                progress_writer.update(total_progress)
                 # Metrics (Prometheus) - usually safe and no-op if fails
                 try:
                     from src.utils.metrics import BACKTEST_PROGRESS
                     BACKTEST_PROGRESS.labels(job_id=str(v_job_id), stock_code=self.stock_code).set(total_progress)
                 except: pass
 
-            # Run Validation
-            res = self.validator.run_validation(
-                start_date.strftime('%Y-%m-%d'),
-                end_date.strftime('%Y-%m-%d'),
-                train_days=train_days,
-                dry_run=False,
-                progress_callback=update_progress,
-                v_job_id=v_job_id,
-                prefetched_df_news=df_all_news,
-                alpha=a,
-                used_version_tag=key_str,
-                retrain_frequency='weekly'
-            )
+            # Run Validation: 재학습 시점마다 피처 1회 생성 + alpha 내림차순 warm start 학습
+            try:
+                path_res = self.validator.run_validation_path(
+                    start_date.strftime('%Y-%m-%d'),
+                    end_date.strftime('%Y-%m-%d'),
+                    pending_alphas,
+                    {a: f"{w}m_{a}_scan" for a in pending_alphas},
+                    train_days=train_days,
+                    dry_run=False,
+                    progress_callback=update_progress,
+                    v_job_id=v_job_id,
+                    prefetched_df_news=df_all_news,
+                    retrain_frequency='weekly',
+                    prefetched_prices=prefetched_prices,
+                    segment_workers=1 # 윈도우 단위로 이미 병렬 실행 중
+                )
+            finally:
+                progress_writer.flush()
             
-            if res.get('status') == 'stopped':
-                return window_results, "stopped"
+            if any(res.get('status') == 'stopped' for res in path_res.values()):
+                return w, window_results, "stopped"
 
-            window_results[a] = {
-                "hit_rate": res['hit_rate'],
-                "mae": res['mae'],
-                "raw_results": res['results']
-            }
-            
-            # Save Checkpoint
-            self._save_checkpoint(v_job_id, w, a, res['hit_rate'], res['mae'])
+            for a in pending_alphas:
+                res = path_res[a]
+                window_results[a] = {
+                    "hit_rate": res['hit_rate'],
+                    "mae": res['mae'],
+                    "raw_results": res['results']
+                }
+                
+            # Save Checkpoints (윈도우의 모든 alpha를 한 번에)
+            self._save_checkpoints(v_job_id, w, {a: (path_res[a]['hit_rate'], path_res[a]['mae']) for a in pending_alphas})
             gc.collect()
 
         del df_all_news
@@ -414,7 +473,8 @@ class AWOEngine:
                 start_date.strftime('%Y-%m-%d'),
                 end_date.strftime('%Y-%m-%d'),
                 version=version,
-                source='Main'
+                source='Main',
+                persist=True # 승격 모델은 백테스트 registry 모드와 무관하게 항상 DB 저장
             )
             
             with get_db_cursor() as cur:
@@ -451,24 +511,21 @@ class AWOEngine:
             return {"status": "failed", "error": str(e), "timestamp": datetime.now().isoformat()}
 
     def save_scan_results(self, v_job_id, window_months, results):
-        """윈도우별 검증 상세 결과를 tb_verification_results 에 기록"""
+        """윈도우별 검증 상세 결과를 tb_verification_results 에 기록 (INSERT 한 번)"""
+        if not results:
+            return
+        from psycopg2.extras import execute_values
+        rows = [(v_job_id, r['date'], r['sentiment_score'], r['actual_alpha'], r['is_correct'], f"{window_months}m_scan") for r in results]
         with get_db_cursor() as cur:
-            for r in results:
-                cur.execute("""
-                    INSERT INTO tb_verification_results 
-                    (v_job_id, target_date, predicted_score, actual_alpha, is_correct, used_version)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """, (v_job_id, r['date'], r['sentiment_score'], r['actual_alpha'], r['is_correct'], f"{window_months}m_scan"))
+            execute_values(cur, """
+                INSERT INTO tb_verification_results 
+                (v_job_id, target_date, predicted_score, actual_alpha, is_correct, used_version)
+                VALUES %s
+            """, rows, page_size=len(rows))
     def _is_stopped(self, v_job_id):
         """작업이 중단 상태이거나 삭제되었는지 확인"""
-        if v_job_id is None:
-            return False
-        with get_db_cursor() as cur:
-            cur.execute("SELECT status FROM tb_verification_jobs WHERE v_job_id = %s", (v_job_id,))
-            row = cur.fetchone()
-            if not row:
-                return True # Missing job is treated as stopped
-            return row['status'] == 'stopped'
+        # LISTEN 신호로 갱신되는 플래그 (삭제된 작업도 중단으로 취급)
+        return JOB_CONTROL.is_stopped('verification', v_job_id)
 if __name__ == "__main__":
     import sys
     logging.basicConfig(level=logging.INFO)
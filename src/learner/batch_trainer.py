@@ -0,0 +1,233 @@
+# src/learner/batch_trainer.py
+"""
+Multi-stock nightly retraining from one shared, tokenized news corpus.
+
+An article is often mapped to several stocks in tb_news_mapping. Training every
+active target on its own (AnalysisManager.run_daily_update per job) refetches and
+retokenizes the same article once per stock. BatchTrainer instead:
+
+1. loads the Golden Params of all requested active daily_targets,
+2. fetches the union of their relevant news once (one row per article, with the
+   list of targets it is mapped to) and tokenizes each article once,
+3. writes a SharedNewsCorpus with one document group per stock, and
+4. runs each stock's Main/Buffer retrain in a worker process that attaches the
+   corpus and reads only its own group (AnalysisManager.run_daily_update with
+   prefetched_df_news).
+
+Summary-based targets (model_type='hybrid_v2') tokenize a different text, so
+they get their own corpus.
+"""
+import os
+import gc
+import json
+import time
+import logging
+import multiprocessing
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+import polars as pl
+from src.db.connection import get_db_cursor
+from src.learner.shared_corpus import SharedNewsCorpus
+
+logger = logging.getLogger(__name__)
+
+# 종목별 재학습 Worker 수 상한 (Worker는 corpus 페이지를 공유하므로 종목별 모델 상태만 추가됨)
+BATCH_TRAIN_MAX_WORKERS = int(os.getenv("BATCH_TRAIN_MAX_WORKERS", "4"))
+BUFFER_DAYS = 7
+
+
+def _train_target_worker(args):
+    """Worker: shared corpus에서 자기 종목 문서만 읽어 Main/Buffer 재학습"""
+    target, corpus_path, news_start, end_date = args
+    stock_code = target['stock_code']
+    from src.learner.manager import AnalysisManager
+    try:
+        started = time.perf_counter()
+        corpus = SharedNewsCorpus.attach(corpus_path)
+        df_news = corpus.to_polars(news_start, end_date, group=stock_code)
+        del corpus
+        AnalysisManager(stock_code).run_daily_update(target=target, prefetched_df_news=df_news)
+        return stock_code, time.perf_counter() - started, None
+    except Exception as e:
+        logger.error(f"Batch training failed for {stock_code}: {e}", exc_info=True)
+        return stock_code, 0.0, str(e)
+
+
+class BatchTrainer:
+    def __init__(self, stock_codes=None, max_workers=None, min_relevance=0):
+        """stock_codes: 학습할 종목 (None이면 daily_targets의 모든 active 종목)"""
+        self.stock_codes = list(stock_codes) if stock_codes else None
+        self.max_workers = max_workers or BATCH_TRAIN_MAX_WORKERS
+        self.min_relevance = min_relevance
+        self.stats = {}
+
+    def load_targets(self):
+        with get_db_cursor() as cur:
+            if self.stock_codes:
+                cur.execute("""
+                    SELECT stock_code, optimal_lag, optimal_window_months, optimal_alpha, model_type
+                    FROM daily_targets WHERE status = 'active' AND stock_code = ANY(%s)
+                    ORDER BY stock_code
+                """, (self.stock_codes,))
+            else:
+                cur.execute("""
+                    SELECT stock_code, optimal_lag, optimal_window_months, optimal_alpha, model_type
+                    FROM daily_targets WHERE status = 'active'
+                    ORDER BY stock_code
+                """)
+            return [dict(r) for r in cur.fetchall()]
+
+    @staticmethod
+    def news_start(target, end_date, default_lags=5):
+        """run_daily_update가 학습하는 가장 이른 구간의 뉴스 시작일 (fetch_data와 같은 lag 여유 포함)"""
+        if target.get('optimal_window_months'):
+            start = end_date - timedelta(days=int(target['optimal_window_months']) * 30)
+            lags = int(target.get('optimal_lag') or default_lags)
+        else:
+            start = end_date - timedelta(days=BUFFER_DAYS)
+            lags = default_lags
+        return start - timedelta(days=max(lags, default_lags) + 2)
+
+    @staticmethod
+    def uses_summary(target):
+        return target.get('model_type') == 'hybrid_v2'
+
+    def fetch_union_news(self, stock_codes, news_start, end_date):
+        """대상 종목들의 관련 뉴스를 기사당 1행으로 조회 ('stock_codes' = 기사가 매핑된 대상 종목)"""
+        with get_db_cursor() as cur:
+            cur.execute("""
+                SELECT c.url_hash, c.published_at::date as date, c.content, c.extracted_content,
+                       c.keywords->>'v' AS token_version, c.keywords->>'t' AS stored_tokens,
+                       array_agg(m.stock_code ORDER BY m.stock_code) AS stock_codes
+                FROM tb_news_content c
+                JOIN tb_news_mapping m ON c.url_hash = m.url_hash
+                WHERE m.stock_code = ANY(%s)
+                AND c.published_at::date BETWEEN %s AND %s
+                AND m.is_relevant = TRUE
+                AND m.relevance_score >= %s
+                GROUP BY c.url_hash
+            """, (list(stock_codes), news_start, end_date, self.min_relevance))
+            return cur.fetchall()
+
+    def build_corpus(self, rows, use_summary):
+        """기사 행 -> 기사당 1회 토큰화 -> 종목별 문서 그룹을 가진 SharedNewsCorpus"""
+        from src.learner.lasso import LassoLearner, TOKEN_CACHE
+
+        learner = LassoLearner()
+        if use_summary and rows:
+            from src.nlp.summarizer import NewsSummarizer
+            NewsSummarizer.bulk_ensure_summaries(rows)
+
+        if rows:
+            df_news = pl.DataFrame(
+                [{k: (v if v is not None else '') if k in ('content', 'extracted_content') else v for k, v in dict(r).items()} for r in rows],
+                infer_schema_length=None
+            )
+        else:
+            df_news = pl.DataFrame({"date": [], "content": [], "extracted_content": [], "stock_codes": []},
+                                   schema={"date": pl.Date, "content": pl.String, "extracted_content": pl.String, "stock_codes": pl.List(pl.String)})
+
+        if use_summary and "extracted_content" in df_news.columns:
+            df_news = df_news.with_columns(
+                pl.coalesce(pl.col("extracted_content"), pl.col("content")).alias("final_content")
+            )
+        else:
+            df_news = df_news.with_columns(pl.col("content").alias("final_content"))
+
+        df_news = learner.token_store.add_tokens_column(
+            df_news, n_gram=learner.n_gram, content_col="final_content",
+            use_stored=not use_summary, cache=TOKEN_CACHE, cache_limit=10000
+        )
+        return SharedNewsCorpus.build(df_news.select(["date", "tokens", "stock_codes"]), group_col="stock_codes")
+
+    def run(self, v_job_id=None):
+        """
+        v_job_id: DAILY_UPDATE_BATCH 검증 작업 ID (진행률/결과 요약 기록용, 선택)
+        Returns: {stock_code: {"seconds": float, "error": str | None}}
+        """
+        if v_job_id:
+            self._update_job_status(v_job_id, 'running', 5)
+        targets = self.load_targets()
+        if not targets:
+            logger.warning("[Batch] No active targets to train.")
+            if v_job_id:
+                self._update_job_status(v_job_id, 'completed', 100, summary={"trained": 0, "failed": 0})
+            return {}
+
+        end_date = datetime.now().date()
+        results = {}
+        # 원문/요약문 토큰은 서로 다르므로 모드별로 corpus를 따로 만듦
+        for use_summary in (False, True):
+            group = [t for t in targets if self.uses_summary(t) == use_summary]
+            if not group:
+                continue
+            results.update(self._run_group(group, use_summary, end_date))
+            if v_job_id:
+                self._update_job_status(v_job_id, 'running', 5 + int(90 * len(results) / len(targets)))
+
+        if v_job_id:
+            failed = {code: r["error"] for code, r in results.items() if r["error"]}
+            summary = {
+                "trained": len(results) - len(failed),
+                "failed": failed,
+                "articles": sum(s["articles"] for s in self.stats.values()),
+                "stock_article_pairs": sum(s["pairs"] for s in self.stats.values()),
+            }
+            self._update_job_status(v_job_id, 'completed', 100, summary=summary)
+        return results
+
+    def _run_group(self, targets, use_summary, end_date):
+        starts = {t['stock_code']: self.news_start(t, end_date) for t in targets}
+        union_start = min(starts.values())
+
+        corpus = None
+        try:
+            t0 = time.perf_counter()
+            logger.info(f"[*] Batch corpus ({'summary' if use_summary else 'raw'}): {len(targets)} stocks, {union_start} ~ {end_date}")
+            rows = self.fetch_union_news(list(starts), union_start, end_date)
+            n_pairs = sum(len(r['stock_codes']) for r in rows)
+            corpus = self.build_corpus(rows, use_summary)
+            del rows
+            gc.collect()
+            build_s = time.perf_counter() - t0
+            logger.info(f"    Corpus: {corpus.n_docs} unique articles for {n_pairs} stock-article pairs, "
+                        f"{len(corpus.token_ids)} tokens ({build_s:.1f}s, {corpus.path})")
+            self.stats[use_summary] = {"articles": corpus.n_docs, "pairs": n_pairs, "build_s": build_s}
+
+            worker_args = [(t, corpus.path, starts[t['stock_code']], end_date) for t in targets]
+            max_workers = min(os.cpu_count() or 4, self.max_workers, len(targets))
+            logger.info(f"[*] Training {len(targets)} stocks from shared corpus (Workers: {max_workers})")
+            if max_workers <= 1:
+                worker_results = [_train_target_worker(a) for a in worker_args]
+            else:
+                # spawn: corpus 생성에 polars를 쓴 부모를 fork하면 자식의 polars 호출이 멈춤
+                with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+                    worker_results = list(executor.map(_train_target_worker, worker_args))
+        finally:
+            if corpus is not None:
+                corpus.cleanup()
+
+        results = {}
+        for stock_code, seconds, err in worker_results:
+            results[stock_code] = {"seconds": seconds, "error": err}
+            if err:
+                logger.error(f"  [Batch] {stock_code} failed: {err}")
+            else:
+                logger.info(f"  [Batch] {stock_code} trained in {seconds:.1f}s")
+        return results
+
+    @staticmethod
+    def _update_job_status(v_job_id, status, progress, summary=None):
+        with get_db_cursor() as cur:
+            if summary is not None:
+                cur.execute("""
+                    UPDATE tb_verification_jobs
+                    SET status = %s, progress = %s, result_summary = %s, updated_at = CURRENT_TIMESTAMP
+                    WHERE v_job_id = %s
+                """, (status, progress, json.dumps(summary), v_job_id))
+            else:
+                cur.execute("""
+                    UPDATE tb_verification_jobs
+                    SET status = %s, progress = %s, updated_at = CURRENT_TIMESTAMP
+                    WHERE v_job_id = %s
+                """, (status, progress, v_job_id))
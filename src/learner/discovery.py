@@ -3,6 +3,7 @@ import polars as pl
 import numpy as np
 from src.db.connection import get_db_cursor
 from src.nlp.tokenizer import Tokenizer
+from src.nlp.token_store import NewsTokenStore
 from src.utils.calendar import Calendar
 from datetime import datetime, timedelta
 
@@ -10,6 +11,7 @@ class GlobalDiscoveryScanner:
     def __init__(self, horizon_days=365):
         self.horizon_days = horizon_days
         self.tokenizer = Tokenizer()
+        self.token_store = NewsTokenStore(self.tokenizer)
 
     def scan(self):
         print(f">>> [Global Discovery] Starting scan (Horizon: {self.horizon_days} days)...")
@@ -22,6 +24,8 @@ class GlobalDiscoveryScanner:
             cur.execute("""
                 SELECT 
                     c.content, 
+                    c.keywords->>'v' AS token_version,
+                    c.keywords->>'t' AS stored_tokens,
                     p.excess_return,
                     m.stock_code,
                     p.date
@@ -42,12 +46,7 @@ class GlobalDiscoveryScanner:
 
         # 2. Tokenize and explode
         # (Memory Warning: This can be large. Process in chunks if needed)
-        def get_tokens(text):
-            return self.tokenizer.tokenize(text)
-
-        df = df.with_columns(
-            pl.col("content").map_elements(get_tokens, return_dtype=pl.List(pl.String)).alias("tokens")
-        )
+        df = self.token_store.add_tokens_column(df, content_col="content")
         
         df_tokens = df.select(["tokens", "excess_return"]).explode("tokens")
         df_tokens = df_tokens.with_columns(
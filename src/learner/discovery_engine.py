@@ -4,6 +4,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from src.db.connection import get_db_cursor
 from src.nlp.tokenizer import Tokenizer
+from src.nlp.token_store import NewsTokenStore
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,6 +14,7 @@ class ContentDiscoveryEngine:
         self.lookback_years = lookback_years
         self.sigma_threshold = sigma_threshold
         self.tokenizer = Tokenizer()
+        self.token_store = NewsTokenStore(self.tokenizer)
         
     def fetch_market_tail_events(self):
         """
@@ -93,7 +95,7 @@ class ContentDiscoveryEngine:
                 prev_date = target_date - timedelta(days=1)
                 
                 cur.execute("""
-                    SELECT c.content 
+                    SELECT c.content, c.keywords->>'v' AS token_version, c.keywords->>'t' AS stored_tokens
                     FROM tb_news_content c
                     JOIN tb_news_mapping m ON c.url_hash = m.url_hash
                     WHERE m.stock_code = %s
@@ -103,7 +105,7 @@ class ContentDiscoveryEngine:
                 rows = cur.fetchall()
                 for row in rows:
                     if row['content']:
-                        tokens = self.tokenizer.tokenize(row['content']) # Returns list of strings
+                        tokens = self.token_store.tokens(row['content'], row['token_version'], row['stored_tokens']) # Returns list of strings
                         for token in tokens:
                             tail_word_counts[token] = tail_word_counts.get(token, 0) + 1
                             
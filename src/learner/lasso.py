@@ -6,19 +6,132 @@ try:
     MLX_AVAILABLE = True
 except ImportError:
     MLX_AVAILABLE = False
-from sklearn.preprocessing import StandardScaler, MaxAbsScaler
+from src.learner.sparse_fista import SparseFISTALasso, SparseFISTALassoCV
+from sklearn.preprocessing import StandardScaler
 from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
 import numpy as np
+import os
+import sys
+import time
+import shutil
+import tempfile
+import multiprocessing
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from src.db.connection import get_db_cursor
 from src.nlp.tokenizer import Tokenizer
+from src.nlp.token_store import NewsTokenStore
+from src.nlp.hashed_vectorizer import HashedTfidfVectorizer, DEFAULT_HASH_FEATURES
+from src.nlp.sliding_df import DocTermCache, SlidingDocumentFrequency
+from src.learner.model_artifact import ModelArtifact, ARTIFACT_FORMAT_VERSION
+from src.learner.shared_corpus import DEFAULT_CORPUS_DIR
 from datetime import datetime, timedelta
-from scipy.sparse import hstack
+from scipy import sparse
+from scipy.sparse import hstack, vstack, csr_matrix
 import json
 from src.utils.stock_info import get_stock_aliases
 
 # Global cache to avoid redundant tokenization across different learner instances or iterations
 TOKEN_CACHE = {}
 GLOBAL_LEXICON_CACHE = set() # Discovered words to rescue
+# 1 = 증분 DF 결과를 매 재학습마다 전체 재계산과 비교 (불일치 시 전체 재계산 결과 사용)
+INCREMENTAL_DF_VERIFY = os.getenv("INCREMENTAL_DF_VERIFY", "0") == "1"
+# 1 = save_dict가 메타와 함께 바이너리 모델 artifact(tb_model_artifact)도 저장
+SAVE_MODEL_ARTIFACT = os.getenv("SAVE_MODEL_ARTIFACT", "1") == "1"
+# 학습 피처 행렬 dtype (vectorizer -> 스케일링 -> 필터링 -> solver까지 유지). float32 = 피크 메모리 절반
+LASSO_DTYPE = os.getenv("LASSO_DTYPE", "float32")
+
+# Stability Selection (Bootstrap) 설정
+STABILITY_BOOTSTRAPS = int(os.getenv("STABILITY_BOOTSTRAPS", "5"))
+STABILITY_SAMPLE_FRACTION = float(os.getenv("STABILITY_SAMPLE_FRACTION", "0.7"))
+STABILITY_WORKERS = int(os.getenv("STABILITY_WORKERS", "0"))  # 0 = min(bootstrap 수, CPU 수), 1 = 순차 실행
+# spawn (기본값): 가중 CSC 행렬/y를 /dev/shm에 한 번 기록하고 워커가 memory map으로 공유 (SharedNewsCorpus와 같은 방식)
+# fork ('process'): fork 워커가 행렬을 copy-on-write로 공유. polars를 이미 쓴 (또는 JOB_CONTROL 리스너
+#   스레드가 도는) 멀티스레드 프로세스를 fork하면 자식이 멈출 수 있으므로 명시적으로 선택할 때만 사용
+# thread: celer(0.7.x)는 fit 중 GIL을 놓지 않으므로 부트스트랩이 한 번에 하나씩 실행됨 - 병렬 효과 없음
+STABILITY_EXECUTOR = os.getenv("STABILITY_EXECUTOR", "spawn")
+# find_optimal_lag 후보 lag 병렬 평가 워커 수 (0 = min(후보 lag 수, CPU 수, LAG_SEARCH_MAX_WORKERS), 1 = 순차 실행)
+LAG_SEARCH_WORKERS = int(os.getenv("LAG_SEARCH_WORKERS", "0"))
+# lag 워커 수 RAM 상한 (AWO_MAX_WORKERS, VALIDATION_SEGMENT_MAX_WORKERS와 같은 역할). 워커마다 learner 전체와
+# df_train/df_test, 전역 lexicon 사본을 따로 가지므로 (1~2GB) 작게 유지
+LAG_SEARCH_MAX_WORKERS = int(os.getenv("LAG_SEARCH_MAX_WORKERS", "2"))
+
+_BOOTSTRAP_DESIGN = None  # 부트스트랩 워커의 (X_weighted, y) - fork는 상속, spawn은 memory map
+_LAG_SEARCH = None  # spawn 워커에서 한 번 만드는 (learner, df_train, df_test)
+
+
+def _init_bootstrap_worker(X, y):
+    # fork 컨텍스트에서는 initargs가 pickle되지 않고 부모 메모리를 그대로 상속
+    global _BOOTSTRAP_DESIGN
+    _BOOTSTRAP_DESIGN = (X, y)
+
+
+def _share_bootstrap_design(X, y, base_dir=DEFAULT_CORPUS_DIR):
+    """spawn 워커용: 가중 행렬(CSC)과 y를 npy로 한 번 기록. Returns 디렉토리 경로 (호출자가 삭제)"""
+    path = tempfile.mkdtemp(prefix="stability_design_", dir=base_dir)
+    X = sparse.csc_matrix(X)
+    arrays = {"data": X.data, "indices": X.indices, "indptr": X.indptr, "shape": np.array(X.shape, dtype=np.int64),
+              "y": np.asarray(y)}
+    for name, arr in arrays.items():
+        np.save(os.path.join(path, f"{name}.npy"), arr)
+    return path
+
+
+def _attach_bootstrap_worker(path):
+    # spawn 워커: 복사 없이 읽기 전용 memory map으로 연결 (부트스트랩 표본 추출 시에만 행 복사)
+    global _BOOTSTRAP_DESIGN
+    arrays = {n: np.load(os.path.join(path, f"{n}.npy"), mmap_mode="r") for n in ("data", "indices", "indptr", "shape", "y")}
+    X = sparse.csc_matrix((arrays["data"], arrays["indices"], arrays["indptr"]), shape=tuple(int(d) for d in arrays["shape"]),
+                          copy=False)
+    _BOOTSTRAP_DESIGN = (X, arrays["y"])
+
+
+def _bootstrap_selection(indices, alphas_desc, X=None, y=None):
+    """부트스트랩 표본 하나에 alpha 내림차순 warm start로 Lasso를 학습. Returns alpha별 선택 컬럼 인덱스"""
+    if X is None:
+        X, y = _BOOTSTRAP_DESIGN
+    X_sub = X[indices]
+    y_sub = y[indices]
+    
+    # Fit (CV is too slow inside bootstrap, use simple Lasso; warm start along the alpha path)
+    sub_model = Lasso(alpha=alphas_desc[0], max_iter=2000, warm_start=True)
+    selected = []
+    for a in alphas_desc:
+        sub_model.alpha = a
+        sub_model.fit(X_sub, y_sub)
+        selected.append(np.flatnonzero(sub_model.coef_))
+    return selected
+
+
+def _init_lag_worker(settings, state, lexicon, df_train, df_test):
+    # polars는 fork된 자식에서 스레드 풀이 없어 멈추므로 spawn 워커에서 같은 설정의 learner를 새로 만듦
+    global _LAG_SEARCH, GLOBAL_LEXICON_CACHE
+    GLOBAL_LEXICON_CACHE = lexicon
+    learner = LassoLearner(**settings)
+    for name, value in state.items():
+        setattr(learner, name, value)
+    _LAG_SEARCH = (learner, df_train, df_test)
+
+
+def _evaluate_lag(lag, learner=None, df_train=None, df_test=None):
+    """
+    max_lag로 만든 피처 프레임에서 news_idx_L1..L{lag} 블록만 써서 학습하고 방향성 정확도를 반환합니다.
+    learner 상태(vectorizer/model)를 덮어씀 (병렬 평가 시 워커마다 자체 learner).
+    Returns: (lag, score, error)
+    """
+    if learner is None:
+        learner, df_train, df_test = _LAG_SEARCH
+    try:
+        learner.lags = lag
+        learner.train(df_train)
+        y_true = df_test["excess_return"].cast(pl.Float64).to_numpy()
+        y_pred = learner.predict(df_test)
+        # 방향성 정확도(Directional Accuracy) 기준
+        score = float(np.mean((y_true > 0).astype(int) == (y_pred > 0).astype(int)))
+        return lag, score, None
+    except Exception as e:
+        return lag, None, str(e)
 
 # Black Swan Critical Words (Hybird Lexicon Anchor)
 CRITICAL_WORDS = {
@@ -33,7 +146,8 @@ class LassoLearner:
                  use_fundamentals=True, use_sector_beta=False, use_cv_lasso=False, 
                  use_summary=False, use_tech_indicators=False,
                  decay_rate='auto', min_relevance=0,
-                 engine='celer'):
+                 engine='celer', text_engine='tfidf', hash_features=DEFAULT_HASH_FEATURES,
+                 incremental_df=False, warm_start_retrain=False, dtype=None):
         self.alpha = alpha
         self.n_gram = n_gram
         self.lags = lags
@@ -48,17 +162,26 @@ class LassoLearner:
         self._dynamic_decay_weights = None  # Cache for dynamic decay
         self.min_relevance = min_relevance
         self.use_stability_selection = False # Default off, enable for production
+        self.stability_bootstraps = STABILITY_BOOTSTRAPS
+        self.stability_sample_fraction = STABILITY_SAMPLE_FRACTION
+        self.stability_workers = STABILITY_WORKERS
+        self.stability_executor = STABILITY_EXECUTOR
         self.engine = engine
+        self.text_engine = text_engine  # 'tfidf' (vocabulary) | 'hashing' (고정 해시 공간)
         self.tokenizer = Tokenizer()
-        # Phase 37: Added max_df=0.85 to auto-filter high-frequency neutral words
-        self.vectorizer = TfidfVectorizer(
-            tokenizer=lambda x: x,
-            lowercase=False,
-            token_pattern=None,
-            min_df=self.min_df,
-            max_df=0.85,  # Remove terms appearing in >85% of docs (neutral words)
-            max_features=self.max_features
-        )
+        self.token_store = NewsTokenStore(self.tokenizer)
+        self.hash_features = hash_features
+        self.dtype = np.dtype(dtype or LASSO_DTYPE)
+        self.vectorizer = self._make_vectorizer()
+        # Walk-forward 재학습: 윈도우가 밀린 만큼만 DF/IDF 갱신 (슬롯 = (종목, Main/Buffer))
+        self.incremental_df = incremental_df
+        self.train_slot = None
+        self._doc_term_cache = None
+        self._df_windows = {}
+        # Walk-forward 재학습: 같은 슬롯/alpha의 직전 계수를 새 피처 컬럼에 매핑해 celer 초기값으로 사용
+        self.warm_start_retrain = warm_start_retrain
+        self._warm_coefs = {} # (slot, alpha) -> {feature_name: real_beta}
+        self.fit_stats = [] # 학습별 {slot, alpha, n_iter, solve_s, warm, n_features}
         
         # Select model based on engine
         if self.engine == 'mlx' and MLX_AVAILABLE:
@@ -66,6 +189,12 @@ class LassoLearner:
                 self.model = MLXLassoCV(cv=5, max_iter=1000, verbose=False)
             else:
                 self.model = MLXLasso(alpha=self.alpha, max_iter=1000, verbose=False)
+        elif self.engine == 'fista':
+            # NumPy/SciPy sparse FISTA (MLX 없는 Linux 서버용, X를 dense로 바꾸지 않음)
+            if self.use_cv_lasso:
+                self.model = SparseFISTALassoCV(cv=5, max_iter=10000, verbose=False)
+            else:
+                self.model = SparseFISTALasso(alpha=self.alpha, max_iter=10000, verbose=False)
         else:
             # Default: Celer (CPU optimized)
             if self.engine == 'mlx' and not MLX_AVAILABLE:
@@ -76,6 +205,31 @@ class LassoLearner:
             else:
                 self.model = Lasso(alpha=self.alpha, max_iter=10000)
         self.keep_indices = None # Black Swan 필터링 결과 저장용
+        self.registry = None # ModelRegistry (백테스트 모드: 사전을 DB 대신 메모리에 보관)
+        self.daily_news = None # prepare_features가 만든 거래일별 뉴스 토큰 (news_idx_L{k}가 가리킴)
+        self._fit_docs = None # 마지막 vectorizer 학습 문서 (해시 버킷 -> 토큰 역매핑용)
+        self.daily_news_dates = None # daily_news 각 행의 impact date (증분 DF의 키)
+
+    def _make_vectorizer(self, vocabulary=None):
+        # Phase 37: Added max_df=0.85 to auto-filter high-frequency neutral words
+        if self.text_engine == 'hashing':
+            return HashedTfidfVectorizer(
+                n_features=self.hash_features,
+                min_df=self.min_df,
+                max_df=0.85,
+                max_features=self.max_features,
+                dtype=self.dtype
+            )
+        return TfidfVectorizer(
+            tokenizer=lambda x: x,
+            lowercase=False,
+            token_pattern=None,
+            min_df=self.min_df,
+            max_df=0.85,  # Remove terms appearing in >85% of docs (neutral words)
+            max_features=self.max_features,
+            vocabulary=vocabulary,
+            dtype=self.dtype
+        )
 
     def fetch_data(self, stock_code, start_date, end_date, prefetched_df_news=None, min_relevance=None):
         """
@@ -132,7 +286,8 @@ class LassoLearner:
             else:
                 # [Hybrid v2] summary_content 필드 추가 확인
                 cur.execute("""
-                    SELECT c.published_at::date as date, c.content, c.extracted_content, c.url_hash
+                    SELECT c.published_at::date as date, c.content, c.extracted_content, c.url_hash,
+                           c.keywords->>'v' AS token_version, c.keywords->>'t' AS stored_tokens
                     FROM tb_news_content c
                     JOIN tb_news_mapping m ON c.url_hash = m.url_hash
                     WHERE m.stock_code = %s 
@@ -173,7 +328,8 @@ class LassoLearner:
 
         else:
             # If prefetched, ensure final_content exists
-            if "final_content" not in df_news.columns:
+            # (AWO shared corpus frames carry only 'date'/'tokens', no raw text)
+            if "final_content" not in df_news.columns and "content" in df_news.columns:
                 if "extracted_content" in df_news.columns and self.use_summary:
                     df_news = df_news.with_columns(
                         pl.coalesce(pl.col("extracted_content"), pl.col("content")).alias("final_content")
@@ -196,225 +352,378 @@ class LassoLearner:
             print(f"    Tokenizing and mapping impact dates for {len(df_news)} news items...")
             
             # published_at_hint 혹은 content의 날짜 정보를 바탕으로 impact_date 계산
-            # Calendar.get_impact_date(stock_code, date) 사용
-            global TOKEN_CACHE
+            # Calendar.get_impact_dates(stock_code, dates) 사용
             
-            def get_cached_tokens(content):
-                if content in TOKEN_CACHE:
-                    return TOKEN_CACHE[content]
-                tokens = self.tokenizer.tokenize(content, n_gram=self.n_gram)
-                # MEMORY_OPT: Keep cache size manageable
-                if len(TOKEN_CACHE) > 20000:
-                    keys_to_remove = list(TOKEN_CACHE.keys())[:5000]
-                    for k in keys_to_remove:
-                        del TOKEN_CACHE[k]
-                TOKEN_CACHE[content] = tokens
-                return tokens
-
-            # Use final_content for tokenization (preferring summary if enabled)
-            df_news = df_news.with_columns(
-                pl.col("final_content").map_elements(get_cached_tokens, return_dtype=pl.List(pl.String)).alias("tokens"),
-                pl.col("date").map_elements(
-                    lambda d: Calendar.get_impact_date(stock_code, d),
-                    return_dtype=pl.Date
-                ).alias("impact_date")
-            )
+            # Use final_content for tokenization (preferring summary if enabled).
+            # Stored tokens (tb_news_content.keywords) are only valid for raw content.
+            # Prefetched frames (validator/AWO) already carry a 'tokens' column.
+            if "tokens" not in df_news.columns:
+                df_news = self.token_store.add_tokens_column(
+                    df_news, n_gram=self.n_gram, content_col="final_content",
+                    use_stored=not self.use_summary, cache=TOKEN_CACHE
+                )
+            # 정렬된 거래일 배열에 대한 as-of 매핑 (기사별 Calendar.get_impact_date 호출 대신 한 번의 searchsorted)
             # impact_date 기준으로 뉴스 취합 (주말 뉴스는 월요일로 모임)
-            df_news_daily = df_news.group_by("impact_date").agg(pl.col("tokens").flatten())
-            df_news_daily = df_news_daily.rename({"impact_date": "date"})
+            news_daily_lf = (
+                df_news.lazy()
+                .select(Calendar.get_impact_dates(stock_code, df_news["date"]).alias("date"), pl.col("tokens"))
+                .drop_nulls("date")
+                .group_by("date").agg(pl.col("tokens").flatten())
+                .sort("date")
+            )
         else:
-            df_news_daily = pl.DataFrame({"date": [], "tokens": []})
+            news_daily_lf = pl.LazyFrame(schema={"date": pl.Date, "tokens": pl.List(pl.String)})
         
-        # 2. 기본 데이터 병합 (Prices + Fundamentals)
-        df = df_prices.clone()
+        # 2. 기본 데이터 병합 (Prices + Fundamentals) - 아래 lag 조인까지 하나의 LazyFrame 쿼리로 구성
+        lf = df_prices.lazy()
         
         if self.use_fundamentals:
+            fund_cols = ["per", "pbr", "roe", "market_cap"]
             if not df_fund.is_empty():
-                df = df.join(df_fund, on="date", how="left")
-                df = df.with_columns([
-                    pl.col("per").fill_null(strategy="forward").fill_null(0.0),
-                    pl.col("pbr").fill_null(strategy="forward").fill_null(0.0),
-                    pl.col("roe").fill_null(strategy="forward").fill_null(0.0),
-                    pl.col("market_cap").fill_null(strategy="forward").fill_null(0.0)
+                lf = lf.join(df_fund.lazy(), on="date", how="left", maintain_order="left")
+                lf = lf.with_columns([
+                    pl.col(c).fill_null(strategy="forward").fill_null(0.0) for c in fund_cols
                 ])
-                df = df.with_columns(
+                lf = lf.with_columns(
                     pl.col("market_cap").clip(lower_bound=1.0).log().alias("log_market_cap")
                 )
             else:
-                df = df.with_columns([
+                lf = lf.with_columns([
                     pl.lit(0.0).alias("per"),
                     pl.lit(0.0).alias("pbr"),
                     pl.lit(0.0).alias("roe"),
                     pl.lit(0.0).alias("log_market_cap")
                 ])
         
-        # [Hybrid v2] Technical Indicators Integration
-        if self.use_tech_indicators:
+        # [Hybrid v2] Technical Indicators Integration (행 순서 기반 numpy 계산 -> 쿼리 안의 batch UDF)
+        if self.use_tech_indicators and not df_prices.is_empty():
             from src.learner.tech_indicators import TechIndicatorProvider
-            df = TechIndicatorProvider.calculate_indicators(df)
+            tech_schema = {**lf.collect_schema(), **{c: pl.Float64 for c in TechIndicatorProvider.TECH_COLUMNS}}
+            lf = lf.map_batches(TechIndicatorProvider.calculate_indicators, schema=tech_schema, streamable=False)
             print(f"    [Tech] Added indicators (RSI, MACD)")
-
-        # [Hybrid v2] Content Selector (Raw vs Summarized)
-        if self.use_summary and "extracted_content" in df_news.columns:
-            # extracted_content가 있는 경우 이를 우선 사용
-            df_news = df_news.with_columns(
-                pl.coalesce(pl.col("extracted_content"), pl.col("content")).alias("final_content")
-            )
-        else:
-            df_news = df_news.with_columns(pl.col("content").alias("final_content"))
         
         # 3. 거래일 기준 시차(Lag) 피처 생성
-        # 캘린더 날짜가 아닌 '거래일 순서'대로 JOIN
-        trading_days = Calendar.get_trading_days(stock_code)
+        # 캘린더 날짜가 아닌 '거래일 순서'대로 매핑
+        # Lag 1: T일의 주가 등락을 예측하기 위해 사용하는 'T일의 Impact Date를 가진 뉴스'
+        #        (즉, T일 장전 혹은 T-1 장후 뉴스)
+        # Lag k: trading_days 상에서 (k-1) 거래일 전 Impact Date를 가진 뉴스
+        # 거래일별 뉴스는 self.daily_news에 한 번만 보관하고, 각 행에는 lag별 일별 뉴스 행 번호
+        # (news_idx_L{k}, 없으면 -1)만 둠 -> train()에서 일별 doc-term 행렬을 행 이동(row-shift)하여 사용
+        trading_days = Calendar.get_trading_days(stock_code) if stock_code else []
         
-        for i in range(1, self.lags + 1):
-            # i번째 전 거래일의 뉴스를 현재 거래일로 가져옴
-            # df_news_daily는 이미 impact_date(거래일) 기준으로 정리됨
-            
-            # 매핑 로직:
-            # current_date가 trading_days의 j번째 인덱스라면,
-            # lag1 뉴스는 j번 인덱스에 매핑된 뉴스 (당일 뉴스) -> 이건 보통 리드타임 때문에 불가능함.
-            # 보통 lag1은 '가장 최근에 사용 가능한 뉴스'를 의미함.
-            
-            # 여기서 정의:
-            # Lag 1: T일의 주가 등락을 예측하기 위해 사용하는 'T일의 Impact Date를 가진 뉴스'
-            # (즉, T일 장전 혹은 T-1 장후 뉴스)
+        news_rows = news_daily_lf.select("date").with_row_index("news_row")
+        lf = lf.join(news_rows.rename({"news_row": "news_idx_L1"}), on="date", how="left", maintain_order="left")
+        if self.lags > 1:
+            # 거래일 프레임에 일별 뉴스 행 번호를 붙이고 (k-1)칸씩 shift -> lag 2..N을 한 번의 조인으로 붙임
+            # (거래일 목록에 없는 행 날짜는 lag>=2 뉴스 없음)
+            td_lags = (
+                pl.LazyFrame({"date": trading_days}, schema={"date": pl.Date})
+                .join(news_rows, on="date", how="left", maintain_order="left")
+                .select(
+                    pl.col("date"),
+                    *[pl.col("news_row").shift(i - 1).alias(f"news_idx_L{i}") for i in range(2, self.lags + 1)]
+                )
+            )
+            lf = lf.join(td_lags, on="date", how="left", maintain_order="left")
+        lf = lf.with_columns([
+            pl.col(f"news_idx_L{i}").fill_null(-1).cast(pl.Int32) for i in range(1, self.lags + 1)
+        ])
+        
+        # 일별 뉴스와 피처 프레임을 한 번에 실행 (공통 서브플랜인 일별 뉴스 group_by는 한 번만 계산)
+        df_news_daily, df = pl.collect_all([news_daily_lf, lf])
+        self.daily_news = df_news_daily["tokens"]
+        self.daily_news_dates = df_news_daily["date"]
             
-            df_lag = df_news_daily.select([
-                pl.col("date"),
-                pl.col("tokens").alias(f"news_lag{i}")
-            ])
+        return df
+
+    def train(self, df, stock_code=None):
+        design = self._build_design(df)
+        X_weighted, y = design["X"], design["y"]
+        
+        # --- Stability Selection (Bootstrap) ---
+        if self.use_stability_selection and X_weighted.shape[1] > 0:
+            stable_indices_local = self._stability_selection(X_weighted, y, design["feature_names"], [self.alpha], design.get("critical_mask"))[self.alpha]
             
-            # Trading Day Lag Join
-            # i=1이면 현재 날짜의 뉴스 (Impact Date가 오늘인 뉴스)
-            # i=2이면 이전 거래일의 뉴스
-            if i == 1:
-                df = df.join(df_lag, on="date", how="left")
+            # Refit on stable features only (Relaxed Lasso)
+            if len(stable_indices_local) == 0:
+                print("    [Stability] Warning: No features survived stability selection. Reverting to all.")
+                self.model.fit(X_weighted, y)
             else:
-                # 이전 거래일 매핑을 위해 trading_days 인덱스 활용
-                # polars의 shift 기능 활용 가능
-                df_temp = df_news_daily.clone()
-                # Trading days 리스트 상에서 i-1 만큼 뒤로 밀어야 함
-                # (예: 20일에 19일 뉴스를 붙이고 싶다면, 19일 뉴스의 date를 20일로 바꿔야 함)
+                X_stable = X_weighted[:, stable_indices_local]
+                print(f"    [Stability] {len(stable_indices_local)}/{X_weighted.shape[1]} features selected.")
+                self.model.fit(X_stable, y)
                 
-                # Trading Day List를 DataFrame으로 만들어 시차 생성
-                df_td = pl.DataFrame({"td": trading_days})
-                df_td = df_td.with_columns(
-                    pl.col("td").shift(-(i-1)).alias("target_date")
-                )
+                # Expand coefs back to X_weighted size (filling zeros)
+                full_coefs = np.zeros(X_weighted.shape[1])
+                full_coefs[stable_indices_local] = self.model.coef_
+                self.model.coef_ = full_coefs
+                # Hack: intercept might be different, but for dictionary we care about coefs.
                 
-                df_lag_shifted = df_lag.join(df_td, left_on="date", right_on="td", how="inner")
-                df_lag_shifted = df_lag_shifted.select([
-                    pl.col("target_date").alias("date"),
-                    pl.col(f"news_lag{i}")
-                ])
-                df = df.join(df_lag_shifted, on="date", how="left")
+        else:
+            self._fit_lasso(self.model, X_weighted, y, design, self.alpha)
+        
+        sentiment_dict = self._coef_to_dict(design, self.model.coef_, self._stock_name_aliases(stock_code))
+                
+        # Return Dict AND Scaler Params
+        return sentiment_dict, design["scaler_params"]
 
-        # null 값은 빈 리스트로 채움
-        for i in range(1, self.lags + 1):
-            df = df.with_columns(pl.col(f"news_lag{i}").fill_null([]))
-            
-        return df
+    def train_path(self, df, alphas, stock_code=None):
+        """
+        Regularization Path 모드: 피처 행렬을 한 번만 만들고 alpha 내림차순으로 warm start 학습합니다.
+        (큰 alpha의 희소 해에서 출발하므로 작은 alpha 수렴이 빨라짐)
+        Returns: ({alpha: sentiment_dict}, scaler_params)
+        """
+        design = self._build_design(df)
+        X_weighted, y = design["X"], design["y"]
+        alphas_desc = sorted({float(a) for a in alphas}, reverse=True)
+        
+        stable = {}
+        if self.use_stability_selection and X_weighted.shape[1] > 0:
+            stable = self._stability_selection(X_weighted, y, design["feature_names"], alphas_desc, design.get("critical_mask"))
+        
+        coefs = {}
+        if self.use_cv_lasso:
+            # CV 모델은 alpha를 스스로 선택하므로 한 번만 학습 (run_validation의 기존 동작과 동일)
+            self.model.fit(X_weighted, y)
+            coefs = {a: self.model.coef_ for a in alphas_desc}
+        else:
+            path_model = self._make_path_model(alphas_desc[0])
+            for k, a in enumerate(alphas_desc):
+                stable_idx = stable.get(a)
+                if stable_idx is not None and len(stable_idx) > 0:
+                    # 안정 피처 집합이 alpha마다 달라 warm start 불가 -> 부분 행렬에서 개별 학습
+                    sub_model = self._make_path_model(a)
+                    sub_model.fit(X_weighted[:, stable_idx], y)
+                    full_coefs = np.zeros(X_weighted.shape[1])
+                    full_coefs[stable_idx] = sub_model.coef_
+                    coefs[a] = full_coefs
+                else:
+                    # 첫 alpha만 직전 재학습 계수에서 출발, 이후는 path 상의 이전 alpha 해에서 출발
+                    path_model.alpha = a
+                    self._fit_lasso(path_model, X_weighted, y, design, a, from_previous_retrain=(k == 0))
+                    coefs[a] = np.array(path_model.coef_, copy=True)
+            print(f"    [Path] Fitted {len(alphas_desc)} alphas with warm starts: {alphas_desc}")
+        
+        stock_names = self._stock_name_aliases(stock_code)
+        dicts = {a: self._coef_to_dict(design, coefs[float(a)], stock_names) for a in alphas}
+        return dicts, design["scaler_params"]
 
-    def train(self, df, stock_code=None):
-        # Load Global Lexicon for rescue (Only once per session/instance if needed)
-        global GLOBAL_LEXICON_CACHE
-        if not GLOBAL_LEXICON_CACHE:
-            try:
-                with get_db_cursor() as cur:
-                    cur.execute("SELECT word FROM tb_global_lexicon WHERE impact_score > 0.02") # 2% Threshold
-                    rows = cur.fetchall()
-                    GLOBAL_LEXICON_CACHE = {row['word'] for row in rows}
-                    if GLOBAL_LEXICON_CACHE:
-                        print(f"    [Global] Rescued Lexicon loaded: {len(GLOBAL_LEXICON_CACHE)} words found.")
-            except Exception as e:
-                print(f"    [Global] Warning: Could not load global lexicon: {e}")
+    def _fit_lasso(self, model, X, y, design, alpha, from_previous_retrain=True):
+        """
+        model.fit + 반복 횟수/풀이 시간 기록. warm_start_retrain이면 같은 슬롯·alpha의 직전 재학습 계수를
+        이름 기준으로 새 컬럼에 매핑해 초기값으로 사용합니다 (celer Lasso / sparse FISTA, 볼록 문제라 해는 동일).
+        """
+        key = (self.train_slot, float(alpha))
+        warm = False
+        restore_warm_start = getattr(model, 'warm_start', None)
+        if self.warm_start_retrain and from_previous_retrain and isinstance(model, (Lasso, SparseFISTALasso)):
+            init = self._warm_start_coef(design, key)
+            warm = init is not None
+            # 컬럼 구성이 바뀌므로 이전 coef_는 항상 덮어씀 (없으면 0에서 시작)
+            model.warm_start = True
+            model.coef_ = (init if warm else np.zeros(X.shape[1])).astype(X.dtype, copy=False)
+        
+        t0 = time.perf_counter()
+        try:
+            model.fit(X, y)
+        finally:
+            if restore_warm_start is not None:
+                model.warm_start = restore_warm_start
+        solve_s = time.perf_counter() - t0
+        
+        n_iter = getattr(model, 'n_iter_', None)
+        if isinstance(n_iter, (list, np.ndarray)):
+            n_iter = int(np.max(n_iter)) if len(n_iter) else None
+        stats = {"slot": self.train_slot, "alpha": float(alpha), "n_iter": n_iter, "solve_s": solve_s,
+                 "warm": warm, "n_features": X.shape[1]}
+        self.fit_stats.append(stats)
+        print(f"    [Fit] alpha={float(alpha):g}: {n_iter} iters, {solve_s:.3f}s ({'warm' if warm else 'cold'} start, {X.shape[1]} features)")
+        
+        if self.warm_start_retrain:
+            coef = np.asarray(model.coef_).ravel()
+            nz = np.flatnonzero(coef)
+            names = design["feature_names"]
+            # 가중치가 윈도우마다 달라지므로 실제 beta (coef * weight)로 보관
+            self._warm_coefs[key] = {names[i]: float(coef[i] * design["weights"][i]) for i in nz}
+        return stats
 
-        # 1. Text Features (TF-IDF)
-        # 1. Text Features (TF-IDF)
-        # MEMORY_OPT: Use Generator instead of List Materialization
-        def token_generator():
-            for i in range(1, self.lags + 1):
-                col_name = f"news_lag{i}"
-                if col_name in df.columns:
-                    # Polars iter_rows is slow for single column, use to_series().to_list()?
-                    # But to_list() materializes.
-                    # df[col] is a Series.
-                    # We can iterate over the Series directly?
-                    # Or just iterating list is fine if list is already in memory via Polars?
-                    # Issue: "news_lag{i}" contains LISTS of tokens.
-                    # We just need to yield " ".join(tokens) or pass tokens directly if tokenizer=identity
-                    
-                    series = df[col_name]
-                    # We can't avoid some materialization if Polars holds it, but we avoid *double* copy into 'all_token_lists'
-                    for tokens_list in series:
-                        # Polars List series yields python lists or None, but boolean check might be ambiguous if it's a Polars Series object?
-                        # Actually iterating a pl.Series should yield python objects (list or None).
-                        # But explicit check is safer:
-                        if tokens_list is not None and len(tokens_list) > 0:
-                            # Filter None and convert to str (safety)
-                            yield [str(t) for t in tokens_list if t is not None]
-                        else:
-                            yield [] # Yield empty list for fit() inputs
-                else:
-                    pass # Skip missing lags for Vocab building
+    def _warm_start_coef(self, design, key):
+        """직전 재학습의 실제 beta를 현재 피처 컬럼/가중치 기준 모델 계수로 변환 (없으면 None)"""
+        prev = self._warm_coefs.get(key)
+        if not prev:
+            return None
+        weights = design["weights"]
+        init = np.zeros(len(design["feature_names"]))
+        for i, name in enumerate(design["feature_names"]):
+            beta = prev.get(name)
+            if beta is not None and weights[i] != 0:
+                init[i] = beta / weights[i]
+        return init
+
+    def _make_path_model(self, alpha):
+        if self.engine == 'mlx' and MLX_AVAILABLE:
+            # FISTA 구현은 warm start를 지원하지 않음 -> alpha마다 처음부터 학습
+            return MLXLasso(alpha=alpha, max_iter=1000, verbose=False)
+        if self.engine == 'fista':
+            return SparseFISTALasso(alpha=alpha, max_iter=10000, warm_start=True)
+        return Lasso(alpha=alpha, max_iter=10000, warm_start=True)
+
+    def _stability_selection(self, X_weighted, y, feature_names, alphas, force_keep_mask=None):
+        """Bootstrap 안정성 선택 (부트스트랩은 워커 풀에서 병렬 실행). Returns {alpha: 선택된 로컬 컬럼 인덱스 배열}"""
+        n_bootstraps = self.stability_bootstraps
+        sample_fraction = self.stability_sample_fraction
+        threshold = 0.6
         
-        # Check if we have any text data at all
-        has_text = any(f"news_lag{i}" in df.columns for i in range(1, self.lags + 1))
+        n_samples = X_weighted.shape[0]
+        n_feats = X_weighted.shape[1]
+        alphas_desc = sorted({float(a) for a in alphas}, reverse=True)
+        stability_counts = {a: np.zeros(n_feats) for a in alphas_desc}
         
-        X_text = None
-        feature_names = []
+        # Check for critical words indices to force keep
+        # (_build_design의 critical_mask 우선: 해시 버킷 이름으로는 판별 불가)
+        if force_keep_mask is None:
+            force_keep_mask = np.zeros(n_feats, dtype=bool)
+            for idx, name in enumerate(feature_names):
+                base = name.rsplit('_L', 1)[0]
+                if base in CRITICAL_WORDS:
+                    force_keep_mask[idx] = True
         
-        if has_text:
-            print(f"  Fitting vectorizer (Generator Mode)... (min_df={self.vectorizer.min_df}, min_rel={self.min_relevance})")
-            
-            # MEMORY_OPT: Do NOT override min_df=1. Trust the class default (3) or user input.
-            # self.vectorizer.min_df = 1  <-- REMOVED
-            
-            # Count non-empty for logging (approximate)
-            # We can't count without consuming generator. Just proceed.
-            
+        # Resample (표본은 부모에서 미리 뽑아 워커 수와 무관하게 같은 결과)
+        samples = [np.random.choice(n_samples, int(n_samples * sample_fraction), replace=False) for _ in range(n_bootstraps)]
+        workers, executor = self._stability_pool_size(n_bootstraps)
+        print(f"    [Stability] Running Bootstrap Selection (n={n_bootstraps}, fraction={sample_fraction}, alphas={len(alphas)}, workers={workers} {executor})...")
+        
+        t0 = time.perf_counter()
+        if workers <= 1:
+            selections = [_bootstrap_selection(idx, alphas_desc, X_weighted, y) for idx in samples]
+        elif executor in ('fork', 'process'):
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'),
+                                     initializer=_init_bootstrap_worker, initargs=(X_weighted, y)) as pool:
+                selections = list(pool.map(_bootstrap_selection, samples, repeat(alphas_desc)))
+        elif executor == 'spawn':
+            path = _share_bootstrap_design(X_weighted, y)
             try:
-                self.vectorizer.fit(token_generator())
-            except ValueError:
-                print("  No tokens found in generator (empty corpus?). Proceeding with Dense only.")
-                has_text = False
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                         initializer=_attach_bootstrap_worker, initargs=(path,)) as pool:
+                    selections = list(pool.map(_bootstrap_selection, samples, repeat(alphas_desc)))
+            finally:
+                shutil.rmtree(path, ignore_errors=True)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                selections = list(pool.map(lambda idx: _bootstrap_selection(idx, alphas_desc, X_weighted, y), samples))
+        print(f"    [Stability] {n_bootstraps} bootstraps done in {time.perf_counter() - t0:.2f}s")
+        
+        for selected in selections:
+            for a, cols in zip(alphas_desc, selected):
+                stability_counts[a][cols] += 1
+        
+        stable = {}
+        for a in alphas_desc:
+            selection_probs = stability_counts[a] / n_bootstraps
+            stable_mask = (selection_probs >= threshold) | force_keep_mask
+            stable[a] = np.where(stable_mask)[0]
+        return stable
 
-            if has_text:
-                feature_names = list(self.vectorizer.get_feature_names_out())
-                
-                # Transform needs to be done column by column anyway to form Lags
-                X_list = []
-                for i in range(1, self.lags + 1):
-                    col_name = f"news_lag{i}"
-                    if col_name in df.columns:
-                        # Transform allows Iterable too, but we need to keep row alignment for hstack!
-                        # So we must yield exactly one document per row, even if empty.
-                        # df[col].to_list() is materialized list of lists.
-                        # vectorizer.transform takes list of lists (since tokenizer=identity).
-                        # This part still uses memory corresponding to the dataframe column size.
-                        # But we saved the "Massive List" copy in fit().
-                        
-                        # Optimization: Transform directly from Series iterator?
-                        # transform(df[col]) might work if Polars Series is iterable? Yes.
-                        # But entries are Lists. Vectorizer expects keys.
-                        # Since we used tokenizer=lambda x:x, it expects iterables of tokens.
-                        
-                        # Handle Nulls for Transform (Must yield empty list, not skip)
-                        # We use a helper generator for transform to ensure safety
-                        def transform_gen(series):
-                            for tokens in series:
-                                if tokens is None:
-                                    yield []
-                                else:
-                                    yield [str(t) for t in tokens]
-                                    
-                        X_lag = self.vectorizer.transform(transform_gen(df[col_name]))
-                    else:
-                        X_lag = self.vectorizer.transform([[]] * len(df))
-                    X_list.append(X_lag)
+    def _stability_pool_size(self, n_bootstraps):
+        workers = self.stability_workers or min(n_bootstraps, os.cpu_count() or 1)
+        executor = self.stability_executor
+        if executor in ('fork', 'process') and not sys.platform.startswith('linux'):
+            # fork는 Linux만 (다른 OS는 순차 실행, 기본값 spawn은 공유 메모리라 OS와 무관)
+            workers = 1
+        return max(1, min(workers, n_bootstraps)), executor
+
+    def _lag_search_pool_size(self, n_candidates):
+        workers = LAG_SEARCH_WORKERS or min(n_candidates, os.cpu_count() or 1)
+        workers = min(workers, max(1, LAG_SEARCH_MAX_WORKERS))
+        if self.engine == 'mlx':
+            # MLX 모델/디바이스 상태는 프로세스 간 전달 불가 -> 순차 실행
+            workers = 1
+        return max(1, min(workers, n_candidates))
+
+    def _worker_settings(self):
+        """다른 프로세스에서 같은 learner를 다시 만들기 위한 (생성자 인자, 학습 상태). tokenizer/vectorizer는 새로 생성"""
+        settings = dict(
+            alpha=self.alpha, n_gram=self.n_gram, lags=self.lags, min_df=self.min_df, max_features=self.max_features,
+            use_fundamentals=self.use_fundamentals, use_sector_beta=self.use_sector_beta, use_cv_lasso=self.use_cv_lasso,
+            use_summary=self.use_summary, use_tech_indicators=self.use_tech_indicators, decay_rate=self.decay_rate,
+            min_relevance=self.min_relevance, engine=self.engine, text_engine=self.text_engine,
+            hash_features=self.hash_features, dtype=self.dtype.name,
+        )
+        state = {
+            "model": self.model,
+            "daily_news": self.daily_news,
+            "daily_news_dates": self.daily_news_dates,
+            "use_stability_selection": self.use_stability_selection,
+            "stability_bootstraps": self.stability_bootstraps,
+            "stability_sample_fraction": self.stability_sample_fraction,
+        }
+        return settings, state
+
+    def _stock_name_aliases(self, stock_code):
+        if not stock_code:
+            return []
+        # We already have stock_code, no need to fetch name just to get aliases
+        # get_stock_aliases will now prioritize stock_code lookups in the JSON map.
+        # However, for safety and fallback (if JSON not ready), we still fetch the name.
+        with get_db_cursor() as cur:
+            cur.execute("SELECT stock_name FROM tb_stock_master WHERE stock_code = %s", (stock_code,))
+            row = cur.fetchone()
+            if row and row['stock_name']:
+                return get_stock_aliases(row['stock_name'], stock_code)
+        return []
+
+    def _coef_to_dict(self, design, coefs, stock_names):
+        # 결과 저장용 사전 생성
+        sentiment_dict = {}
+        weights_filtered = design["weights"]
+        feature_names = self._resolve_hashed_names(design["feature_names"], coefs)
+        for idx, (name, coef) in enumerate(zip(feature_names, coefs)):
+            if coef != 0:
+                # Filter out stock name related keywords (Text only)
+                if not name.startswith("__F_"):
+                    base_name = name.rsplit('_L', 1)[0]
+                    if base_name in stock_names:
+                        continue
                 
-                X_text = hstack(X_list).tocsr()
+                # Recover Real Beta: Beta_Real = Beta_Model * Weight
+                # X_w = X * W
+                # y = X_w * B_m = X * (W * B_m)
+                real_beta = coef * weights_filtered[idx]
+                sentiment_dict[name] = float(real_beta)
+        return sentiment_dict
+
+    def _resolve_hashed_names(self, feature_names, coefs):
+        """hashing 엔진: 계수가 0이 아닌 '#<bucket>_L{k}' 이름만 학습 문서의 토큰으로 역매핑"""
+        if self.text_engine != 'hashing':
+            return feature_names
+        nonzero = [i for i, c in enumerate(coefs) if c != 0 and feature_names[i].startswith("#")]
+        if not nonzero or self._fit_docs is None:
+            return feature_names
+        parsed = {i: feature_names[i][1:].rsplit('_L', 1) for i in nonzero}
+        tokens = self.vectorizer.resolve({int(b) for b, _ in parsed.values()}, self._fit_docs())
+        resolved = list(feature_names)
+        for i, (bucket, lag) in parsed.items():
+            resolved[i] = f"{tokens[int(bucket)]}_L{lag}"
+        return resolved
+
+    def _build_design(self, df):
+        """
+        TF-IDF/펀더멘털/기술지표 피처를 만들고 변동성 가중치와 Black Swan 필터를 적용한
+        학습용 행렬을 반환합니다. (alpha와 무관하므로 여러 alpha가 공유 가능)
+        """
+        self._load_global_lexicon()
+
+        # 1. Text Features (TF-IDF)
+        X_text = None
+        feature_names = []
+        
+        if self._has_text_features(df):
+            print(f"  Fitting vectorizer (Daily Doc-Term Mode)... (min_df={self.vectorizer.min_df}, min_rel={self.min_relevance})")
+            X_text = self._lagged_text_matrix(df, fit=True)
+            if X_text is not None:
+                feature_names = self._text_vocab_names()
+            else:
+                print("  No tokens found in generator (empty corpus?). Proceeding with Dense only.")
             
         # 2. Dense Features (Fundamentals)
         X_dense_scaled = None
@@ -450,36 +759,22 @@ class LassoLearner:
             }
 
         # 4. Combine Features (with TF-IDF normalization for Lasso fairness)
+        # 텍스트 행렬(CSC, self.dtype)은 복사하지 않고, MaxAbs 스케일과 변동성 가중치는 컬럼 배율로 모아
+        # 필터링 후 최종 학습 행렬(CSC)을 한 번만 만듦
         text_scaler_params = {}
+        dense_parts = [part for part in (X_dense_scaled, X_tech_scaled) if part is not None]
+        if X_text is None and not dense_parts:
+            raise ValueError("No features available for training")
+        X_dense_all = np.hstack(dense_parts) if dense_parts else np.zeros((len(df), 0))
+        text_dim = X_text.shape[1] if X_text is not None else 0
+        n_cols = text_dim + X_dense_all.shape[1]
         
-        # Accumulate all feature parts
-        features_to_stack = []
+        text_scale = None
         if X_text is not None:
-            text_scaler = MaxAbsScaler()
-            X_text_scaled = text_scaler.fit_transform(X_text)
-            text_scaler_params = {"max_abs": text_scaler.max_abs_.tolist()}
-            features_to_stack.append(X_text_scaled)
-            
-        if X_dense_scaled is not None:
-            # Convert to sparse for consistent hstack behavior
-            from scipy import sparse
-            if not sparse.issparse(X_dense_scaled):
-                X_dense_scaled = sparse.csr_matrix(X_dense_scaled)
-            features_to_stack.append(X_dense_scaled)
-            
-        if X_tech_scaled is not None:
-            # Convert to sparse for consistent hstack behavior
-            from scipy import sparse
-            if not sparse.issparse(X_tech_scaled):
-                X_tech_scaled = sparse.csr_matrix(X_tech_scaled)
-            features_to_stack.append(X_tech_scaled)
-            
-        if features_to_stack:
-            X = hstack(features_to_stack).tocsr()
-        else:
-            raise ValueError("No features available for training")
+            max_abs = self._column_max_abs(X_text)
+            text_scaler_params = {"max_abs": max_abs.tolist()}
+            text_scale = np.where(max_abs != 0, max_abs, 1.0)  # MaxAbsScaler와 동일: 0인 컬럼은 그대로
 
-        
         # Store scaler params for prediction
         scaler_params["text"] = text_scaler_params
             
@@ -492,82 +787,49 @@ class LassoLearner:
         
         # Volatility-weighted IDF 및 Black Swan 필터링
         
-        # Feature Names construction
-        feature_names_raw = []
-        if X_text is not None:
-            for lag in range(1, self.lags + 1):
-                feature_names_raw.extend([f"{name}_L{lag}" for name in feature_names])
-                
+        # Feature Names construction (텍스트 이름은 필터 통과 컬럼에 대해서만 생성)
+        dense_feature_names = []
         # Append Dense feature names with prefix '__F_'
         if self.use_fundamentals:
-            dense_feature_names = [f"__F_{c}__" for c in ["per", "pbr", "roe", "log_market_cap"]]
-            feature_names_raw.extend(dense_feature_names)
+            dense_feature_names.extend([f"__F_{c}__" for c in ["per", "pbr", "roe", "log_market_cap"]])
             
         if self.use_tech_indicators:
-            tech_feature_names = [f"__T_{c}__" for c in ["rsi_14", "macd_line", "macd_sig", "macd_hist"]]
-            feature_names_raw.extend(tech_feature_names)
+            dense_feature_names.extend([f"__T_{c}__" for c in ["rsi_14", "macd_line", "macd_sig", "macd_hist"]])
         
         # Volatility Filter
-        weights = np.ones(X.shape[1])
-        keep_indices = list(range(X.shape[1])) # Default keep all
+        weights = np.ones(n_cols)
+        keep_indices = list(range(n_cols)) # Default keep all
+        critical_mask = None
         
         if X_text is not None:
-            text_dim = X_text.shape[1]
-            # Extract Text part for Volatility Calc
-            X_text_part = X[:, :text_dim]
-            
-            # Pass feature_names to filter (Needs stripping _L suffixes)
-            # feature_names_raw has structure "word_L1", "word_L2", etc.
-            # We need the base word.
-            text_feature_names = feature_names_raw[:text_dim]
+            # 텍스트 컬럼은 lag-major 순서 (word_L1 ... word_L1, word_L2 ...)
+            # -> 컬럼별 lag / base word 인덱스를 미리 계산해 이름 파싱 없이 배열 연산으로 처리
+            n_vocab = len(feature_names)
+            column_lag = np.repeat(np.arange(1, self.lags + 1), n_vocab)
+            column_word = np.tile(np.arange(n_vocab), self.lags)
+            critical_mask = self._vocab_mask(feature_names, CRITICAL_WORDS)[column_word]
+            rescue_mask = self._vocab_mask(feature_names, GLOBAL_LEXICON_CACHE)[column_word] if GLOBAL_LEXICON_CACHE else np.zeros(text_dim, dtype=bool)
             
+            # 출현 여부만 보므로 MaxAbs 스케일 전 행렬로 계산해도 동일
             w_text, keep_idx_text = self.calculate_volatility_weights_with_filter(
-                df, X_text_part, 
+                df, X_text, 
                 self.vectorizer.min_df if hasattr(self.vectorizer, 'min_df') else 1,
-                feature_names=text_feature_names
+                critical_mask=critical_mask, rescue_mask=rescue_mask
             )
             
             # Apply Ordered Lasso Decay (Lag Penalty) (TASK-042 + Dynamic Enhancement)
-            # Each feature name is "Word_L{k}"
             # Logic: Scale X by 1/p where p = 1.0 + decay_rate * (lag - 1)
             # This increases the effective L1 penalty for older news:
             # L1_eff = alpha / (1/p) = alpha * p
-            
-            # Dynamic decay rate calculation
-            if self.decay_rate == 'auto':
-                # Calculate optimal decay from data (correlation-based)
-                decay_weights = self._calculate_dynamic_decay(df, self.lags)
-            else:
-                # Use fixed decay rate
-                decay_weights = None
-            
-            for idx in range(text_dim):
-                fname = text_feature_names[idx]
-                try:
-                    # Extract lag number from suffix _L1, _L2...
-                    lag_str = fname.rsplit('_L', 1)[1]
-                    lag_val = int(lag_str)
-                except:
-                    lag_val = 1
-                
-                if decay_weights is not None:
-                    # Dynamic decay from data
-                    decay = decay_weights.get(lag_val, 1.0 / lag_val)
-                else:
-                    # Original fixed decay rate
-                    # Penalty factor increases with lag (p=1.0 for L1, p=1.4 for L2 if decay=0.4)
-                    penalty_factor = 1.0 + self.decay_rate * (lag_val - 1)
-                    decay = 1.0 / penalty_factor
-                
-                # We multiply X by decay (compressing it), which requires a 
-                # stronger weight (beta) to have the same effect on 'y', 
-                # but Lasso sees small values as easier to zero out.
-                w_text[idx] *= decay
+            # We multiply X by decay (compressing it), which requires a 
+            # stronger weight (beta) to have the same effect on 'y', 
+            # but Lasso sees small values as easier to zero out.
+            w_text *= self._lag_decay_vector(df)[column_lag - 1]
 
             # dense indices
             dense_indices = []
             if self.use_fundamentals:
-                dense_indices = list(range(text_dim, X.shape[1]))
+                dense_indices = list(range(text_dim, n_cols))
             
             # Combine
             weights[:text_dim] = w_text
@@ -578,161 +840,270 @@ class LassoLearner:
         self.keep_indices = keep_indices
         self.scaler_params = scaler_params # Store for predict
         
-        # 선택된 피처만 유지
-        X_filtered = X[:, keep_indices]
+        # 선택된 피처만 유지 + 가중치 적용 (celer solvers are much faster with CSC format)
         weights_filtered = weights[keep_indices]
+        X_weighted = self._weighted_design_matrix(X_text, X_dense_all, keep_indices, weights, text_scale)
         
-        # 가중치 적용 (Sparse compatible multiply)
-        # celer solvers are much faster with CSC format
-        from scipy import sparse
-        if not sparse.issparse(X_filtered):
-            # Edge case: X_filtered became dense (e.g., empty keep_indices or numpy conversion)
-            X_filtered = sparse.csc_matrix(X_filtered)
-        X_weighted = X_filtered.tocsc().multiply(weights_filtered).tocsc()
-        
-        print(f"    [Train] Original Features: {X.shape[1]}, Filtered: {X_weighted.shape[1]} (Use Fund: {self.use_fundamentals})")
+        print(f"    [Train] Original Features: {n_cols}, Filtered: {X_weighted.shape[1]} (Use Fund: {self.use_fundamentals}, {self.dtype})")
         
-        # --- Stability Selection (Bootstrap) ---
-        if self.use_stability_selection and X_weighted.shape[1] > 0:
-            print("    [Stability] Running Bootstrap Selection (n=5)...")
-            n_bootstraps = 5
-            sample_fraction = 0.7
-            threshold = 0.6
-            
-            n_samples = X_weighted.shape[0]
-            n_feats = X_weighted.shape[1]
-            stability_counts = np.zeros(n_feats)
-            
-            # Check for critical words indices to force keep
-            force_keep_mask = np.zeros(n_feats, dtype=bool)
-            # feature_names_filtered is available only after we decide strictly? 
-            # We must map current X_weighted cols to names.
-            # feature_names_raw indices were mapped by keep_indices.
-            # So naming aligns with X_weighted columns.
-            
-            current_names = [feature_names_raw[i] for i in keep_indices]
-            for idx, name in enumerate(current_names):
-                base = name.rsplit('_L', 1)[0]
-                if base in CRITICAL_WORDS:
-                    force_keep_mask[idx] = True
-            
-            for b in range(n_bootstraps):
-                # Resample
-                indices = np.random.choice(n_samples, int(n_samples * sample_fraction), replace=False)
-                X_sub = X_weighted[indices]
-                y_sub = y[indices]
-                
-                # Fit
-                if self.use_cv_lasso:
-                    # CV is too slow inside bootstrap, use simple Lasso
-                    sub_model = Lasso(alpha=self.alpha, max_iter=2000)
-                else:
-                    sub_model = Lasso(alpha=self.alpha, max_iter=2000)
-                    
-                sub_model.fit(X_sub, y_sub)
-                stability_counts += (sub_model.coef_ != 0).astype(int)
-                
-            selection_probs = stability_counts / n_bootstraps
-            stable_mask = (selection_probs >= threshold) | force_keep_mask
+        kept = np.asarray(keep_indices, dtype=np.int64)
+        is_text = kept < text_dim
+        kept_names = [
+            f"{self._text_feature_name(feature_names, column_word[i])}_L{column_lag[i]}" if i < text_dim else dense_feature_names[i - text_dim]
+            for i in keep_indices
+        ]
+        kept_critical = np.zeros(len(kept), dtype=bool)
+        if critical_mask is not None:
+            kept_critical[is_text] = critical_mask[kept[is_text]]
+        return {
+            "X": X_weighted,
+            "y": y,
+            "feature_names": kept_names,
+            "weights": weights_filtered,
+            "scaler_params": scaler_params,
+            "critical_mask": kept_critical,
+        }
+
+    @staticmethod
+    def _load_global_lexicon():
+        # Load Global Lexicon for rescue (Only once per session/instance if needed)
+        global GLOBAL_LEXICON_CACHE
+        if not GLOBAL_LEXICON_CACHE:
+            try:
+                with get_db_cursor() as cur:
+                    cur.execute("SELECT word FROM tb_global_lexicon WHERE impact_score > 0.02") # 2% Threshold
+                    rows = cur.fetchall()
+                    GLOBAL_LEXICON_CACHE = {row['word'] for row in rows}
+                    if GLOBAL_LEXICON_CACHE:
+                        print(f"    [Global] Rescued Lexicon loaded: {len(GLOBAL_LEXICON_CACHE)} words found.")
+            except Exception as e:
+                print(f"    [Global] Warning: Could not load global lexicon: {e}")
+
+    @staticmethod
+    def _column_max_abs(X):
+        """CSC 행렬의 컬럼별 최대 절댓값 (MaxAbsScaler.max_abs_와 동일, 스케일된 복사본을 만들지 않음)"""
+        max_abs = np.zeros(X.shape[1], dtype=np.float64)
+        nonempty = np.flatnonzero(np.diff(X.indptr))
+        if len(nonempty):
+            max_abs[nonempty] = np.maximum.reduceat(np.abs(X.data), X.indptr[nonempty])
+        return max_abs
+
+    def _weighted_design_matrix(self, X_text, X_dense, keep_indices, weights, text_scale):
+        """
+        keep_indices 컬럼에 (가중치 / MaxAbs 스케일)을 곱한 학습 행렬을 self.dtype CSC로 한 번에 만듭니다.
+        텍스트 컬럼은 X_text(CSC)의 컬럼 구간을 gather, dense 컬럼(0은 제외)은 뒤에 이어 붙임.
+        """
+        kept = np.asarray(keep_indices, dtype=np.int64)
+        text_dim = X_text.shape[1] if X_text is not None else 0
+        kept_text = kept[kept < text_dim]
+        kept_dense = kept[kept >= text_dim] - text_dim
+        n_rows = X_text.shape[0] if X_text is not None else X_dense.shape[0]
+
+        dense = X_dense[:, kept_dense] * weights[kept_dense + text_dim]
+        dense_rows, dense_cols = np.nonzero(dense.T)  # 컬럼 순서 (CSC)
+        dense_lengths = np.bincount(dense_rows, minlength=len(kept_dense))
+
+        if len(kept_text):
+            starts = X_text.indptr[kept_text]
+            text_lengths = (X_text.indptr[kept_text + 1] - starts).astype(np.int64)
+        else:
+            starts = text_lengths = np.zeros(0, dtype=np.int64)
+        n_text = int(text_lengths.sum())
+
+        indptr = np.zeros(len(kept) + 1, dtype=np.int64)
+        np.cumsum(np.concatenate([text_lengths, dense_lengths]), out=indptr[1:])
+        data = np.empty(indptr[-1], dtype=self.dtype)
+        indices = np.empty(indptr[-1], dtype=np.int32 if n_rows < 2 ** 31 else np.int64)
+
+        if n_text:
+            # 컬럼별 data 구간을 하나의 gather 인덱스로 이어 붙임
+            gather = np.repeat(starts - indptr[:len(kept_text)], text_lengths) + np.arange(n_text)
+            np.take(X_text.data, gather, out=data[:n_text])
+            np.take(X_text.indices, gather, out=indices[:n_text])
+            data[:n_text] *= np.repeat((weights[kept_text] / text_scale[kept_text]).astype(self.dtype), text_lengths)
+        data[n_text:] = dense.T[dense_rows, dense_cols]
+        indices[n_text:] = dense_cols
+        return sparse.csc_matrix((data, indices, indptr), shape=(n_rows, len(kept)))
+
+    def _text_vocab_names(self):
+        """텍스트 컬럼(lag 1개분)의 어휘. hashing 엔진은 활성 해시 버킷 인덱스 (이름 없음)"""
+        if self.text_engine == 'hashing':
+            return self.vectorizer.active_buckets_
+        return np.asarray(self.vectorizer.get_feature_names_out(), dtype=object)
+
+    def _text_feature_name(self, vocab, word_idx):
+        # 해시 버킷은 '#<bucket>'으로 두고 학습 후 0이 아닌 계수만 토큰으로 역매핑 (_coef_to_dict)
+        return f"#{vocab[word_idx]}" if self.text_engine == 'hashing' else vocab[word_idx]
+
+    def _vocab_mask(self, vocab, words):
+        if self.text_engine == 'hashing':
+            return self.vectorizer.bucket_mask(words)[vocab]
+        return np.isin(vocab, list(words))
+
+    def _has_text_features(self, df):
+        return "news_idx_L1" in df.columns or any(f"news_lag{i}" in df.columns for i in range(1, self.lags + 1))
+
+    def _lagged_text_matrix(self, df, fit=False):
+        """
+        lag별 TF-IDF 행렬을 lag-major 순서로 hstack하여 CSC (self.dtype)로 반환합니다. (텍스트가 없으면 None)
+        - prepare_features 출력 (news_idx_L{k} + self.daily_news): 거래일별 문서를 한 번만 transform한
+          일별 doc-term 행렬에서 lag마다 행을 골라(row-shift) 구성
+        - 레거시 입력 (news_lag{k} 토큰 리스트 컬럼): lag별 transform
+        fit=True이면 vectorizer를 (행 x lag) 문서 기준으로 학습 (min_df/max_df 의미 유지)
+        """
+        if "news_idx_L1" in df.columns:
+            raw_idx = []
+            for i in range(1, self.lags + 1):
+                col = f"news_idx_L{i}"
+                raw_idx.append(df[col].to_numpy() if col in df.columns else np.full(len(df), -1))
+            # 이 프레임이 참조하는 일별 문서만 꺼내 변환 (daily_news는 전체 기간일 수 있음)
+            used = np.unique(np.concatenate(raw_idx)) if raw_idx else np.zeros(0, dtype=np.int64)
+            used = used[used >= 0]
+            docs = [t if t is not None else [] for t in self.daily_news.gather(used).to_list()] if self.daily_news is not None and len(used) else []
+            empty_row = len(docs)
+            lag_idx = [np.where(idx >= 0, np.searchsorted(used, idx), empty_row) for idx in raw_idx]
             
-            # Refit on stable features only (Relaxed Lasso)
-            # We only keep columns where stable_mask is True
-            stable_indices_local = np.where(stable_mask)[0]
+            daily = None
+            if fit:
+                self._fit_docs = lambda: iter(docs)
+                try:
+                    if self.incremental_df and self.daily_news_dates is not None and lag_idx:
+                        keys = self.daily_news_dates.gather(used).to_list() if len(used) else []
+                        daily = self._incremental_daily_matrix(keys, docs, lag_idx)
+                    else:
+                        self.vectorizer, daily = self._fit_daily_matrix(self.vectorizer, docs, lag_idx)
+                except ValueError:
+                    return None
             
-            if len(stable_indices_local) == 0:
-                print("    [Stability] Warning: No features survived stability selection. Reverting to all.")
-                self.model.fit(X_weighted, y)
-            else:
-                X_stable = X_weighted[:, stable_indices_local]
-                print(f"    [Stability] {len(stable_indices_local)}/{n_feats} features selected.")
-                self.model.fit(X_stable, y)
-                
-                # Expand coefs back to X_weighted size (filling zeros)
-                full_coefs = np.zeros(n_feats)
-                full_coefs[stable_indices_local] = self.model.coef_
-                self.model.coef_ = full_coefs
-                # Hack: intercept might be different, but for dictionary we care about coefs.
-                
-        else:
-            self.model.fit(X_weighted, y)
+            if daily is None:
+                daily = self.vectorizer.transform(docs + [[]]).tocsr()
+            daily = daily.astype(self.dtype, copy=False)
+            # lag 블록별로 행을 골라 CSC로 바꾼 뒤 이어 붙임 (CSC끼리의 hstack은 배열 연결만 함)
+            return hstack([daily[idx].tocsc() for idx in lag_idx], format="csc")
+
+        # Legacy: lag별 토큰 리스트 컬럼
+        def lag_docs(i):
+            col_name = f"news_lag{i}"
+            if col_name not in df.columns:
+                return [[]] * len(df)
+            return [[str(t) for t in tokens if t is not None] if tokens is not None else [] for tokens in df[col_name]]
         
-        # 결과 저장용 사전 생성
-        feature_names_filtered = [feature_names_raw[i] for i in keep_indices]
+        if fit:
+            def token_generator():
+                for i in range(1, self.lags + 1):
+                    if f"news_lag{i}" in df.columns:
+                        yield from lag_docs(i)
+            self._fit_docs = token_generator
+            try:
+                self.vectorizer.fit(token_generator())
+            except ValueError:
+                return None
+        return hstack([self.vectorizer.transform(lag_docs(i)).astype(self.dtype, copy=False).tocsc() for i in range(1, self.lags + 1)], format="csc")
+
+    def _fit_daily_matrix(self, vectorizer, docs, lag_idx):
+        """(행 x lag) 문서 전체로 vectorizer를 학습하고 일별 행렬(마지막 행 = 빈 문서)을 반환합니다."""
+        empty_row = len(docs)
+        if self.text_engine == 'hashing':
+            # 일별 문서를 한 번만 해싱하고 DF는 참조 횟수로 가중 누적
+            ref_counts = np.bincount(np.concatenate(lag_idx), minlength=empty_row + 1) if lag_idx else None
+            return vectorizer, vectorizer.fit_transform(docs + [[]], doc_counts=ref_counts).tocsr()
+        # 같은 일별 문서를 참조 횟수만큼 yield (리스트 복사 없음) -> 기존 lag 컬럼 학습과 동일한 DF 통계
+        def doc_generator():
+            for idx in lag_idx:
+                for j in idx:
+                    yield docs[j] if j < empty_row else []
+        vectorizer.fit(doc_generator())
+        return vectorizer, None
+
+    def _incremental_daily_matrix(self, keys, docs, lag_idx):
+        """
+        슬롯별 SlidingDocumentFrequency로 들어온/빠진 날짜만 DF/TF에 반영하고,
+        캐시된 일별 count 행으로 TF-IDF 행렬을 만듭니다 (전체 재학습과 같은 어휘/IDF).
+        """
+        empty_row = len(docs)
+        ref_counts = np.bincount(np.concatenate(lag_idx), minlength=empty_row + 1)
+        if self._doc_term_cache is None:
+            self._doc_term_cache = DocTermCache(self.vectorizer.hasher if self.text_engine == 'hashing' else None)
+        window = self._df_windows.get(self.train_slot)
+        if window is None:
+            window = self._df_windows[self.train_slot] = SlidingDocumentFrequency(self._doc_term_cache)
         
-        sentiment_dict = {}
-        stock_names = []
-        if stock_code:
-            # We already have stock_code, no need to fetch name just to get aliases
-            # get_stock_aliases will now prioritize stock_code lookups in the JSON map.
-            # However, for safety and fallback (if JSON not ready), we still fetch the name.
-            with get_db_cursor() as cur:
-                cur.execute("SELECT stock_name FROM tb_stock_master WHERE stock_code = %s", (stock_code,))
-                row = cur.fetchone()
-                if row:
-                    raw_name = row['stock_name']
-                    if raw_name:
-                        stock_names = get_stock_aliases(raw_name, stock_code)
+        entries = window.update(keys, docs, ref_counts[:empty_row], n_empty=ref_counts[empty_row])
+        self._doc_term_cache.retain(e for w in self._df_windows.values() for e in w.weights)
+        counts = self._doc_term_cache.matrix(entries)
+        counts = vstack([counts, csr_matrix((1, counts.shape[1]), dtype=counts.dtype)]).tocsr()  # 마지막 행 = 빈 문서
         
-        for idx, (name, coef) in enumerate(zip(feature_names_filtered, self.model.coef_)):
-            if coef != 0:
-                # Filter out stock name related keywords (Text only)
-                if not name.startswith("__F_"):
-                    base_name = name.rsplit('_L', 1)[0]
-                    if base_name in stock_names:
-                        continue
-                
-                # Recover Real Beta: Beta_Real = Beta_Model * Weight
-                # X_w = X * W
-                # y = X_w * B_m = X * (W * B_m)
-                real_beta = coef * weights_filtered[idx]
-                sentiment_dict[name] = float(real_beta)
-                
-        # Return Dict AND Scaler Params
-        return sentiment_dict, scaler_params
+        if self.text_engine == 'hashing':
+            self.vectorizer.load_stats(*window.stats())
+            daily = self.vectorizer.transform_counts(counts)
+        else:
+            vocabulary, idf, kept = window.tfidf_vocabulary(self.min_df, 0.85, self.max_features)
+            self.vectorizer = self._make_vectorizer(vocabulary=vocabulary)
+            self.vectorizer.idf_ = idf
+            daily = counts[:, kept].tocsr()
+            daily.data *= idf[daily.indices]
+            daily = normalize(daily, norm="l2", copy=False)
+        daily = daily.astype(self.dtype, copy=False)
+        print(f"    [IncrementalDF] {self.train_slot}: {window.last_delta}/{len(entries)} days updated (cache: {len(self._doc_term_cache)} rows)")
+        
+        if INCREMENTAL_DF_VERIFY:
+            daily = self._verify_incremental_df(docs, lag_idx, daily)
+        return daily
+
+    def _verify_incremental_df(self, docs, lag_idx, daily):
+        """증분 DF 결과를 전체 재학습과 비교하고, 다르면 전체 재학습 결과로 대체합니다."""
+        full_vectorizer, full = self._fit_daily_matrix(self._make_vectorizer(), docs, lag_idx)
+        if full is None:
+            full = full_vectorizer.transform(docs + [[]]).tocsr()
+        same = (
+            list(full_vectorizer.get_feature_names_out()) == list(self.vectorizer.get_feature_names_out())
+            and full.shape == daily.shape
+            and abs(full - daily).max() < max(1e-9, 10 * np.finfo(self.dtype).eps)
+        )
+        if not same:
+            print(f"    [IncrementalDF] Warning: mismatch vs full recompute for {self.train_slot}. Using full recompute.")
+            self.vectorizer = full_vectorizer
+            return full
+        return daily
 
-    def calculate_volatility_weights_with_filter(self, df, X, min_df, feature_names=None):
+    def calculate_volatility_weights_with_filter(self, df, X, min_df, feature_names=None, critical_mask=None, rescue_mask=None):
         """
         변동성 가중치를 계산하고, 희소 단어 중 'Black Swan' (고변동성) 단어만 살려냅니다.
-        feature_names: 리스트, 각 컬럼의 피처 이름 (ex: "word_L1")
+        feature_names: 리스트, 각 컬럼의 피처 이름 (ex: "word_L1") - 마스크가 없을 때만 사용
+        critical_mask / rescue_mask: 컬럼별 CRITICAL_WORDS / GLOBAL_LEXICON_CACHE 포함 여부 (bool 배열)
         """
         y_abs = np.abs(df["excess_return"].cast(pl.Float64).to_numpy())
-        word_presence = (X > 0).astype(float)
-        
-        vol_sum = word_presence.T.dot(y_abs)
-        word_count = np.array(word_presence.sum(axis=0)).flatten()
+        # 출현(값 > 0) 항목만 컬럼별로 집계 (presence 행렬 복사본 없이 CSC 구조에서 바로 계산)
+        X = X if sparse.isspmatrix_csc(X) else sparse.csc_matrix(X)
+        present = X.data > 0
+        present_cols = np.repeat(np.arange(X.shape[1]), np.diff(X.indptr))[present]
+        vol_sum = np.bincount(present_cols, weights=y_abs[X.indices[present]], minlength=X.shape[1])
+        word_count = np.bincount(present_cols, minlength=X.shape[1]).astype(np.float64)
         
         # 변동성 가중치 = 해당 단어가 나타난 날들의 평균 절대 수익률
         weights = np.divide(vol_sum, word_count, out=np.zeros_like(vol_sum), where=word_count!=0)
         
+        if critical_mask is None or rescue_mask is None:
+            base_words = [fname.rsplit('_L', 1)[0] for fname in feature_names] if feature_names else [None] * len(weights)
+            if critical_mask is None:
+                critical_mask = np.array([w in CRITICAL_WORDS for w in base_words], dtype=bool)
+            if rescue_mask is None:
+                rescue_mask = np.array([w in GLOBAL_LEXICON_CACHE for w in base_words], dtype=bool)
+        
         # 필터링 조건:
         # 1. 빈도가 min_df 이상인 단어
         # 2. 빈도가 낮더라도 변동성 가중치가 상위 10%이거나 평균의 2배 이상인 단어 (Black Swan)
         # 3. CRITICAL_WORDS에 포함된 단어 (Hybrid Lexicon Anchor)
         avg_vol = np.mean(weights[weights > 0]) if np.any(weights > 0) else 0
         
-        keep_indices = []
-        for i in range(len(weights)):
-            count = word_count[i]
-            vol = weights[i]
-            
-            # Check Critical Word or Global Lexicon (Strip _L suffix)
-            is_critical = False
-            is_global_rescue = False
-            if feature_names:
-                fname = feature_names[i]
-                base_word = fname.rsplit('_L', 1)[0]
-                if base_word in CRITICAL_WORDS:
-                    is_critical = True
-                if base_word in GLOBAL_LEXICON_CACHE:
-                    is_global_rescue = True
-
-            if count >= min_df:
-                keep_indices.append(i)
-            elif count > 0 and (vol > avg_vol * 2.0 or is_critical or is_global_rescue): # Black Swan/Global Rescue
-                keep_indices.append(i)
-                if is_critical or is_global_rescue:
-                     # Critical/Global words get a weight boost to ensure visibility if they are rare
-                     weights[i] = max(weights[i], avg_vol * 2.0)
+        rescued = critical_mask | rescue_mask
+        frequent = word_count >= min_df
+        black_swan = ~frequent & (word_count > 0) & ((weights > avg_vol * 2.0) | rescued) # Black Swan/Global Rescue
+        
+        # Critical/Global words get a weight boost to ensure visibility if they are rare
+        boost = black_swan & rescued
+        weights[boost] = np.maximum(weights[boost], avg_vol * 2.0)
+        keep_indices = np.flatnonzero(frequent | black_swan).tolist()
         
         # 가중치 정규화 (평균 1.0)
         if np.mean(weights) > 0:
@@ -742,6 +1113,17 @@ class LassoLearner:
             
         return weights, keep_indices
 
+    def _lag_decay_vector(self, df):
+        """lag(1..lags)별 감쇠 계수 배열. index 0 = L1"""
+        lags = np.arange(1, self.lags + 1)
+        if self.decay_rate == 'auto':
+            # Calculate optimal decay from data (correlation-based)
+            decay_weights = self._calculate_dynamic_decay(df, self.lags)
+            return np.array([decay_weights.get(int(l), 1.0 / l) for l in lags])
+        # Original fixed decay rate
+        # Penalty factor increases with lag (p=1.0 for L1, p=1.4 for L2 if decay=0.4)
+        return 1.0 / (1.0 + self.decay_rate * (lags - 1))
+
     def _calculate_dynamic_decay(self, df, max_lag: int) -> dict:
         """
         동적 감쇠율 계산: 각 lag별로 뉴스 영향력과 수익률의 상관관계를 분석
@@ -831,6 +1213,38 @@ class LassoLearner:
                     meta.get('is_active', False),
                     meta.get('use_sector_beta', False)
                 ))
+                if SAVE_MODEL_ARTIFACT:
+                    self._save_artifact(cur, sentiment_dict, version, stock_code, source, meta)
+
+    def build_artifact(self, sentiment_dict, scaler_params=None, meta=None):
+        """학습 결과 사전 -> 추론용 바이너리 artifact (재학습/사전 행 조회 없이 로드 가능)"""
+        return ModelArtifact.from_dict(sentiment_dict, scaler_params=scaler_params, lags=self.lags, meta={
+            'alpha': self.alpha,
+            'engine': self.engine,
+            'text_engine': self.text_engine,
+            'n_gram': self.n_gram,
+            'decay_rate': self.decay_rate,
+            'train_start_date': (meta or {}).get('train_start_date'),
+            'train_end_date': (meta or {}).get('train_end_date'),
+        })
+
+    def _save_artifact(self, cur, sentiment_dict, version, stock_code, source, meta):
+        artifact = self.build_artifact(sentiment_dict, meta.get('metrics', {}).get('scaler'), meta)
+        # 마이그레이션 전 DB에서도 사전 저장은 성공하도록 savepoint 안에서 실행
+        cur.execute("SAVEPOINT model_artifact")
+        try:
+            cur.execute("""
+                INSERT INTO tb_model_artifact (stock_code, version, source, format_version, payload)
+                VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (stock_code, version, source) DO UPDATE SET
+                format_version = EXCLUDED.format_version,
+                payload = EXCLUDED.payload,
+                created_at = CURRENT_TIMESTAMP
+            """, (stock_code, version, source, ARTIFACT_FORMAT_VERSION, artifact.to_bytes()))
+            cur.execute("RELEASE SAVEPOINT model_artifact")
+        except Exception as e:
+            cur.execute("ROLLBACK TO SAVEPOINT model_artifact")
+            print(f"    [Artifact] Warning: Could not save model artifact for {stock_code} {version} ({source}): {e}")
 
     def predict(self, df):
         """
@@ -838,15 +1252,7 @@ class LassoLearner:
         DF는 prepare_features를 거친 상태여야 함 (Dense 포함)
         """
         # 1. Text Features
-        X_list = []
-        for i in range(1, self.lags + 1):
-             if f"news_lag{i}" in df.columns:
-                X_lag = self.vectorizer.transform(df[f"news_lag{i}"].to_list())
-             else:
-                X_lag = self.vectorizer.transform([[]] * len(df))
-             X_list.append(X_lag)
-        
-        X_text = hstack(X_list).tocsr()
+        X_text = self._lagged_text_matrix(df, fit=False)
         
         # 2. Dense Features
         if self.use_fundamentals and hasattr(self, 'scaler_params') and self.scaler_params:
@@ -875,7 +1281,10 @@ class LassoLearner:
             
         return self.model.predict(X)
 
-    def run_training(self, stock_code, start_date, end_date, version=None, source='Main', is_active=True, prefetched_df_news=None, alpha=None, lags=None):
+    def run_training(self, stock_code, start_date, end_date, version=None, source='Main', is_active=True, prefetched_df_news=None, alpha=None, lags=None, persist=None):
+        """
+        persist: DB 저장 여부. None이면 registry가 없을 때만 저장 (registry가 있으면 항상 registry에 보관)
+        """
         if alpha is not None:
             self.alpha = float(alpha)
             if hasattr(self.model, 'alpha'):
@@ -890,17 +1299,58 @@ class LassoLearner:
             return None
             
         df = self.prepare_features(df_prices, df_news, df_fund)
+        self.train_slot = (stock_code, source)
         sentiment_dict, scaler_params = self.train(df, stock_code=stock_code)
         
         if version is None:
             version = datetime.now().strftime("%Y%m%d_%H%M")
             
+        meta = self._training_meta(start_date, end_date, sentiment_dict, scaler_params, is_active)
+        self._store_dict(sentiment_dict, version, stock_code, source, meta, is_active, persist)
+        print(f"Training completed for {stock_code}. {len(sentiment_dict)} words + factors saved (version: {version}, active: {is_active}).")
+        return sentiment_dict
+
+    def run_training_path(self, stock_code, start_date, end_date, alphas, versions, source='Main', is_active=True, prefetched_df_news=None, persist=None):
+        """
+        여러 alpha를 한 번의 데이터 조회/피처 생성과 warm start path 학습으로 처리합니다.
+        versions: {alpha: version} - alpha별 사전 저장 버전
+        Returns: {alpha: sentiment_dict} (데이터 부족 시 None)
+        """
+        df_prices, df_news, df_fund = self.fetch_data(stock_code, start_date, end_date, prefetched_df_news=prefetched_df_news)
+        if df_prices is None or len(df_prices) < 3:
+            print(f"Insufficient data for {stock_code} in range {start_date}~{end_date}")
+            return None
+            
+        df = self.prepare_features(df_prices, df_news, df_fund)
+        self.train_slot = (stock_code, source)
+        dicts, scaler_params = self.train_path(df, alphas, stock_code=stock_code)
+        
+        for idx, a in enumerate(alphas):
+            meta = self._training_meta(start_date, end_date, dicts[a], scaler_params, is_active)
+            # deactivate는 첫 alpha에서만 (이후 alpha가 앞선 alpha를 비활성화하지 않도록)
+            self._store_dict(dicts[a], versions[a], stock_code, source, meta, is_active and idx == 0, persist)
+        print(f"Path training completed for {stock_code}. {len(alphas)} alphas saved ({source}, active: {is_active}).")
+        return dicts
+
+    def _store_dict(self, sentiment_dict, version, stock_code, source, meta, deactivate_others, persist):
+        """registry(백테스트)와 DB 중 저장 위치를 결정합니다."""
+        if self.registry is not None:
+            self.registry.put(stock_code, version, source, sentiment_dict, meta['metrics'])
+        if persist is None:
+            persist = self.registry is None
+        if not persist:
+            return
+        if deactivate_others:
+            self.deactivate_all_versions(stock_code, source)
+        self.save_dict(sentiment_dict, version, stock_code, source=source, meta=meta)
+
+    def _training_meta(self, start_date, end_date, sentiment_dict, scaler_params, is_active):
         # 메타데이터 구성 (AWO 등을 위해 개월수 계산)
         s_dt = datetime.strptime(start_date, '%Y-%m-%d')
         e_dt = datetime.strptime(end_date, '%Y-%m-%d')
         lookback_months = (e_dt.year - s_dt.year) * 12 + (e_dt.month - s_dt.month)
         
-        meta = {
+        return {
             'lookback_months': lookback_months,
             'train_start_date': start_date,
             'train_end_date': end_date,
@@ -911,13 +1361,6 @@ class LassoLearner:
             'is_active': is_active,
             'use_sector_beta': self.use_sector_beta
         }
-        
-        if is_active:
-            self.deactivate_all_versions(stock_code, source)
-
-        self.save_dict(sentiment_dict, version, stock_code, source=source, meta=meta)
-        print(f"Training completed for {stock_code}. {len(sentiment_dict)} words + factors saved (version: {version}, active: {is_active}).")
-        return sentiment_dict
 
     def deactivate_all_versions(self, stock_code, source):
         with get_db_cursor() as cur:
@@ -937,6 +1380,8 @@ class LassoLearner:
     def find_optimal_lag(self, stock_code, start_date, end_date, max_lag=5):
         """
         1부터 max_lag까지 시차를 변경하며 검증 성능이 가장 좋은 시차를 찾습니다.
+        데이터 조회/피처 생성은 max_lag 기준으로 한 번만 하고, lag k는 news_idx_L1..Lk 컬럼 블록만 사용해
+        (lag별 vectorizer/필터/모델은 각각 학습) 후보 lag를 병렬 평가합니다.
         """
         best_lag = 1
         best_score = -np.inf
@@ -946,39 +1391,39 @@ class LassoLearner:
         # 원본 lags 저장
         original_lags = self.lags
         
-        for lag in range(1, max_lag + 1):
-            self.lags = lag
-            df_prices, df_news, df_fund = self.fetch_data(stock_code, start_date, end_date)
-            if df_prices is None or len(df_prices) < 10:
-                continue
-                
+        self.lags = max_lag
+        df_prices, df_news, df_fund = self.fetch_data(stock_code, start_date, end_date)
+        df = None
+        if df_prices is not None and len(df_prices) >= 10:
             df = self.prepare_features(df_prices, df_news, df_fund)
-            if len(df) < 5:
-                continue
-                
+        
+        if df is not None and len(df) >= 5:
             # 간단한 시계열 교차 검증 (마지막 20%를 테스트로 사용)
             split_idx = int(len(df) * 0.8)
             df_train = df.head(split_idx)
             df_test = df.tail(len(df) - split_idx)
             
-            try:
-                # Train returns tuple now, but we just need side-effects (self.model, self.scaler_params)
-                self.train(df_train, stock_code=stock_code)
-                y_true = df_test["excess_return"].cast(pl.Float64).to_numpy()
-                y_pred = self.predict(df_test)
-                
-                # 방향성 정확도(Directional Accuracy) 기준
-                y_true_dir = (y_true > 0).astype(int)
-                y_pred_dir = (y_pred > 0).astype(int)
-                score = np.mean(y_true_dir == y_pred_dir)
-                
+            candidates = list(range(1, max_lag + 1))
+            workers = self._lag_search_pool_size(len(candidates))
+            print(f"  Evaluating lags {candidates} on one max-lag feature frame (workers={workers})")
+            if workers <= 1:
+                results = [_evaluate_lag(lag, self, df_train, df_test) for lag in candidates]
+            else:
+                self._load_global_lexicon()
+                settings, state = self._worker_settings()
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                         initializer=_init_lag_worker,
+                                         initargs=(settings, state, GLOBAL_LEXICON_CACHE, df_train, df_test)) as pool:
+                    results = list(pool.map(_evaluate_lag, candidates))
+            
+            for lag, score, error in results:
+                if error is not None:
+                    print(f"  Error testing lag {lag}: {error}")
+                    continue
                 print(f"  Lag {lag}: Directional Accuracy = {score:.4f}")
-                
                 if score > best_score:
                     best_score = score
                     best_lag = lag
-            except Exception as e:
-                print(f"  Error testing lag {lag}: {e}")
                 
         self.lags = original_lags
         print(f"Optimal lag for {stock_code} is {best_lag} (Acc: {best_score:.4f})")
@@ -1011,6 +1456,11 @@ class LassoLearner:
             print(f"[NeutralWords] Model not trained yet for {stock_code}")
             return []
         
+        if self.text_engine == 'hashing':
+            # 해시 버킷은 여러 토큰이 공유할 수 있어 '중립 단어'로 단정할 수 없음
+            print(f"[NeutralWords] Skipped for hashing text engine ({stock_code})")
+            return []
+        
         try:
             feature_names = self.vectorizer.get_feature_names_out()
             coefs = self.model.coef_
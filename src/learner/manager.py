@@ -44,9 +44,11 @@ class AnalysisManager:
         # 주가와 정보가 모두 일정 기간 이상 있어야 함
         return (days_span >= days_needed - 10 and news_days >= days_needed * 0.5), days_span
 
-    def run_daily_update(self, v_job_id=None):
+    def run_daily_update(self, v_job_id=None, target=None, prefetched_df_news=None):
         """
         매일 실행되는 버퍼 사전 업데이트 (최근 7일)
+        target: 이미 조회한 daily_targets 행 (BatchTrainer), 없으면 DB에서 조회
+        prefetched_df_news: 토큰화된 뉴스 ('date', 'tokens') - 있으면 뉴스 조회/토큰화 생략
         """
         if v_job_id:
             logger.info(f"Connecting Daily Update (Job #{v_job_id}) to DB...")
@@ -55,12 +57,7 @@ class AnalysisManager:
         logger.info(f"Running daily buffer update for {self.stock_code}")
         
         # [MEMORY_OPT] Check for Golden Parameters for Lightweight Retraining (TASK-046)
-        with get_db_cursor() as cur:
-            cur.execute("""
-                SELECT optimal_lag, optimal_window_months, optimal_alpha, model_type 
-                FROM daily_targets WHERE stock_code = %s
-            """, (self.stock_code,))
-            row = cur.fetchone()
+        row = target if target is not None else self.fetch_target_params(self.stock_code)
         
         end_date = datetime.now().date()
         
@@ -87,7 +84,8 @@ class AnalysisManager:
                 version="daily_main_light",
                 source="Main",
                 alpha=alpha,
-                lags=lag
+                lags=lag,
+                prefetched_df_news=prefetched_df_news
             )
             
             # 2. Daily Buffer Update (7 days)
@@ -99,7 +97,8 @@ class AnalysisManager:
                 version="daily_buffer_light",
                 source="Buffer",
                 alpha=alpha,
-                lags=lag
+                lags=lag,
+                prefetched_df_news=prefetched_df_news
             )
             logger.info(f"  [v] Lightweight Retraining completed in seconds for {self.stock_code}")
         else:
@@ -111,7 +110,8 @@ class AnalysisManager:
                 start_date.strftime('%Y-%m-%d'), 
                 end_date.strftime('%Y-%m-%d'), 
                 version="daily_buffer", 
-                source="Buffer"
+                source="Buffer",
+                prefetched_df_news=prefetched_df_news
             )
         
         if v_job_id:
@@ -119,6 +119,16 @@ class AnalysisManager:
             
         return True
 
+    @staticmethod
+    def fetch_target_params(stock_code):
+        """daily_targets의 Golden Params (AWO 스캔 결과) 조회"""
+        with get_db_cursor() as cur:
+            cur.execute("""
+                SELECT stock_code, optimal_lag, optimal_window_months, optimal_alpha, model_type 
+                FROM daily_targets WHERE stock_code = %s
+            """, (stock_code,))
+            return cur.fetchone()
+
     def run_full_pipeline(self, v_job_id=None):
         """
         1. 데이터 확인
@@ -202,13 +212,16 @@ class AnalysisManager:
     def _save_verification_results(self, v_job_id, results):
         """상세 결과를 DB에 저장"""
         from src.db.connection import get_db_cursor
+        from psycopg2.extras import execute_values
+        if not results:
+            return
+        rows = [(v_job_id, r['date'], r['sentiment_score'], r['actual_alpha'], r['is_correct'], 'WF_CHECK') for r in results]
         with get_db_cursor() as cur:
-            for r in results:
-                cur.execute("""
-                    INSERT INTO tb_verification_results 
-                    (v_job_id, target_date, predicted_score, actual_alpha, is_correct, used_version)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """, (v_job_id, r['date'], r['sentiment_score'], r['actual_alpha'], r['is_correct'], 'WF_CHECK'))
+            execute_values(cur, """
+                INSERT INTO tb_verification_results 
+                (v_job_id, target_date, predicted_score, actual_alpha, is_correct, used_version)
+                VALUES %s
+            """, rows, page_size=len(rows))
 
     def _update_job_status(self, v_job_id, status, progress, summary=None):
         import json
@@ -0,0 +1,166 @@
+# src/learner/model_artifact.py
+"""
+Self-contained binary model artifact (tb_model_artifact).
+
+A trained dictionary is stored once as word rows in tb_sentiment_dict (dashboard
+queries, history) and once as a single versioned blob next to its
+tb_sentiment_dict_meta row, so Predictor can load a whole model with one query
+instead of reading tens of thousands of word rows.
+
+Layout (little-endian):
+
+    b"NSTM" | uint32 format_version | uint32 header_len | header JSON | arrays
+
+The header holds lags, scaler params, dense feature names, learner settings and
+{name: [dtype, offset, length]} for each array. Arrays start at 8-byte aligned
+offsets, so from_bytes() returns np.frombuffer views over the blob (zero copy):
+
+- vocab_offsets / vocab_bytes: sorted base words as one UTF-8 string table
+- kept:  text columns in the lag-major layout, (lag - 1) * n_vocab + word_idx
+- beta:  real beta (coef * weight) per kept column
+- dense_beta: betas of the __F_ / __T_ features (order = header dense_names)
+"""
+import json
+import struct
+import numpy as np
+
+ARTIFACT_MAGIC = b"NSTM"
+ARTIFACT_FORMAT_VERSION = 1
+_PREFIX = struct.Struct("<4sII")
+_ALIGN = 8
+
+
+def _split_lag(name):
+    """'word_L3' -> ('word', 3). 재조립 시 같은 이름이 되지 않으면 dense 피처로 취급 (None)"""
+    base, sep, lag_str = name.rpartition('_L')
+    if sep and base and lag_str.isdigit() and str(int(lag_str)) == lag_str and int(lag_str) > 0:
+        return base, int(lag_str)
+    return None
+
+
+class ModelArtifact:
+    def __init__(self, vocab_offsets, vocab_bytes, kept, beta, lags,
+                 dense_names=None, dense_beta=None, scaler_params=None, meta=None):
+        self.vocab_offsets = vocab_offsets
+        self.vocab_bytes = vocab_bytes
+        self.kept = kept
+        self.beta = beta
+        self.lags = int(lags)
+        self.dense_names = list(dense_names or [])
+        self.dense_beta = dense_beta if dense_beta is not None else np.zeros(0, dtype=np.float64)
+        self.scaler_params = scaler_params or {}
+        self.meta = meta or {}
+        self._words = None
+
+    @classmethod
+    def from_dict(cls, sentiment_dict, scaler_params=None, lags=None, meta=None):
+        """{word_L{k}: beta, __F_col__: beta, ...} 사전으로 artifact 생성"""
+        text, dense = {}, {}
+        for name, beta in sentiment_dict.items():
+            parsed = _split_lag(name)
+            if parsed is None:
+                dense[name] = float(beta)
+            else:
+                text[parsed] = float(beta)
+
+        words = sorted({w for w, _ in text})
+        word_idx = {w: i for i, w in enumerate(words)}
+        max_lag = max((lag for _, lag in text), default=0)
+        lags = max(int(lags or 0), max_lag)
+
+        encoded = [w.encode("utf-8") for w in words]
+        vocab_offsets = np.zeros(len(words) + 1, dtype=np.int64)
+        vocab_offsets[1:] = np.cumsum([len(b) for b in encoded])
+        vocab_bytes = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+        n_vocab = len(words)
+        kept = np.array([(lag - 1) * n_vocab + word_idx[w] for w, lag in text], dtype=np.int64)
+        beta = np.fromiter(text.values(), dtype=np.float64, count=len(text))
+        order = np.argsort(kept, kind="stable")
+        dense_names = sorted(dense)
+        return cls(vocab_offsets, vocab_bytes, kept[order], beta[order], lags,
+                   dense_names=dense_names,
+                   dense_beta=np.array([dense[n] for n in dense_names], dtype=np.float64),
+                   scaler_params=scaler_params, meta=meta)
+
+    @property
+    def n_vocab(self):
+        return len(self.vocab_offsets) - 1
+
+    @property
+    def words(self):
+        """문자열 테이블 디코딩 (최초 접근 시 1회)"""
+        if self._words is None:
+            raw = self.vocab_bytes.tobytes()
+            offsets = self.vocab_offsets.tolist()
+            self._words = [raw[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(self.n_vocab)]
+        return self._words
+
+    def column_lag(self):
+        """kept 컬럼별 lag (1-based)"""
+        return self.kept // max(self.n_vocab, 1) + 1
+
+    def column_word(self):
+        """kept 컬럼별 vocabulary 인덱스"""
+        return self.kept % max(self.n_vocab, 1)
+
+    def to_dict(self):
+        """Predictor/registry가 쓰는 {word_L{k}: beta} 사전으로 복원"""
+        words = self.words
+        names = [f"{words[w]}_L{lag}" for w, lag in zip(self.column_word().tolist(), self.column_lag().tolist())]
+        sentiment_dict = dict(zip(names, self.beta.tolist()))
+        sentiment_dict.update(zip(self.dense_names, self.dense_beta.tolist()))
+        return sentiment_dict
+
+    def __len__(self):
+        return len(self.kept) + len(self.dense_names)
+
+    def to_bytes(self):
+        arrays = {
+            "vocab_offsets": np.ascontiguousarray(self.vocab_offsets, dtype="<i8"),
+            "vocab_bytes": np.ascontiguousarray(self.vocab_bytes, dtype=np.uint8),
+            "kept": np.ascontiguousarray(self.kept, dtype="<i8"),
+            "beta": np.ascontiguousarray(self.beta, dtype="<f8"),
+            "dense_beta": np.ascontiguousarray(self.dense_beta, dtype="<f8"),
+        }
+        layout, offset = {}, 0
+        for name, arr in arrays.items():
+            layout[name] = [arr.dtype.str, offset, int(arr.size)]
+            offset += -(-arr.nbytes // _ALIGN) * _ALIGN
+        header = json.dumps({
+            "lags": self.lags,
+            "n_vocab": self.n_vocab,
+            "dense_names": self.dense_names,
+            "scaler": self.scaler_params,
+            "meta": self.meta,
+            "arrays": layout,
+        }, ensure_ascii=False, default=str).encode("utf-8")
+        # 배열 영역이 8바이트 경계에서 시작하도록 헤더 뒤를 공백으로 채움
+        header += b" " * (-(_PREFIX.size + len(header)) % _ALIGN)
+
+        out = bytearray(_PREFIX.pack(ARTIFACT_MAGIC, ARTIFACT_FORMAT_VERSION, len(header)) + header)
+        base = len(out)
+        out.extend(b"\0" * offset)
+        for name, arr in arrays.items():
+            start = base + layout[name][1]
+            out[start:start + arr.nbytes] = arr.tobytes()
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, buf):
+        """bytes / memoryview (psycopg2 bytea) -> artifact. 배열은 buf를 복사하지 않는 view"""
+        buf = memoryview(buf)
+        magic, version, header_len = _PREFIX.unpack_from(buf, 0)
+        if magic != ARTIFACT_MAGIC:
+            raise ValueError("Not a model artifact (bad magic)")
+        if version > ARTIFACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported model artifact format version {version} (max {ARTIFACT_FORMAT_VERSION})")
+        header = json.loads(bytes(buf[_PREFIX.size:_PREFIX.size + header_len]).decode("utf-8"))
+        base = _PREFIX.size + header_len
+
+        arrays = {}
+        for name, (dtype, offset, length) in header["arrays"].items():
+            arrays[name] = np.frombuffer(buf, dtype=np.dtype(dtype), count=length, offset=base + offset)
+        return cls(arrays["vocab_offsets"], arrays["vocab_bytes"], arrays["kept"], arrays["beta"], header["lags"],
+                   dense_names=header["dense_names"], dense_beta=arrays["dense_beta"],
+                   scaler_params=header["scaler"], meta=header["meta"])
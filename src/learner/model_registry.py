@@ -0,0 +1,49 @@
+# src/learner/model_registry.py
+"""
+In-process model registry for walk-forward backtests.
+
+WalkForwardValidator retrains Main/Buffer dictionaries for every validation day and
+Predictor reads them straight back. In backtest mode both share a ModelRegistry, so
+the dictionaries and scaler params stay in memory, keyed by (stock_code, version).
+Only promoted models, plus an optional sample (BACKTEST_PERSIST_EVERY), are written
+to tb_sentiment_dict / tb_sentiment_dict_meta.
+"""
+import os
+from collections import OrderedDict
+
+# 0 = 백테스트 사전은 DB에 저장하지 않음, N = N번째 재학습마다 1회 샘플 저장
+BACKTEST_PERSIST_EVERY = int(os.getenv("BACKTEST_PERSIST_EVERY", "0"))
+REGISTRY_MAX_VERSIONS = int(os.getenv("MODEL_REGISTRY_MAX_VERSIONS", "256"))
+
+
+class ModelRegistry:
+    def __init__(self, max_versions=REGISTRY_MAX_VERSIONS):
+        self.max_versions = max_versions
+        self._models = OrderedDict()  # (stock_code, version) -> {source: {"dict": ..., "metrics": ...}}
+
+    def put(self, stock_code, version, source, sentiment_dict, metrics=None):
+        key = (stock_code, version)
+        entry = self._models.setdefault(key, {})
+        entry[source] = {"dict": sentiment_dict, "metrics": metrics or {}}
+        self._models.move_to_end(key)
+        # 오래된 버전부터 제거 (검증 루프는 항상 최신 버전만 조회)
+        while len(self._models) > self.max_versions:
+            self._models.popitem(last=False)
+
+    def has_version(self, stock_code, version):
+        """해당 버전이 registry에서 학습된 것인지 (Main/Buffer 중 하나라도)"""
+        return (stock_code, version) in self._models
+
+    def get_dict(self, stock_code, version, source='Main'):
+        entry = self._models.get((stock_code, version), {}).get(source)
+        return entry["dict"] if entry else {}
+
+    def get_metrics(self, stock_code, version, source='Main'):
+        entry = self._models.get((stock_code, version), {}).get(source)
+        return entry["metrics"] if entry else {}
+
+    def clear(self):
+        self._models.clear()
+
+    def __len__(self):
+        return len(self._models)
@@ -0,0 +1,202 @@
+# src/learner/shared_corpus.py
+"""
+Read-only tokenized news corpus shared between AWO window workers.
+
+The parent process fetches and tokenizes the widest window once and writes the
+result as flat numpy arrays (token IDs, per-document offsets, dates, prices).
+Workers attach with np.load(mmap_mode='r'), so every process maps the same
+pages instead of holding its own copy, and each worker only materializes the
+date slice of its own window.
+
+Layout of the corpus directory:
+    doc_dates.npy      int32  days since epoch, sorted ascending (one per document)
+    doc_offsets.npy    int64  token_ids[doc_offsets[i]:doc_offsets[i+1]] = tokens of document i
+    token_ids.npy      int32  flat token IDs
+    vocab_bytes.npy    uint8  UTF-8 bytes of all vocabulary entries, concatenated
+    vocab_offsets.npy  int64  vocabulary entry j = vocab_bytes[vocab_offsets[j]:vocab_offsets[j+1]]
+    price_dates.npy    int32  days since epoch of the validation prices
+    price_alphas.npy   float64
+
+Optional document groups (multi-stock batch training: one corpus, one group per stock):
+    group_names.npy    unicode  group keys (stock codes)
+    group_offsets.npy  int64    group_doc_ids[group_offsets[g]:group_offsets[g+1]] = documents of group g
+    group_doc_ids.npy  int64    ascending document indices (hence ascending dates) per group
+"""
+import os
+import shutil
+import tempfile
+from datetime import date, timedelta
+import numpy as np
+import polars as pl
+
+EPOCH = date(1970, 1, 1)
+# tmpfs로 두면 디스크 I/O 없이 순수 공유 메모리로 동작
+DEFAULT_CORPUS_DIR = os.getenv("AWO_CORPUS_DIR", "/dev/shm" if os.path.isdir("/dev/shm") else None)
+
+
+def _to_days(d):
+    return (d - EPOCH).days
+
+
+def _from_days(n):
+    return EPOCH + timedelta(days=int(n))
+
+
+class SharedNewsCorpus:
+    def __init__(self, path, arrays):
+        self.path = path
+        self.doc_dates = arrays["doc_dates"]
+        self.doc_offsets = arrays["doc_offsets"]
+        self.token_ids = arrays["token_ids"]
+        self.vocab_bytes = arrays["vocab_bytes"]
+        self.vocab_offsets = arrays["vocab_offsets"]
+        self.price_dates = arrays["price_dates"]
+        self.price_alphas = arrays["price_alphas"]
+        self.group_names = arrays.get("group_names")
+        self.group_offsets = arrays.get("group_offsets")
+        self.group_doc_ids = arrays.get("group_doc_ids")
+        self._vocab = None
+        self._group_index = None
+
+    @property
+    def n_docs(self):
+        return len(self.doc_dates)
+
+    @classmethod
+    def build(cls, df_news, prices=None, base_dir=DEFAULT_CORPUS_DIR, group_col=None):
+        """
+        df_news: 'date'(Date)와 'tokens'(List[String]) 컬럼을 가진 토큰화된 뉴스
+        prices: {'YYYY-MM-DD': alpha} (WalkForwardValidator.run_validation의 actual_prices 형식)
+        group_col: 문서별 그룹 키 리스트 컬럼 (예: 기사가 매핑된 종목 코드들). 주면 to_polars(group=...) 사용 가능
+        """
+        path = tempfile.mkdtemp(prefix="awo_corpus_", dir=base_dir)
+
+        if df_news.is_empty():
+            schema = {"date": pl.Date, "tokens": pl.List(pl.String)}
+            if group_col:
+                schema[group_col] = pl.List(pl.String)
+            df_news = pl.DataFrame({name: [] for name in schema}, schema=schema)
+        df_news = df_news.select(["date", "tokens"] + ([group_col] if group_col else [])).sort("date")
+
+        doc_dates = df_news["date"].cast(pl.Int32).to_numpy().astype(np.int32)
+        lengths = df_news["tokens"].list.len().fill_null(0).to_numpy().astype(np.int64)
+        doc_offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=doc_offsets[1:])
+
+        flat = df_news["tokens"].explode().drop_nulls()
+        vocab = flat.unique(maintain_order=True)
+        token_ids = pl.DataFrame({"t": flat}).join(
+            pl.DataFrame({"t": vocab, "id": pl.int_range(0, len(vocab), dtype=pl.Int32, eager=True)}),
+            on="t", how="left", maintain_order="left"
+        )["id"].to_numpy().astype(np.int32)
+
+        vocab_encoded = [s.encode("utf-8") for s in vocab.to_list()]
+        vocab_offsets = np.zeros(len(vocab_encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in vocab_encoded], out=vocab_offsets[1:])
+        vocab_bytes = np.frombuffer(b"".join(vocab_encoded), dtype=np.uint8)
+
+        price_items = sorted((prices or {}).items())
+        price_dates = np.array([_to_days(date.fromisoformat(d)) for d, _ in price_items], dtype=np.int32)
+        price_alphas = np.array([a for _, a in price_items], dtype=np.float64)
+
+        arrays = {
+            "doc_dates": doc_dates, "doc_offsets": doc_offsets, "token_ids": token_ids,
+            "vocab_bytes": vocab_bytes, "vocab_offsets": vocab_offsets,
+            "price_dates": price_dates, "price_alphas": price_alphas,
+        }
+        if group_col:
+            arrays.update(cls._group_arrays(df_news, group_col))
+        for name, arr in arrays.items():
+            np.save(os.path.join(path, f"{name}.npy"), arr)
+        return cls.attach(path)
+
+    @staticmethod
+    def _group_arrays(df_news, group_col):
+        pairs = (
+            df_news.select(pl.int_range(0, pl.len(), dtype=pl.Int64).alias("doc"), pl.col(group_col))
+            .explode(group_col)
+            .drop_nulls(group_col)
+            .sort([group_col, "doc"])
+        )
+        counts = pairs.group_by(group_col, maintain_order=True).len()
+        group_offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts["len"].to_numpy(), out=group_offsets[1:])
+        return {
+            "group_names": np.array(counts[group_col].to_list(), dtype=str),
+            "group_offsets": group_offsets,
+            "group_doc_ids": pairs["doc"].to_numpy().astype(np.int64),
+        }
+
+    @classmethod
+    def attach(cls, path):
+        """Worker 측: 복사 없이 읽기 전용 memory map으로 연결"""
+        names = ["doc_dates", "doc_offsets", "token_ids", "vocab_bytes", "vocab_offsets", "price_dates", "price_alphas"]
+        optional = ["group_names", "group_offsets", "group_doc_ids"]
+        names += [n for n in optional if os.path.exists(os.path.join(path, f"{n}.npy"))]
+        return cls(path, {n: np.load(os.path.join(path, f"{n}.npy"), mmap_mode="r") for n in names})
+
+    def group_docs(self, group):
+        """그룹(종목)에 속한 문서 인덱스 (날짜 오름차순)"""
+        if self.group_names is None:
+            raise ValueError("Corpus was built without document groups")
+        if self._group_index is None:
+            self._group_index = {str(name): g for g, name in enumerate(self.group_names)}
+        g = self._group_index.get(group)
+        if g is None:
+            return np.zeros(0, dtype=np.int64)
+        return np.asarray(self.group_doc_ids[self.group_offsets[g]:self.group_offsets[g + 1]])
+
+    @property
+    def vocab(self):
+        if self._vocab is None:
+            raw = self.vocab_bytes.tobytes()
+            offs = self.vocab_offsets
+            self._vocab = pl.Series("tokens", [raw[offs[j]:offs[j + 1]].decode("utf-8") for j in range(len(offs) - 1)], dtype=pl.String)
+        return self._vocab
+
+    def to_polars(self, start_date=None, end_date=None, group=None):
+        """
+        [start_date, end_date] 구간의 문서만 'date', 'tokens' DataFrame으로 복원합니다.
+        group: 해당 그룹(종목)에 매핑된 문서만 복원
+        """
+        if group is None:
+            lo = 0 if start_date is None else int(np.searchsorted(self.doc_dates, _to_days(start_date), side="left"))
+            hi = self.n_docs if end_date is None else int(np.searchsorted(self.doc_dates, _to_days(end_date), side="right"))
+            docs = np.arange(lo, max(hi, lo), dtype=np.int64)
+        else:
+            docs = self.group_docs(group)
+            dates = np.asarray(self.doc_dates)[docs]
+            lo = 0 if start_date is None else int(np.searchsorted(dates, _to_days(start_date), side="left"))
+            hi = len(docs) if end_date is None else int(np.searchsorted(dates, _to_days(end_date), side="right"))
+            docs = docs[lo:max(hi, lo)]
+
+        n = len(docs)
+        dates = pl.Series("date", np.asarray(self.doc_dates)[docs].astype(np.int32)).cast(pl.Date)
+        if n == 0:
+            return pl.DataFrame({"date": dates, "tokens": pl.Series("tokens", [], dtype=pl.List(pl.String))})
+
+        starts = np.asarray(self.doc_offsets)[docs]
+        lengths = np.asarray(self.doc_offsets)[docs + 1] - starts
+        if n == docs[-1] - docs[0] + 1:
+            # 연속 구간: 토큰도 연속이므로 slice로 읽음
+            ids = np.asarray(self.token_ids[starts[0]:starts[0] + lengths.sum()])
+        else:
+            # 문서별 토큰 구간을 하나의 gather 인덱스로 이어 붙임
+            before = np.cumsum(lengths) - lengths
+            ids = np.asarray(self.token_ids)[np.repeat(starts - before, lengths) + np.arange(lengths.sum())]
+        doc_idx = np.repeat(np.arange(n, dtype=np.int64), lengths)
+        grouped = pl.DataFrame({"doc": doc_idx, "tokens": self.vocab.gather(ids)}).group_by("doc", maintain_order=True).agg(pl.col("tokens"))
+
+        return (
+            pl.DataFrame({"doc": np.arange(n, dtype=np.int64), "date": dates})
+            .join(grouped, on="doc", how="left", maintain_order="left")
+            .with_columns(pl.col("tokens").fill_null(pl.lit([], dtype=pl.List(pl.String))))
+            .drop("doc")
+        )
+
+    def prices(self):
+        """{'YYYY-MM-DD': alpha} 형식으로 검증 기간 주가를 반환합니다."""
+        return {_from_days(d).strftime('%Y-%m-%d'): float(a) for d, a in zip(self.price_dates, self.price_alphas)}
+
+    def cleanup(self):
+        shutil.rmtree(self.path, ignore_errors=True)
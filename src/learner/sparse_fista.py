@@ -0,0 +1,318 @@
+# src/learner/sparse_fista.py
+"""
+Sparse CPU Lasso Solver using FISTA (Fast Iterative Soft-Thresholding Algorithm).
+NumPy/SciPy only, so it runs on the Linux x86 servers where MLX is not available.
+
+Unlike MLXLasso, X is never densified: every step is a sparse mat-vec, the
+intercept is fitted by implicit column centering (X - 1 @ mean) and the
+Lipschitz constant is estimated by power iteration on the sparse operator.
+"""
+import numpy as np
+from typing import Optional
+from scipy import sparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 첫 working set 크기 (비영 계수 수의 2배보다 작으면 그쪽을 사용)
+WORKING_SET_START = 100
+
+
+def soft_threshold(x: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Proximal operator for L1 regularization (Soft Thresholding).
+    S_alpha(x) = sign(x) * max(|x| - alpha, 0)
+    """
+    # x - clip(x, -alpha, alpha) == sign(x) * max(|x| - alpha, 0), 임시 배열이 적음
+    return x - np.clip(x, -alpha, alpha)
+
+
+class _CenteredOperator:
+    """X_c = X - 1 @ x_mean 을 행렬로 만들지 않고 mat-vec만 제공 (희소성 유지)"""
+
+    def __init__(self, X, x_mean):
+        self.X = X
+        self.XT = X.T  # CSR의 전치 = CSC 뷰 (X.T @ r이 행 수가 많은 CSR보다 빠름)
+        self.x_mean = x_mean
+
+    def matvec(self, w):
+        out = self.X @ w
+        if self.x_mean is not None:
+            out = out - self.x_mean @ w
+        return np.asarray(out).ravel()
+
+    def rmatvec(self, r):
+        out = np.asarray(self.XT @ r).ravel()
+        if self.x_mean is not None:
+            out -= self.x_mean * r.sum()
+        return out
+
+
+def lipschitz_constant(op, n_features, n_samples, n_iter=100, seed=0):
+    """Sparse power iteration으로 ||X_c||_2^2 / n_samples 추정 (X.T @ X를 만들지 않음)"""
+    rng = np.random.default_rng(seed)
+    v = rng.standard_normal(n_features)
+    v /= np.linalg.norm(v) + 1e-12
+    sigma2 = 0.0
+    for _ in range(n_iter):
+        XtXv = op.rmatvec(op.matvec(v))
+        norm = np.linalg.norm(XtXv)
+        if norm < 1e-12:
+            break
+        new_sigma2 = float(v @ XtXv)
+        v = XtXv / norm
+        if abs(new_sigma2 - sigma2) <= 1e-8 * max(new_sigma2, 1e-12):
+            sigma2 = new_sigma2
+            break
+        sigma2 = new_sigma2
+    # 추정치는 아래에서 수렴하므로 약간 여유를 둠 (step이 너무 크면 발산)
+    return 1.01 * sigma2 / n_samples
+
+
+def duality_gap(op, w, y_c, alpha):
+    """
+    Lasso duality gap at w. Returns (gap, X_c.T @ r).
+    Dual feasible point: 잔차를 ||X_c.T @ theta||_inf <= n * alpha 가 되도록 스케일
+    """
+    n_samples = len(y_c)
+    r = y_c - op.matvec(w)
+    corr = op.rmatvec(r)
+    primal = 0.5 * float(r @ r) / n_samples + alpha * float(np.abs(w).sum())
+    corr_max = float(np.max(np.abs(corr))) if len(corr) else 0.0
+    scale = min(1.0, n_samples * alpha / corr_max) if corr_max > 0 else 1.0
+    diff = y_c - r * scale
+    dual = 0.5 * float(y_c @ y_c) / n_samples - 0.5 * float(diff @ diff) / n_samples
+    return primal - dual, corr
+
+
+def fista(op, y_c, w, alpha, L, max_iter, gap_tol):
+    """FISTA iterations on one (sub)problem. Returns (w, n_iter)."""
+    n_samples = len(y_c)
+    if L < 1e-10:
+        L = 1.0  # Fallback for degenerate cases
+    step_size = 1.0 / L
+    threshold = alpha * step_size
+
+    # Precompute X_c.T @ y for gradient
+    Xty = op.rmatvec(y_c) / n_samples
+    w_old = w.copy()
+    t = 1.0
+    k = 0
+    for k in range(max_iter):
+        # Momentum term (FISTA acceleration)
+        z = w + ((t - 1) / (t + 1)) * (w - w_old)
+
+        # Gradient step: grad = (X_c.T @ (X_c @ z)) / n_samples - X_c.T @ y / n_samples
+        grad = op.rmatvec(op.matvec(z)) / n_samples - Xty
+
+        # Proximal step (Soft thresholding)
+        w_old = w
+        w = soft_threshold(z - step_size * grad, threshold)
+        t = (1 + np.sqrt(1 + 4 * t * t)) / 2
+
+        if (k + 1) % 10 == 0 and duality_gap(op, w, y_c, alpha)[0] <= gap_tol:
+            break
+    return w, k + 1
+
+
+class SparseFISTALasso:
+    """
+    Lasso regression solver using FISTA on scipy.sparse matrices (CPU).
+    FISTA runs on a growing working set of features; the full problem is only
+    touched to compute the duality gap and pick the next working set.
+
+    Minimizes: 0.5 * ||y - X @ w - b||^2 / n_samples + alpha * ||w||_1
+
+    Parameters
+    ----------
+    alpha : float, default=1e-4
+        Regularization strength (L1 penalty).
+    max_iter : int, default=1000
+        Maximum number of iterations.
+    tol : float, default=1e-4
+        Stop when the duality gap < tol * ||y - mean(y)||^2 / n_samples.
+    fit_intercept : bool, default=True
+        Fit an unpenalized intercept (same as celer/sklearn Lasso).
+    warm_start : bool, default=False
+        Start from the current coef_ (same convention as sklearn).
+    verbose : bool, default=False
+        Print convergence progress.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 1e-4,
+        max_iter: int = 1000,
+        tol: float = 1e-4,
+        fit_intercept: bool = True,
+        warm_start: bool = False,
+        verbose: bool = False
+    ):
+        self.alpha = alpha
+        self.max_iter = max_iter
+        self.tol = tol
+        self.fit_intercept = fit_intercept
+        self.warm_start = warm_start
+        self.verbose = verbose
+        self.coef_: Optional[np.ndarray] = None
+        self.n_iter_: int = 0
+        self.intercept_: float = 0.0
+        self.dual_gap_: float = np.inf
+
+    def fit(self, X, y):
+        """
+        Fit the Lasso model using FISTA algorithm.
+
+        Parameters
+        ----------
+        X : sparse matrix or array-like of shape (n_samples, n_features)
+            Training data. Sparse input stays sparse (CSC/CSR).
+        y : array-like of shape (n_samples,)
+            Target values.
+        """
+        # float32 입력은 float32로 유지 (행렬 메모리 절반). 벡터 연산은 float64로 올라감
+        dtype = getattr(X, "dtype", None)
+        dtype = dtype if dtype in (np.float32, np.float64) else np.float64
+        if sparse.issparse(X):
+            X = X.tocsr().astype(dtype, copy=False)
+        else:
+            X = np.asarray(X, dtype=dtype)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        n_samples, n_features = X.shape
+
+        if self.fit_intercept:
+            x_mean = np.asarray(X.mean(axis=0), dtype=np.float64).ravel()
+            y_mean = float(y.mean())
+        else:
+            x_mean, y_mean = None, 0.0
+        op = _CenteredOperator(X, x_mean)
+        y_c = y - y_mean
+
+        gap_tol = self.tol * float(y_c @ y_c) / n_samples
+
+        # FISTA initialization (warm start: 현재 coef_에서 시작)
+        if self.warm_start and self.coef_ is not None and len(self.coef_) == n_features:
+            w = np.asarray(self.coef_, dtype=np.float64).copy()
+        else:
+            w = np.zeros(n_features)
+
+        # Working set: 비영 계수 + KKT 위반(|X_c.T @ r| / n > alpha)이 큰 피처만으로 FISTA를 풀고
+        # 전체 duality gap이 tol 이하가 될 때까지 working set을 두 배씩 키움 (celer와 같은 전략)
+        ws_size = WORKING_SET_START
+        n_iter = 0
+        gap, corr = duality_gap(op, w, y_c, self.alpha)
+        while gap > gap_tol and n_iter < self.max_iter:
+            ws_size = min(n_features, max(ws_size, 2 * np.count_nonzero(w)))
+            if ws_size < n_features:
+                score = np.abs(corr)
+                score[w != 0] = np.inf
+                ws = np.sort(np.argpartition(-score, ws_size - 1)[:ws_size])
+                sub_op = _CenteredOperator(X[:, ws], x_mean[ws] if x_mean is not None else None)
+            else:
+                ws, sub_op = np.arange(n_features), op
+
+            L = lipschitz_constant(sub_op, len(ws), n_samples)
+            if self.verbose:
+                logger.info(f"[Sparse FISTA] working set={len(ws)}, L={L:.4f}, alpha={self.alpha}")
+            w_ws, it = fista(sub_op, y_c, w[ws], self.alpha, L, self.max_iter - n_iter, 0.3 * gap_tol)
+            w = np.zeros(n_features)
+            w[ws] = w_ws
+            n_iter += it
+            gap, corr = duality_gap(op, w, y_c, self.alpha)
+            if ws_size == n_features:
+                break
+            ws_size *= 2
+
+        self.n_iter_ = n_iter
+        self.dual_gap_ = gap
+        self.coef_ = w
+        self.intercept_ = y_mean - float(x_mean @ w) if self.fit_intercept else 0.0
+
+        if self.verbose:
+            logger.info(f"[Sparse FISTA] Finished: {self.n_iter_} iters, gap={gap:.2e}, {np.count_nonzero(w)} non-zero coefficients")
+        return self
+
+    def predict(self, X) -> np.ndarray:
+        """Predict using the fitted model."""
+        if self.coef_ is None:
+            raise ValueError("Model not fitted. Call fit() first.")
+        return np.asarray(X @ self.coef_).ravel() + self.intercept_
+
+
+class SparseFISTALassoCV:
+    """
+    Lasso with Cross-Validation for alpha selection using sparse FISTA.
+    Each fold fits the alphas in descending order with warm starts.
+
+    Parameters
+    ----------
+    alphas : array-like, optional
+        List of alphas to try. If None, uses logarithmic range.
+    cv : int, default=5
+        Number of cross-validation folds.
+    max_iter : int, default=1000
+        Maximum iterations for each FISTA run.
+    """
+
+    def __init__(
+        self,
+        alphas: Optional[list] = None,
+        cv: int = 5,
+        max_iter: int = 1000,
+        tol: float = 1e-4,
+        verbose: bool = False
+    ):
+        self.alphas = alphas or [1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3]
+        self.cv = cv
+        self.max_iter = max_iter
+        self.tol = tol
+        self.verbose = verbose
+        self.alpha_: Optional[float] = None
+        self.coef_: Optional[np.ndarray] = None
+        self.intercept_: float = 0.0
+
+    def fit(self, X, y):
+        """
+        Fit with cross-validation to select the best alpha.
+        """
+        from sklearn.model_selection import KFold
+
+        X = X.tocsr() if sparse.issparse(X) else np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        alphas_desc = sorted(self.alphas, reverse=True)
+        kf = KFold(n_splits=self.cv, shuffle=True, random_state=42)
+
+        scores = {a: [] for a in alphas_desc}
+        for train_idx, val_idx in kf.split(np.arange(X.shape[0])):
+            model = SparseFISTALasso(alpha=alphas_desc[0], max_iter=self.max_iter, tol=self.tol, warm_start=True)
+            for alpha in alphas_desc:
+                model.alpha = alpha
+                model.fit(X[train_idx], y[train_idx])
+                # Score: negative MSE (higher is better)
+                mse = np.mean((model.predict(X[val_idx]) - y[val_idx]) ** 2)
+                scores[alpha].append(-mse)
+
+        mean_scores = {a: np.mean(s) for a, s in scores.items()}
+        if self.verbose:
+            for alpha in alphas_desc:
+                logger.info(f"[Sparse FISTA LassoCV] alpha={alpha:.2e}, mean_score={mean_scores[alpha]:.6f}")
+
+        # 동점이면 큰 alpha (더 희소한 해) 선택
+        self.alpha_ = max(alphas_desc, key=lambda a: mean_scores[a])
+
+        if self.verbose:
+            logger.info(f"[Sparse FISTA LassoCV] Best alpha: {self.alpha_:.2e}")
+
+        # Refit on full data with best alpha
+        final_model = SparseFISTALasso(alpha=self.alpha_, max_iter=self.max_iter, tol=self.tol, verbose=self.verbose)
+        final_model.fit(X, y)
+
+        self.coef_ = final_model.coef_
+        self.intercept_ = final_model.intercept_
+        self.n_iter_ = final_model.n_iter_
+        return self
+
+    def predict(self, X) -> np.ndarray:
+        if self.coef_ is None:
+            raise ValueError("Model not fitted.")
+        return np.asarray(X @ self.coef_).ravel() + self.intercept_
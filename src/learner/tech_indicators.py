@@ -6,6 +6,7 @@ class TechIndicatorProvider:
     """
     주가 데이터를 기반으로 기술적 지표를 생성합니다.
     """
+    TECH_COLUMNS = ["tech_rsi_14", "tech_macd_line", "tech_macd_sig", "tech_macd_hist"]
     
     @staticmethod
     def calculate_indicators(df: pl.DataFrame) -> pl.DataFrame:
@@ -82,9 +83,8 @@ class TechIndicatorProvider:
         ])
         
         # 지연 지표 (T-1 시점의 지표가 T일 예측에 쓰여야 하므로 shift)
-        tech_cols = ["tech_rsi_14", "tech_macd_line", "tech_macd_sig", "tech_macd_hist"]
         df = df.with_columns([
-            pl.col(c).shift(1).fill_null(0.0).alias(c) for c in tech_cols
+            pl.col(c).shift(1).fill_null(0.0).alias(c) for c in TechIndicatorProvider.TECH_COLUMNS
         ])
         
         return df
@@ -1,16 +1,62 @@
 # src/learner/validator.py
+import os
+import bisect
+import multiprocessing
 import polars as pl
 import numpy as np
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from src.learner.lasso import LassoLearner
 from src.predictor.scoring import Predictor
+from src.learner.model_registry import ModelRegistry, BACKTEST_PERSIST_EVERY
+from src.learner.shared_corpus import SharedNewsCorpus
 from src.db.connection import get_db_cursor
+from src.utils.job_control import JOB_CONTROL
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 한 번에 채점할 (검증일 x alpha) 모델 수 상한 - ModelRegistry가 보관하는 최근 버전 수보다 작아야 함
+PREDICT_BATCH_MAX_MODELS = int(os.getenv("PREDICT_BATCH_MAX_MODELS", "64"))
+# 검증 결과 일괄 INSERT 한 문장당 행 수 (execute_values page_size)
+RESULT_INSERT_PAGE_SIZE = int(os.getenv("RESULT_INSERT_PAGE_SIZE", "1000"))
+# Main 재학습 구간 병렬 실행: 0 = min(구간 수, CPU 수, VALIDATION_SEGMENT_MAX_WORKERS), 1 = 순차 실행
+VALIDATION_SEGMENT_WORKERS = int(os.getenv("VALIDATION_SEGMENT_WORKERS", "0"))
+# 구간 워커 수 RAM 상한 (AWO_MAX_WORKERS와 같은 역할). 워커마다 learner 전체(1~2GB)를 올리고
+# 자체 DB 풀 + JOB_CONTROL LISTEN 연결을 열므로, 큰 서버에서도 WF_CHECK 한 건이 코어 수만큼 뜨지 않도록 작게 유지
+VALIDATION_SEGMENT_MAX_WORKERS = int(os.getenv("VALIDATION_SEGMENT_MAX_WORKERS", "3"))
+
+
+def _run_segment_worker(args):
+    """
+    [Worker] 재학습 경계에서 시작하는 검증 구간 하나를 실행합니다.
+    부모가 만든 SharedNewsCorpus에 연결해 뉴스/주가를 받고, 같은 설정의 validator로 순차 검증.
+    """
+    (stock_code, use_sector_beta, model_type, in_memory_models, learner_state, alphas, used_version_tags,
+     seg_start, seg_end, train_days, dry_run, v_job_id, retrain_frequency, corpus_path) = args
+    validator = WalkForwardValidator(stock_code, use_sector_beta=use_sector_beta, model_type=model_type, in_memory_models=in_memory_models)
+    for name, value in learner_state.items():
+        setattr(validator.learner, name, value)
+
+    corpus = SharedNewsCorpus.attach(corpus_path)
+    lookback_start = datetime.strptime(seg_start, '%Y-%m-%d').date() - timedelta(days=train_days + validator.learner.lags + 2)
+    df_all_news = corpus.to_polars(lookback_start, datetime.strptime(seg_end, '%Y-%m-%d').date())
+    prefetched_prices = corpus.prices()
+    del corpus
+
+    return validator._run_validation_grid(
+        seg_start, seg_end, alphas, used_version_tags, train_days=train_days, dry_run=dry_run,
+        v_job_id=v_job_id, prefetched_df_news=df_all_news, retrain_frequency=retrain_frequency,
+        prefetched_prices=prefetched_prices, segment_workers=1
+    )
+
+
 class WalkForwardValidator:
-    def __init__(self, stock_code, use_sector_beta=False, model_type='tfidf'):
+    def __init__(self, stock_code, use_sector_beta=False, model_type='tfidf', in_memory_models=True):
+        """
+        in_memory_models: 백테스트 중 학습한 사전을 ModelRegistry(메모리)에 보관하고 DB에는 쓰지 않음
+                          (BACKTEST_PERSIST_EVERY > 0 이면 N번째 재학습마다 샘플로 DB 저장)
+        """
         self.stock_code = stock_code
         self.use_sector_beta = use_sector_beta
         self.model_type = model_type  # 'tfidf', 'hybrid', or 'hybrid_v2'
@@ -22,10 +68,19 @@ class WalkForwardValidator:
         self.learner = LassoLearner(
             use_sector_beta=use_sector_beta, 
             use_summary=use_summary,
-            use_tech_indicators=use_tech
+            use_tech_indicators=use_tech,
+            incremental_df=True, # 주간 재학습은 윈도우가 밀린 날짜만 DF 갱신
+            warm_start_retrain=True # 직전 재학습 계수에서 celer 풀이 시작
         )
-        self.predictor = Predictor()
+        self.registry = ModelRegistry() if in_memory_models else None
+        self.learner.registry = self.registry
+        self.predictor = Predictor(registry=self.registry)
+        self._retrain_count = 0
         self.token_fetch_cache = {} # Persistent cache for news tokens by (date, stock_code)
+        self._news_bags = None # prefetch 뉴스의 거래일 위치별 토큰 묶음 (build_news_bags)
+        self._bag_lists = {} # 직전 조회 구간의 {bags 행: 토큰 list} (다음 검증일에 재사용)
+        self._pending_verification_rows = [] # save_validation_result 버퍼 (flush_validation_results)
+        self._pending_prediction_rows = []
         self.tech_indicators_cache = {} # Cache for tech indicators during validation
         
         # Hybrid mode: lazy load HybridPredictor
@@ -47,7 +102,7 @@ class WalkForwardValidator:
             logger.info(f"[{self.stock_code}] HybridPredictor initialized")
         return self._hybrid_predictor
 
-    def run_validation(self, start_date, end_date, train_days=60, dry_run=False, progress_callback=None, v_job_id=None, prefetched_df_news=None, alpha=None, used_version_tag='v_job', retrain_frequency='weekly'):
+    def run_validation(self, start_date, end_date, train_days=60, dry_run=False, progress_callback=None, v_job_id=None, prefetched_df_news=None, alpha=None, used_version_tag='v_job', retrain_frequency='weekly', prefetched_prices=None, segment_workers=None):
         """
         start_date부터 end_date까지 하루씩 이동하며 예측 및 검증을 수행합니다.
         train_days: Main Dictionary 학습에 사용할 과거 일수
@@ -55,104 +110,91 @@ class WalkForwardValidator:
         alpha: Lasso Regularization Strength (If None, use learner's default)
         used_version_tag: DB 기록 시 used_version 필드에 들어갈 값
         retrain_frequency: 'daily' | 'weekly' - Main 사전 재학습 빈도
+        prefetched_prices: {'YYYY-MM-DD': alpha} 미리 가져온 검증 기간 주가 (AWO 공유 코퍼스)
+        segment_workers: Main 재학습 구간을 나눠 돌릴 프로세스 수 (None = VALIDATION_SEGMENT_WORKERS, 1 = 순차)
         """
         if alpha is not None:
             self.learner.alpha = alpha
             if hasattr(self.learner.model, 'alpha'):
                 self.learner.model.alpha = alpha
         
-        logger.info(f"Starting Walk-forward validation for {self.stock_code}: {start_date} ~ {end_date} (Train Window: {train_days} days, Alpha: {self.learner.alpha}, Pure Alpha: {self.use_sector_beta}, Dry Run: {dry_run})")
+        a = self.learner.alpha
+        return self._run_validation_grid(
+            start_date, end_date, [a], {a: used_version_tag}, train_days=train_days, dry_run=dry_run,
+            progress_callback=progress_callback, v_job_id=v_job_id, prefetched_df_news=prefetched_df_news,
+            retrain_frequency=retrain_frequency, prefetched_prices=prefetched_prices, segment_workers=segment_workers
+        )[a]
+
+    def run_validation_path(self, start_date, end_date, alphas, used_version_tags, train_days=60, dry_run=False, progress_callback=None, v_job_id=None, prefetched_df_news=None, retrain_frequency='weekly', prefetched_prices=None, segment_workers=None):
+        """
+        Alpha Path 모드: 재학습 시점마다 피처 행렬을 한 번만 만들고 모든 alpha를 warm start로 학습한 뒤
+        같은 날의 뉴스/펀더멘털로 alpha별 예측을 평가합니다. (AWO alpha 그리드용)
+        used_version_tags: {alpha: used_version 태그}
+        Returns: {alpha: run_validation과 같은 형식의 결과}
+        """
+        return self._run_validation_grid(
+            start_date, end_date, list(alphas), used_version_tags, train_days=train_days, dry_run=dry_run,
+            progress_callback=progress_callback, v_job_id=v_job_id, prefetched_df_news=prefetched_df_news,
+            retrain_frequency=retrain_frequency, prefetched_prices=prefetched_prices, segment_workers=segment_workers
+        )
+
+    def _run_validation_grid(self, start_date, end_date, alphas, used_version_tags, train_days=60, dry_run=False, progress_callback=None, v_job_id=None, prefetched_df_news=None, retrain_frequency='weekly', prefetched_prices=None, segment_workers=None):
+        try:
+            return self._validate_range(
+                start_date, end_date, alphas, used_version_tags, train_days=train_days, dry_run=dry_run,
+                progress_callback=progress_callback, v_job_id=v_job_id, prefetched_df_news=prefetched_df_news,
+                retrain_frequency=retrain_frequency, prefetched_prices=prefetched_prices, segment_workers=segment_workers
+            )
+        finally:
+            # 결과는 검증 구간이 끝날 때(정지/실패 포함) 한 번에 기록
+            self.flush_validation_results()
+
+    def _validate_range(self, start_date, end_date, alphas, used_version_tags, train_days=60, dry_run=False, progress_callback=None, v_job_id=None, prefetched_df_news=None, retrain_frequency='weekly', prefetched_prices=None, segment_workers=None):
+        alpha_desc = self.learner.alpha if len(alphas) == 1 else alphas
+        logger.info(f"Starting Walk-forward validation for {self.stock_code}: {start_date} ~ {end_date} (Train Window: {train_days} days, Alpha: {alpha_desc}, Pure Alpha: {self.use_sector_beta}, Dry Run: {dry_run})")
         
         # 전체 검증 기간의 주가 데이터를 미리 가져옴
-        with get_db_cursor() as cur:
-            if self.use_sector_beta:
-                sql = """
-                    SELECT date, (return_rate - COALESCE(sector_return, 0)) as alpha 
-                    FROM tb_daily_price 
-                    WHERE stock_code = %s AND date BETWEEN %s AND %s
-                    ORDER BY date ASC
-                """
-            else:
-                sql = """
-                    SELECT date, excess_return as alpha 
-                    FROM tb_daily_price 
-                    WHERE stock_code = %s AND date BETWEEN %s AND %s
-                    ORDER BY date ASC
-                """
-            cur.execute(sql, (self.stock_code, start_date, end_date))
-            actual_prices = {row['date'].strftime('%Y-%m-%d'): float(row['alpha']) for row in cur.fetchall()}
+        if prefetched_prices is not None:
+            actual_prices = {d: a for d, a in prefetched_prices.items() if start_date <= d <= end_date}
+        else:
+            actual_prices = self.fetch_actual_prices(start_date, end_date)
 
         validation_dates = sorted(actual_prices.keys())
-        results = []
+        results = {a: [] for a in alphas}
+        fit_stats_start = len(self.learner.fit_stats)
         
-        if prefetched_df_news is None:
-            # --- Memory Optimization: Bulk News Fetching ---
-            # Fetch all news for the entire range (lookback + test) once
-            lookback_start = (datetime.strptime(start_date, '%Y-%m-%d') - timedelta(days=train_days + self.learner.lags + 2)).date()
-            full_end = datetime.strptime(end_date, '%Y-%m-%d').date()
-            
-            logger.info(f"  [Memory] Prefetching and tokenizing all news from {lookback_start} to {full_end}...")
-            
-            with get_db_cursor() as cur:
-                cur.execute("""
-                    SELECT c.published_at::date as date, c.content, c.extracted_content
-                    FROM tb_news_content c
-                    JOIN tb_news_mapping m ON c.url_hash = m.url_hash
-                    WHERE m.stock_code = %s AND c.published_at::date BETWEEN %s AND %s
-                """, (self.stock_code, lookback_start, full_end))
-                all_news_raw = cur.fetchall()
-                
-            df_all_news = pl.DataFrame(all_news_raw) if all_news_raw else pl.DataFrame({"date": [], "content": [], "extracted_content": []})
-            del all_news_raw # Clear raw list immediately
-            
-            # [Hybrid v2] Content Selector (Raw vs Summarized)
-            if self.learner.use_summary and "extracted_content" in df_all_news.columns:
-                df_all_news = df_all_news.with_columns(
-                    pl.coalesce(pl.col("extracted_content"), pl.col("content")).alias("final_content")
-                )
-            else:
-                df_all_news = df_all_news.with_columns(pl.col("content").alias("final_content"))
+        # Main 재학습은 그 날 이전 데이터만 쓰므로 재학습 경계로 나눈 구간들은 서로 독립
+        segments = self._split_segments(validation_dates, retrain_frequency, self._segment_pool_size(validation_dates, retrain_frequency, segment_workers))
+        if len(segments) > 1:
+            return self._run_segments_parallel(
+                segments, validation_dates, actual_prices, alphas, used_version_tags, train_days, dry_run,
+                progress_callback, v_job_id, prefetched_df_news, retrain_frequency
+            )
 
-            # Pre-tokenize everything using LassoLearner's logic
-            if not df_all_news.is_empty():
-                from src.learner.lasso import TOKEN_CACHE as GLOBAL_TOKEN_CACHE
-                
-                def get_cached_tokens(content):
-                    if content in GLOBAL_TOKEN_CACHE:
-                        return GLOBAL_TOKEN_CACHE[content]
-                    t = self.learner.tokenizer.tokenize(content, n_gram=self.learner.n_gram)
-                    if len(GLOBAL_TOKEN_CACHE) < 20000:
-                        GLOBAL_TOKEN_CACHE[content] = t
-                    return t
-                
-                print(f"    [Memory] Tokenizing {len(df_all_news)} items...")
-                df_all_news = df_all_news.with_columns(
-                    pl.col("final_content").map_elements(get_cached_tokens, return_dtype=pl.List(pl.String)).alias("tokens")
-                )
-            # -----------------------------------------------
-            
-            # --- [Hybrid v2] Prefetch Tech Indicators ---
-            if self.model_type == 'hybrid_v2':
-                logger.info(f"  [Hybrid v2] Prefetching tech indicators from {lookback_start} to {full_end}...")
-                from src.learner.tech_indicators import TechIndicatorProvider
-                with get_db_cursor() as cur:
-                    df_tech = TechIndicatorProvider.fetch_and_calculate(cur, self.stock_code, lookback_start, full_end)
-                    if not df_tech.is_empty():
-                        for row in df_tech.to_dicts():
-                            d_str = row['date'].strftime('%Y-%m-%d')
-                            self.tech_indicators_cache[d_str] = row
+        if prefetched_df_news is None:
+            df_all_news = self._prefetch_news(start_date, end_date, train_days)
         else:
             df_all_news = prefetched_df_news
 
+        # 예측 입력(lag별 뉴스)은 prefetch된 토큰에서 거래일별로 한 번만 묶어 두고 메모리 조회
+        self.build_news_bags(df_all_news)
+
+        # 예측은 Main 재학습 구간 단위로 모아 predict_batch로 한 번에 채점
+        pending, pending_versions = [], {}
+        def flush():
+            if pending:
+                self._score_pending(pending, alphas, versions_of=pending_versions, results=results, dry_run=dry_run,
+                                    v_job_id=v_job_id, used_version_tags=used_version_tags, n_days=len(validation_dates))
+                pending.clear()
+                pending_versions.clear()
+
         for i, current_date_str in enumerate(validation_dates):
             # Check for stop signal if v_job_id provided
-            if v_job_id and i % 2 == 0: 
-                with get_db_cursor() as cur:
-                    cur.execute("SELECT status FROM tb_verification_jobs WHERE v_job_id = %s", (v_job_id,))
-                    row = cur.fetchone()
-                    if not row or row['status'] == 'stopped':
-                        logger.info(f"Validation loop stopped by user or missing job for {self.stock_code} (Job #{v_job_id})")
-                        return {"train_days": train_days, "total_days": len(results), "hit_rate": 0, "mae": 0, "results": results, "status": "stopped"}
+            # (LISTEN 신호로 갱신되는 메모리 플래그 - 매일 확인해도 DB 조회 없음)
+            if v_job_id and JOB_CONTROL.is_stopped('verification', v_job_id):
+                logger.info(f"Validation loop stopped by user or missing job for {self.stock_code} (Job #{v_job_id})")
+                flush()
+                return {a: {"train_days": train_days, "total_days": len(results[a]), "hit_rate": 0, "mae": 0, "results": results[a], "status": "stopped"} for a in alphas}
 
             if i == len(validation_dates) - 1:
                 break # 마지막 날은 다음날 가격 데이터가 없으므로 예측만 가능하지만 검증은 불가
@@ -163,43 +205,24 @@ class WalkForwardValidator:
             train_start = train_end - timedelta(days=train_days)
             
             # 2. Dictionary 시뮬레이션 학습
-            version = f"val_{train_days}d_{current_date_str}"
+            # Path 모드에서는 alpha별 사전이 공존해야 하므로 버전에 alpha를 붙임
+            if len(alphas) == 1:
+                versions = {alphas[0]: f"val_{train_days}d_{current_date_str}"}
+            else:
+                versions = {a: f"val_{train_days}d_{current_date_str}_a{a}" for a in alphas}
             
             try:
                 # Weekly Retraining Logic: Main 사전은 주 1회 (첫날 또는 월요일)
-                should_retrain_main = False
-                if retrain_frequency == 'daily':
-                    should_retrain_main = True
-                elif retrain_frequency == 'weekly':
-                    # 첫 번째 날이거나 월요일인 경우 재학습
-                    if i == 0 or current_date.weekday() == 0:  # Monday = 0
-                        should_retrain_main = True
-                else:  # monthly or other
-                    if i == 0 or current_date.day == 1:
-                        should_retrain_main = True
-                
-                if should_retrain_main:
+                if self._is_main_retrain_day(i, current_date, retrain_frequency):
+                    # 직전 구간의 예측을 먼저 채점 (registry는 최근 버전만 보관)
+                    flush()
                     # Main Dictionary 학습 (prefetched_df_news 주입)
-                    self.learner.run_training(
-                        self.stock_code, 
-                        train_start.strftime('%Y-%m-%d'),
-                        train_end.strftime('%Y-%m-%d'),
-                        version=version,
-                        source='Main',
-                        prefetched_df_news=df_all_news
-                    )
+                    self._train_dicts(alphas, versions, train_start, train_end, 'Main', df_all_news)
                 
                 # Daily Buffer 업데이트 (최근 7일) - 항상 실행 (경량 연산)
-                self.learner.run_training(
-                    self.stock_code,
-                    (current_date - timedelta(days=7)).strftime('%Y-%m-%d'),
-                    train_end.strftime('%Y-%m-%d'),
-                    version=version,
-                    source='Buffer',
-                    prefetched_df_news=df_all_news
-                )
-
-                # 3. 예측 수행 (오늘의 뉴스로 내일의 가격 예측)
+                self._train_dicts(alphas, versions, current_date - timedelta(days=7), train_end, 'Buffer', df_all_news)
+
+                # 3. 예측 수행 (오늘의 뉴스로 내일의 가격 예측) - 모든 alpha가 같은 입력을 공유
                 news_by_lag = self.fetch_historical_news_by_lag(current_date, lag_limit=self.learner.lags, cache=self.token_fetch_cache)
                 fundamentals = self.fetch_historical_fundamentals(current_date)
                 
@@ -210,15 +233,125 @@ class WalkForwardValidator:
                 
                 # Tech indicators for v2
                 current_tech = self.tech_indicators_cache.get(current_date_str, {})
-                    
-                pred_res = self.predictor.predict_advanced(
-                    self.stock_code, 
-                    news_by_lag, 
-                    version, 
-                    fundamentals=fundamentals,
-                    tech_indicators=current_tech if self.model_type == 'hybrid_v2' else None
-                )
                 
+                # 4. 실제값 (다음 거래일의 수익률)
+                next_date_str = validation_dates[i+1]
+                actual_alpha = actual_prices[next_date_str]
+                
+                pending.append({
+                    "i": i,
+                    "date": current_date_str,
+                    "news_by_lag": news_by_lag,
+                    "fundamentals": fundamentals,
+                    "tech_indicators": current_tech if self.model_type == 'hybrid_v2' else None,
+                    "actual_alpha": actual_alpha,
+                })
+                pending_versions[current_date_str] = versions
+                if len(pending) * len(alphas) >= PREDICT_BATCH_MAX_MODELS:
+                    flush()
+
+                # MEMORY_OPT: Frequent GC in backtest loop
+                if i % 2 == 0:
+                    import gc
+                    gc.collect()
+
+                if progress_callback:
+                    # 0.0 ~ 1.0
+                    p = (i + 1) / len(validation_dates)
+                    progress_callback(p)
+
+            except Exception as e:
+                logger.error(f"Error in validation loop for {current_date_str}: {e}")
+
+        flush()
+
+        # 총평 출력
+        self._log_fit_stats(self.learner.fit_stats[fit_stats_start:])
+        summaries = self._summarize(results, alphas, train_days)
+        
+        if not any(results.values()):
+            self.token_fetch_cache.clear() # Clear persistent cache for this run
+            import gc
+            gc.collect()
+        
+        return summaries
+
+    def _prefetch_news(self, start_date, end_date, train_days):
+        """검증 전체 구간(학습 lookback 포함)의 뉴스를 한 번 조회/토큰화합니다. (hybrid_v2는 기술지표 캐시도 채움)"""
+        # --- Memory Optimization: Bulk News Fetching ---
+        # Fetch all news for the entire range (lookback + test) once
+        lookback_start = (datetime.strptime(start_date, '%Y-%m-%d') - timedelta(days=train_days + self.learner.lags + 2)).date()
+        full_end = datetime.strptime(end_date, '%Y-%m-%d').date()
+        
+        logger.info(f"  [Memory] Prefetching and tokenizing all news from {lookback_start} to {full_end}...")
+        
+        with get_db_cursor() as cur:
+            cur.execute("""
+                SELECT c.published_at::date as date, c.content, c.extracted_content,
+                       c.keywords->>'v' AS token_version, c.keywords->>'t' AS stored_tokens
+                FROM tb_news_content c
+                JOIN tb_news_mapping m ON c.url_hash = m.url_hash
+                WHERE m.stock_code = %s AND c.published_at::date BETWEEN %s AND %s
+            """, (self.stock_code, lookback_start, full_end))
+            all_news_raw = cur.fetchall()
+            
+        df_all_news = pl.DataFrame(all_news_raw) if all_news_raw else pl.DataFrame({"date": [], "content": [], "extracted_content": []})
+        del all_news_raw # Clear raw list immediately
+        
+        # [Hybrid v2] Content Selector (Raw vs Summarized)
+        if self.learner.use_summary and "extracted_content" in df_all_news.columns:
+            df_all_news = df_all_news.with_columns(
+                pl.coalesce(pl.col("extracted_content"), pl.col("content")).alias("final_content")
+            )
+        else:
+            df_all_news = df_all_news.with_columns(pl.col("content").alias("final_content"))
+
+        # Pre-tokenize everything using LassoLearner's logic (stored tokens first)
+        if not df_all_news.is_empty():
+            from src.learner.lasso import TOKEN_CACHE as GLOBAL_TOKEN_CACHE
+            
+            print(f"    [Memory] Tokenizing {len(df_all_news)} items...")
+            df_all_news = self.learner.token_store.add_tokens_column(
+                df_all_news, n_gram=self.learner.n_gram, content_col="final_content",
+                use_stored=not self.learner.use_summary, cache=GLOBAL_TOKEN_CACHE
+            )
+        # -----------------------------------------------
+        
+        # --- [Hybrid v2] Prefetch Tech Indicators ---
+        if self.model_type == 'hybrid_v2':
+            logger.info(f"  [Hybrid v2] Prefetching tech indicators from {lookback_start} to {full_end}...")
+            from src.learner.tech_indicators import TechIndicatorProvider
+            with get_db_cursor() as cur:
+                df_tech = TechIndicatorProvider.fetch_and_calculate(cur, self.stock_code, lookback_start, full_end)
+                if not df_tech.is_empty():
+                    for row in df_tech.to_dicts():
+                        d_str = row['date'].strftime('%Y-%m-%d')
+                        self.tech_indicators_cache[d_str] = row
+        return df_all_news
+
+    def _score_pending(self, pending, alphas, versions_of, results, dry_run, v_job_id, used_version_tags, n_days):
+        """
+        모아 둔 검증일들을 alpha(버전)별 predict_batch 한 번으로 채점하고 결과를 기록합니다.
+        (predict_advanced를 날짜마다 호출한 것과 같은 결과)
+        """
+        requests = [
+            {**day, "version": versions_of[day["date"]][a]}
+            for a in alphas for day in pending
+        ]
+        try:
+            preds = self.predictor.predict_batch(self.stock_code, requests)
+        except Exception as e:
+            logger.error(f"Error scoring validation days {pending[0]['date']} ~ {pending[-1]['date']}: {e}")
+            return
+
+        by_day = {}
+        for req, pred_res in zip(requests, preds):
+            by_day.setdefault(req["i"], []).append((req, pred_res))
+
+        for day in pending:
+            bert_adj = None
+            current_date_str, actual_alpha, i = day["date"], day["actual_alpha"], day["i"]
+            for a, (req, pred_res) in zip(alphas, by_day[i]):
                 # If everything is zero/observation, skip
                 if pred_res['status'] == "Observation":
                     continue
@@ -227,28 +360,11 @@ class WalkForwardValidator:
                 prediction = 1 if "Buy" in pred_res['status'] else (0 if "Sell" in pred_res['status'] else None)
                 expected_alpha = pred_res['expected_alpha']
                 
-                # [HYBRID] BERT 기반 알파 조정 (model_type이 'hybrid'인 경우)
+                # [HYBRID] BERT 기반 알파 조정 (model_type이 'hybrid'인 경우, 뉴스 기반이므로 alpha 간 공유)
                 if self.model_type == 'hybrid' and self.hybrid_predictor:
-                    try:
-                        # 뉴스 텍스트 수집 (모든 lag의 뉴스 제목 결합)
-                        all_texts = []
-                        for lag, tokens_list in news_by_lag.items():
-                            for tokens in tokens_list:
-                                if isinstance(tokens, list):
-                                    all_texts.append(" ".join(tokens))
-                                elif isinstance(tokens, str):
-                                    all_texts.append(tokens)
-                        
-                        if all_texts:
-                            bert_adj = self.hybrid_predictor.get_bert_adjustment(all_texts[:10])  # 최대 10개
-                            expected_alpha += bert_adj
-                            logger.debug(f"  [{current_date_str}] BERT adjustment: {bert_adj:.4f}")
-                    except Exception as e:
-                        logger.warning(f"  [{current_date_str}] BERT adjustment failed: {e}")
-                
-                # 4. 실제값과 비교 (다음 거래일의 수익률)
-                next_date_str = validation_dates[i+1]
-                actual_alpha = actual_prices[next_date_str]
+                    if bert_adj is None:
+                        bert_adj = self._bert_adjustment(day["news_by_lag"], current_date_str)
+                    expected_alpha += bert_adj
                 
                 is_correct = False
                 if prediction is not None:
@@ -262,51 +378,241 @@ class WalkForwardValidator:
                     "is_correct": is_correct,
                     "top_keywords": pred_res.get('top_keywords', {})
                 }
-                results.append(res_entry)
+                results[a].append(res_entry)
                 
                 # 5. DB 기록
                 if not dry_run:
-                    self.save_validation_result(res_entry, v_job_id=v_job_id, used_version_tag=used_version_tag)
+                    self.save_validation_result(res_entry, v_job_id=v_job_id, used_version_tag=used_version_tags[a])
                 
-                if i % 5 == 0 or i == len(validation_dates) - 2:
-                    logger.info(f"  [{current_date_str}] Pred: {res_entry['prediction']}, Actual Alpha: {actual_alpha:.4f}, Correct: {is_correct}")
+                if i % 5 == 0 or i == n_days - 2:
+                    logger.info(f"  [{current_date_str}] Alpha={a} Pred: {res_entry['prediction']}, Actual Alpha: {actual_alpha:.4f}, Correct: {is_correct}")
 
-                # MEMORY_OPT: Frequent GC in backtest loop
-                if i % 2 == 0:
-                    import gc
-                    gc.collect()
+    def _log_fit_stats(self, fit_stats):
+        """재학습별 celer 반복 횟수/풀이 시간을 cold/warm start로 나눠 요약"""
+        for label, group in (("cold", [f for f in fit_stats if not f["warm"]]), ("warm", [f for f in fit_stats if f["warm"]])):
+            if not group:
+                continue
+            iters = [f["n_iter"] for f in group if f["n_iter"] is not None]
+            mean_iter = f"{sum(iters) / len(iters):.1f}" if iters else "n/a"
+            mean_solve = sum(f["solve_s"] for f in group) / len(group)
+            logger.info(f"  [Fit] {self.stock_code} {label} start: {len(group)} fits, mean {mean_iter} iters, mean solve {mean_solve:.3f}s")
 
-                if progress_callback:
-                    # 0.0 ~ 1.0
-                    p = (i + 1) / len(validation_dates)
-                    progress_callback(p)
+    @staticmethod
+    def _is_main_retrain_day(i, current_date, retrain_frequency):
+        if retrain_frequency == 'daily':
+            return True
+        if retrain_frequency == 'weekly':
+            # 첫 번째 날이거나 월요일인 경우 재학습
+            return i == 0 or current_date.weekday() == 0  # Monday = 0
+        # monthly or other
+        return i == 0 or current_date.day == 1
 
-            except Exception as e:
-                logger.error(f"Error in validation loop for {current_date_str}: {e}")
+    def _segment_pool_size(self, validation_dates, retrain_frequency, segment_workers):
+        workers = segment_workers or VALIDATION_SEGMENT_WORKERS or (os.cpu_count() or 1)
+        workers = min(workers, max(1, VALIDATION_SEGMENT_MAX_WORKERS))
+        if self.model_type != 'tfidf':
+            # hybrid: BERT 모델/기술지표 캐시를 워커마다 다시 올려야 하므로 순차 실행
+            workers = 1
+        return max(1, min(workers, len(validation_dates) - 1))
 
-        # 총평 출력
-        if results:
-            hit_rate = sum(1 for r in results if r['is_correct']) / len(results)
-            mae = sum(abs(r['sentiment_score'] - r['actual_alpha']) for r in results) / len(results)
-            logger.info(f"Validation Finished ({train_days}d). Total Days: {len(results)}, Hit Rate: {hit_rate:.2%}, MAE: {mae:.4f}")
-            return {
-                "train_days": train_days,
-                "total_days": len(results),
-                "hit_rate": hit_rate,
-                "mae": mae,
-                "results": results
-            }
-        
-        self.token_fetch_cache.clear() # Clear persistent cache for this run
-        import gc
-        gc.collect()
+    @classmethod
+    def _split_segments(cls, validation_dates, retrain_frequency, n_segments):
+        """
+        검증일을 Main 재학습일에서 끊어 검증일 수가 고른 n_segments개 이하의 연속 구간으로 나눕니다.
+        Returns: [(시작 인덱스, 끝 인덱스)] - 끝 날짜는 직전 날의 실제 수익률로만 쓰이고 다음 구간의 첫날이 됨
+        """
+        n_days = len(validation_dates) - 1  # 마지막 날은 다음날 가격이 없어 검증하지 않음
+        if n_segments <= 1 or n_days < 2:
+            return [(0, max(n_days, 0))]
+        bounds = [0]
+        for i in range(1, n_days):
+            current_date = datetime.strptime(validation_dates[i], '%Y-%m-%d').date()
+            # 구간 첫날은 워커 루프의 i == 0이 되어 재학습하므로 재학습일에서만 끊음
+            if cls._is_main_retrain_day(i, current_date, retrain_frequency) and i >= len(bounds) * n_days / n_segments:
+                bounds.append(i)
+                if len(bounds) == n_segments:
+                    break
+        return list(zip(bounds, bounds[1:] + [n_days]))
+
+    def _run_segments_parallel(self, segments, validation_dates, actual_prices, alphas, used_version_tags, train_days, dry_run,
+                               progress_callback, v_job_id, prefetched_df_news, retrain_frequency):
+        """재학습 구간들을 spawn 프로세스 풀에서 실행하고 결과를 날짜 순으로 합칩니다."""
+        if prefetched_df_news is None:
+            prefetched_df_news = self._prefetch_news(validation_dates[0], validation_dates[-1], train_days)
+        corpus = SharedNewsCorpus.build(prefetched_df_news, prices=actual_prices)
+
+        settings, state = self.learner._worker_settings()
+        learner_state = {"alpha": settings["alpha"], "lags": settings["lags"], "model": state["model"],
+                         "use_stability_selection": state["use_stability_selection"],
+                         "stability_bootstraps": state["stability_bootstraps"],
+                         "stability_sample_fraction": state["stability_sample_fraction"]}
+        worker_args = [
+            (self.stock_code, self.use_sector_beta, self.model_type, self.registry is not None, learner_state, alphas,
+             used_version_tags, validation_dates[lo], validation_dates[hi], train_days, dry_run, v_job_id,
+             retrain_frequency, corpus.path)
+            for lo, hi in segments
+        ]
+        logger.info(f"[*] Running {len(segments)} validation segments in parallel for {self.stock_code}: "
+                    + ", ".join(f"{validation_dates[lo]}~{validation_dates[hi]}" for lo, hi in segments))
+
+        segment_results = [None] * len(segments)
+        total_days = len(validation_dates) - 1
+        done_days = 0
+        try:
+            # spawn: prefetch/corpus 생성에 polars를 쓴 부모를 fork하면 자식의 polars 호출이 멈춤
+            with ProcessPoolExecutor(max_workers=len(segments), mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = {executor.submit(_run_segment_worker, args): k for k, args in enumerate(worker_args)}
+                for future in as_completed(futures):
+                    k = futures[future]
+                    try:
+                        segment_results[k] = future.result()
+                    except Exception as e:
+                        # 구간을 빼고 요약하면 남은 날짜만으로 정상 결과처럼 보이므로 (BrokenProcessPool이면 전 구간) 실행 전체를 실패 처리
+                        lo, hi = segments[k]
+                        logger.error(f"Validation segment {validation_dates[lo]} ~ {validation_dates[hi]} failed: {e}")
+                        for pending in futures:
+                            pending.cancel()
+                        raise RuntimeError(f"Validation segment {validation_dates[lo]} ~ {validation_dates[hi]} failed for {self.stock_code}") from e
+                    done_days += segments[k][1] - segments[k][0]
+                    if progress_callback:
+                        progress_callback(done_days / (total_days + 1))
+        finally:
+            corpus.cleanup()
+
+        # 구간 순서 = 날짜 순서
+        results = {a: [] for a in alphas}
+        stopped = False
+        for seg in segment_results:
+            for a in alphas:
+                results[a].extend(seg[a]["results"])
+                stopped = stopped or seg[a].get("status") == "stopped"
+        if stopped:
+            return {a: {"train_days": train_days, "total_days": len(results[a]), "hit_rate": 0, "mae": 0, "results": results[a], "status": "stopped"} for a in alphas}
+        return self._summarize(results, alphas, train_days)
+
+    def _summarize(self, results, alphas, train_days):
+        summaries = {}
+        for a in alphas:
+            res_a = results[a]
+            if res_a:
+                hit_rate = sum(1 for r in res_a if r['is_correct']) / len(res_a)
+                mae = sum(abs(r['sentiment_score'] - r['actual_alpha']) for r in res_a) / len(res_a)
+                logger.info(f"Validation Finished ({train_days}d, Alpha: {a}). Total Days: {len(res_a)}, Hit Rate: {hit_rate:.2%}, MAE: {mae:.4f}")
+                summaries[a] = {
+                    "train_days": train_days,
+                    "total_days": len(res_a),
+                    "hit_rate": hit_rate,
+                    "mae": mae,
+                    "results": res_a
+                }
+            else:
+                summaries[a] = {"train_days": train_days, "total_days": 0, "hit_rate": 0, "mae": 0, "results": []}
+        return summaries
+
+    def _train_dicts(self, alphas, versions, train_start, train_end, source, df_all_news):
+        """단일 alpha는 기존 run_training, 여러 alpha는 warm start path 학습으로 사전을 만듭니다."""
+        self._retrain_count += 1
+        persist = None # registry 모드면 메모리만, 아니면 DB
+        if self.registry is not None and BACKTEST_PERSIST_EVERY > 0 and self._retrain_count % BACKTEST_PERSIST_EVERY == 0:
+            persist = True # Opt-in 샘플 저장
         
-        return {"train_days": train_days, "total_days": 0, "hit_rate": 0, "mae": 0, "results": []}
+        if len(alphas) == 1:
+            self.learner.run_training(
+                self.stock_code,
+                train_start.strftime('%Y-%m-%d'),
+                train_end.strftime('%Y-%m-%d'),
+                version=versions[alphas[0]],
+                source=source,
+                prefetched_df_news=df_all_news,
+                persist=persist
+            )
+        else:
+            self.learner.run_training_path(
+                self.stock_code,
+                train_start.strftime('%Y-%m-%d'),
+                train_end.strftime('%Y-%m-%d'),
+                alphas,
+                versions,
+                source=source,
+                prefetched_df_news=df_all_news,
+                persist=persist
+            )
+
+    def _bert_adjustment(self, news_by_lag, current_date_str):
+        try:
+            # 뉴스 텍스트 수집 (모든 lag의 뉴스 제목 결합)
+            all_texts = []
+            for lag, tokens_list in news_by_lag.items():
+                for tokens in tokens_list:
+                    if isinstance(tokens, list):
+                        all_texts.append(" ".join(tokens))
+                    elif isinstance(tokens, str):
+                        all_texts.append(tokens)
+            
+            if all_texts:
+                bert_adj = self.hybrid_predictor.get_bert_adjustment(all_texts[:10])  # 최대 10개
+                logger.debug(f"  [{current_date_str}] BERT adjustment: {bert_adj:.4f}")
+                return bert_adj
+        except Exception as e:
+            logger.warning(f"  [{current_date_str}] BERT adjustment failed: {e}")
+        return 0.0
+
+    def fetch_actual_prices(self, start_date, end_date):
+        """검증 기간의 일별 수익률(alpha)을 {'YYYY-MM-DD': alpha}로 반환합니다."""
+        with get_db_cursor() as cur:
+            if self.use_sector_beta:
+                sql = """
+                    SELECT date, (return_rate - COALESCE(sector_return, 0)) as alpha 
+                    FROM tb_daily_price 
+                    WHERE stock_code = %s AND date BETWEEN %s AND %s
+                    ORDER BY date ASC
+                """
+            else:
+                sql = """
+                    SELECT date, excess_return as alpha 
+                    FROM tb_daily_price 
+                    WHERE stock_code = %s AND date BETWEEN %s AND %s
+                    ORDER BY date ASC
+                """
+            cur.execute(sql, (self.stock_code, start_date, end_date))
+            return {row['date'].strftime('%Y-%m-%d'): float(row['alpha']) for row in cur.fetchall()}
+
+    def build_news_bags(self, df_all_news):
+        """
+        prefetch·토큰화된 뉴스('date', 'tokens')를 impact 거래일 위치별 토큰 묶음으로 한 번 정리합니다.
+        이후 fetch_historical_news_by_lag는 검증일마다 SQL/토큰화 없이 거래일 위치로 조회합니다.
+        impact date는 학습 피처(prepare_features)와 같은 Calendar.get_impact_dates 매핑을 사용.
+        토큰 컬럼이 없으면 None으로 두어 기존 SQL 조회를 사용합니다.
+        """
+        from src.utils.calendar import Calendar
+        self._bag_lists = {}
+        if df_all_news is None or (not df_all_news.is_empty() and "tokens" not in df_all_news.columns):
+            self._news_bags = None
+            return
+        if df_all_news.is_empty():
+            self._news_bags = ({}, pl.Series("tokens", [], dtype=pl.List(pl.String)))
+            return
+
+        trading_days = Calendar.get_trading_days(self.stock_code)
+        daily = (
+            df_all_news.select(
+                Calendar.get_impact_dates(self.stock_code, df_all_news["date"]).alias("date"),
+                pl.col("tokens"),
+            )
+            .drop_nulls("date")
+            .group_by("date").agg(pl.col("tokens").flatten())
+        )
+        bags = (
+            pl.DataFrame({"date": trading_days}, schema={"date": pl.Date})
+            .with_row_index("pos")
+            .join(daily, on="date", how="inner")
+        )
+        # {거래일 위치: bags 행 번호}, 토큰은 polars List 컬럼으로 보관 (조회 시에만 list로 변환)
+        self._news_bags = (dict(zip(bags["pos"].to_list(), range(len(bags)))), bags["tokens"])
 
     def fetch_historical_news_by_lag(self, target_date, lag_limit, cache=None):
-        from src.nlp.tokenizer import Tokenizer
         from src.utils.calendar import Calendar
-        tokenizer = Tokenizer()
+        token_store = self.learner.token_store
         news_by_lag = {}
         
         # 1. 대상 종목의 거래일 목록 가져오기
@@ -315,15 +621,30 @@ class WalkForwardValidator:
             return {}
 
         # 2. 검증 대상일(target_date)의 인덱스 찾기
-        idx = -1
-        for i, d in enumerate(trading_days):
-            if d == target_date:
-                idx = i
-                break
-        
-        if idx == -1:
+        idx = bisect.bisect_left(trading_days, target_date)
+        if idx == len(trading_days) or trading_days[idx] != target_date:
             return {}
 
+        if self._news_bags is not None:
+            # prefetch된 코퍼스의 거래일별 토큰 묶음에서 조회 (DB 접근 없음)
+            rows, tokens = self._news_bags
+            # 오늘의 L1 묶음은 내일의 L2: 같은 list 객체를 넘겨 predict_batch가 한 번만 펼치도록 함
+            window = {}
+            for lag in range(1, lag_limit + 1):
+                pos = idx - (lag - 1)
+                if pos < 0:
+                    break
+                row = rows.get(pos)
+                if row is not None:
+                    bag = self._bag_lists.get(row)
+                    if bag is None:
+                        bag = tokens[row].to_list()
+                    window[row] = bag
+                    if bag:
+                        news_by_lag[lag] = bag
+            self._bag_lists = window
+            return news_by_lag
+
         with get_db_cursor() as cur:
             for lag in range(1, lag_limit + 1):
                 if idx - (lag - 1) < 0:
@@ -342,7 +663,7 @@ class WalkForwardValidator:
                 
                 # Impact Date Logic: (prev_trading_day) 16:00 <= published_at < (actual_impact_date) 16:00
                 cur.execute("""
-                    SELECT c.content
+                    SELECT c.content, c.keywords->>'v' AS token_version, c.keywords->>'t' AS stored_tokens
                     FROM tb_news_content c
                     JOIN tb_news_mapping m ON c.url_hash = m.url_hash
                     WHERE m.stock_code = %s 
@@ -360,7 +681,7 @@ class WalkForwardValidator:
                         if content in GLOBAL_TOKEN_CACHE:
                             tokens.extend(GLOBAL_TOKEN_CACHE[content])
                         else:
-                            t = tokenizer.tokenize(content)
+                            t = token_store.tokens(content, row['token_version'], row['stored_tokens'])
                             if len(GLOBAL_TOKEN_CACHE) < 10000:
                                 GLOBAL_TOKEN_CACHE[content] = t
                             tokens.extend(t)
@@ -397,21 +718,43 @@ class WalkForwardValidator:
         return {}
 
     def save_validation_result(self, res, v_job_id=None, used_version_tag='v_job'):
+        """결과 행을 버퍼에 쌓음 - DB 기록은 flush_validation_results()에서 execute_values로 한 번에"""
         import json
-        with get_db_cursor() as cur:
-            if v_job_id:
-                # Backtest mode: Save to tb_verification_results
-                cur.execute("""
-                    INSERT INTO tb_verification_results (v_job_id, target_date, predicted_score, actual_alpha, is_correct, used_version)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """, (v_job_id, res['date'], res['sentiment_score'], res['actual_alpha'], res['is_correct'], used_version_tag))
-            else:
-                # Production/Manual mode: Save to tb_predictions
-                cur.execute("""
-                    INSERT INTO tb_predictions (stock_code, prediction_date, sentiment_score, prediction, actual_alpha, is_correct, top_keywords)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT DO NOTHING
-                """, (self.stock_code, res['date'], res['sentiment_score'], res['prediction'], res['actual_alpha'], res['is_correct'], json.dumps(res.get('top_keywords', {}))))
+        if v_job_id:
+            # Backtest mode: tb_verification_results
+            self._pending_verification_rows.append(
+                (v_job_id, res['date'], res['sentiment_score'], res['actual_alpha'], res['is_correct'], used_version_tag)
+            )
+        else:
+            # Production/Manual mode: tb_predictions
+            self._pending_prediction_rows.append(
+                (self.stock_code, res['date'], res['sentiment_score'], res['prediction'], res['actual_alpha'], res['is_correct'], json.dumps(res.get('top_keywords', {})))
+            )
+
+    def flush_validation_results(self):
+        """버퍼에 쌓인 검증 결과를 테이블별 INSERT 한 번으로 기록합니다. Returns: 기록한 행 수"""
+        verification, predictions = self._pending_verification_rows, self._pending_prediction_rows
+        if not verification and not predictions:
+            return 0
+        self._pending_verification_rows, self._pending_prediction_rows = [], []
+        from psycopg2.extras import execute_values
+        try:
+            with get_db_cursor() as cur:
+                if verification:
+                    execute_values(cur, """
+                        INSERT INTO tb_verification_results (v_job_id, target_date, predicted_score, actual_alpha, is_correct, used_version)
+                        VALUES %s
+                    """, verification, page_size=RESULT_INSERT_PAGE_SIZE)
+                if predictions:
+                    execute_values(cur, """
+                        INSERT INTO tb_predictions (stock_code, prediction_date, sentiment_score, prediction, actual_alpha, is_correct, top_keywords)
+                        VALUES %s
+                        ON CONFLICT DO NOTHING
+                    """, predictions, page_size=RESULT_INSERT_PAGE_SIZE)
+        except Exception as e:
+            logger.error(f"Failed to save {len(verification) + len(predictions)} validation results for {self.stock_code}: {e}")
+            return 0
+        return len(verification) + len(predictions)
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,184 @@
+# src/nlp/hashed_vectorizer.py
+"""
+Hashed TF-IDF vectorizer (LassoLearner text_engine='hashing').
+
+Tokens are hashed (MurmurHash3, sklearn HashingVectorizer) into a fixed space of
+n_features buckets, so no vocabulary dict is built or sorted and a bucket keeps
+the same index across retrain windows. Document frequencies are accumulated in
+a dense array that can be updated in streaming chunks (partial_fit);
+min_df / max_df / max_features select the active buckets, and transform()
+returns the smooth-IDF, L2-normalized columns of the active buckets only
+(active_buckets_), matching TfidfVectorizer's defaults.
+
+Hash buckets have no names. After training, LassoLearner resolves only the
+buckets with nonzero coefficients back to tokens (resolve), so sentiment
+dictionaries keep readable "word_L{k}" keys.
+"""
+from collections import Counter
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+DEFAULT_HASH_FEATURES = 2 ** 18
+FIT_CHUNK_SIZE = 4096
+
+
+def _identity(tokens):
+    return tokens
+
+
+class HashedTfidfVectorizer:
+    def __init__(self, n_features=DEFAULT_HASH_FEATURES, min_df=1, max_df=1.0, max_features=None, dtype=np.float64):
+        self.n_features = n_features
+        self.min_df = min_df
+        self.max_df = max_df
+        self.max_features = max_features
+        self.dtype = np.dtype(dtype)
+        self.hasher = HashingVectorizer(
+            analyzer=_identity,
+            n_features=n_features,
+            alternate_sign=False,
+            norm=None,
+            dtype=self.dtype,  # count는 정수라 float32로도 정확
+        )
+        self.reset()
+
+    def reset(self):
+        self.n_docs_ = 0
+        self.df_ = np.zeros(self.n_features, dtype=np.int64)
+        self.tf_ = np.zeros(self.n_features, dtype=np.float64)
+        self.idf_ = None
+        self.active_buckets_ = None
+        self.reverse_map_ = {}  # bucket -> token (0이 아닌 계수의 버킷만)
+
+    # --- DF/IDF 통계 ---
+    def partial_fit(self, docs, doc_counts=None):
+        """문서 청크의 DF/TF 통계를 누적합니다. doc_counts: 문서별 반복 횟수 (같은 문서를 여러 번 참조할 때)"""
+        counts = self.hasher.transform(docs)
+        self._accumulate(counts, doc_counts)
+        return self
+
+    def _accumulate(self, counts, doc_counts=None):
+        counts = sparse.csr_matrix(counts)
+        presence = counts.copy()
+        presence.data = np.ones_like(presence.data)
+        if doc_counts is None:
+            self.n_docs_ += counts.shape[0]
+            self.df_ += np.asarray(presence.sum(axis=0)).ravel().astype(np.int64)
+            self.tf_ += np.asarray(counts.sum(axis=0)).ravel()
+        else:
+            doc_counts = np.asarray(doc_counts, dtype=np.float64)
+            self.n_docs_ += int(doc_counts.sum())
+            self.df_ += np.rint(presence.T @ doc_counts).astype(np.int64)
+            self.tf_ += counts.T @ doc_counts
+        self.idf_ = None
+
+    def fit(self, docs, doc_counts=None):
+        """통계를 초기화하고 docs(리스트 또는 제너레이터)를 청크 단위로 스트리밍하며 학습합니다."""
+        self.reset()
+        if doc_counts is not None:
+            self.partial_fit(docs, doc_counts)
+        else:
+            chunk = []
+            for doc in docs:
+                chunk.append(doc)
+                if len(chunk) >= FIT_CHUNK_SIZE:
+                    self.partial_fit(chunk)
+                    chunk = []
+            if chunk:
+                self.partial_fit(chunk)
+        self._finalize()
+        return self
+
+    def fit_transform(self, docs, doc_counts=None):
+        """해싱 1회로 학습과 변환을 함께 수행합니다 (docs는 리스트)."""
+        self.reset()
+        counts = sparse.csr_matrix(self.hasher.transform(docs))
+        self._accumulate(counts, doc_counts)
+        self._finalize()
+        return self._weight(counts)
+
+    def load_stats(self, df, tf, n_docs):
+        """외부에서 누적한 DF/TF 통계 (SlidingDocumentFrequency)로 IDF를 확정합니다."""
+        self.reset()
+        self.df_ = np.asarray(df, dtype=np.int64).copy()
+        self.tf_ = np.asarray(tf, dtype=np.float64).copy()
+        self.n_docs_ = int(n_docs)
+        self._finalize()
+        return self
+
+    def _finalize(self):
+        n = self.n_docs_
+        min_count = self.min_df if isinstance(self.min_df, (int, np.integer)) else self.min_df * n
+        max_count = self.max_df if isinstance(self.max_df, (int, np.integer)) else self.max_df * n
+        active = (self.df_ >= min_count) & (self.df_ <= max_count) & (self.df_ > 0)
+        if self.max_features is not None and active.sum() > self.max_features:
+            # TfidfVectorizer와 동일하게 코퍼스 전체 빈도 상위 max_features만 유지
+            candidates = np.where(active)[0]
+            top = candidates[np.argsort(-self.tf_[candidates], kind="stable")[:self.max_features]]
+            active = np.zeros(self.n_features, dtype=bool)
+            active[top] = True
+        if not active.any():
+            raise ValueError("After pruning, no terms remain. Try a lower min_df or a higher max_df.")
+        # smooth_idf: log((1 + n) / (1 + df)) + 1
+        idf = np.log((1.0 + n) / (1.0 + self.df_)) + 1.0
+        self.active_buckets_ = np.flatnonzero(active)
+        self.idf_ = idf[self.active_buckets_]
+
+    # --- 변환 ---
+    def transform(self, docs):
+        if self.idf_ is None:
+            if self.n_docs_ == 0:
+                raise ValueError("HashedTfidfVectorizer is not fitted")
+            self._finalize()
+        return self._weight(sparse.csr_matrix(self.hasher.transform(docs)))
+
+    def transform_counts(self, counts):
+        """이미 해싱된 count 행렬 (n_features 열)을 TF-IDF로 변환"""
+        return self._weight(sparse.csr_matrix(counts))
+
+    def _weight(self, counts):
+        X = counts[:, self.active_buckets_].tocsr().astype(self.dtype, copy=False)
+        # 제자리 곱셈으로 dtype 유지 (.multiply(idf_)는 float64로 올라감)
+        X.data *= self.idf_[X.indices]
+        return normalize(X, norm="l2", copy=False)
+
+    # --- 버킷 <-> 토큰 ---
+    def buckets(self, tokens):
+        """토큰별 해시 버킷 인덱스 배열"""
+        tokens = list(tokens)
+        if not tokens:
+            return np.zeros(0, dtype=np.int64)
+        return sparse.csr_matrix(self.hasher.transform([[t] for t in tokens])).indices.astype(np.int64)
+
+    def bucket_mask(self, words):
+        """words 중 하나라도 해시되는 버킷이면 True (CRITICAL_WORDS / Global Lexicon 마스크용)"""
+        mask = np.zeros(self.n_features, dtype=bool)
+        mask[self.buckets(words)] = True
+        return mask
+
+    def resolve(self, buckets, docs):
+        """
+        버킷 -> 토큰 역매핑. 이미 해석된 버킷은 캐시를 사용하고, 나머지만 docs를 한 번 훑어
+        가장 빈도가 높은 토큰을 대표 이름으로 고릅니다 (해시 충돌 시).
+        """
+        missing = {int(b) for b in buckets} - self.reverse_map_.keys()
+        if missing:
+            freq = Counter()
+            for doc in docs:
+                freq.update(doc)
+            if freq:
+                tokens = list(freq)
+                token_buckets = self.buckets(tokens)
+                best = {}
+                for token, b in zip(tokens, token_buckets):
+                    b = int(b)
+                    if b in missing and freq[token] > best.get(b, (None, 0))[1]:
+                        best[b] = (token, freq[token])
+                self.reverse_map_.update({b: token for b, (token, _) in best.items()})
+        return {int(b): self.reverse_map_.get(int(b), f"#{int(b)}") for b in buckets}
+
+    def get_feature_names_out(self):
+        """transform() 컬럼 이름 (해석된 버킷은 토큰, 나머지는 '#<bucket>')"""
+        return np.array([self.reverse_map_.get(int(b), f"#{b}") for b in self.active_buckets_], dtype=object)
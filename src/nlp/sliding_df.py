@@ -0,0 +1,167 @@
+# src/nlp/sliding_df.py
+"""
+Sliding-window document-frequency statistics for walk-forward retraining.
+
+A walk-forward retrain shifts the training window by a few trading days, so
+almost every daily document is the same as in the previous retrain. Instead of
+refitting TF-IDF over the whole window, LassoLearner (incremental_df=True)
+keeps:
+
+- DocTermCache: per impact-date term-count rows in an append-only column space
+  (token ids for text_engine='tfidf', hash buckets for 'hashing'), keyed by
+  (date, content signature) so a date whose news changed is re-counted.
+- SlidingDocumentFrequency: DF/TF sums of one training window, weighted by how
+  many (row, lag) documents reference each date. update() adds the entering
+  dates and subtracts the leaving ones.
+
+tfidf_vocabulary() applies TfidfVectorizer's min_df / max_df / max_features
+rules to the sums, so the vocabulary and IDF equal a full refit on the same
+(row x lag) documents.
+"""
+from collections import Counter
+import numpy as np
+from scipy import sparse
+
+
+def doc_signature(doc):
+    """순서와 무관한 토큰 multiset 서명 (같은 날짜라도 뉴스 구성이 바뀌면 달라짐)"""
+    return (len(doc), sum(map(hash, doc)))
+
+
+class DocTermCache:
+    def __init__(self, hasher=None):
+        self.hasher = hasher  # None이면 토큰 id (append-only vocabulary) 모드
+        self.vocab = {}
+        self.terms = []
+        self._rows = {}  # (key, signature) -> (indices, counts)
+
+    @property
+    def n_columns(self):
+        return self.hasher.n_features if self.hasher is not None else len(self.terms)
+
+    def row(self, key, signature, doc):
+        entry = self._rows.get((key, signature))
+        if entry is None:
+            entry = self._encode(doc)
+            self._rows[(key, signature)] = entry
+        return entry
+
+    def _encode(self, doc):
+        if self.hasher is not None:
+            counts = sparse.csr_matrix(self.hasher.transform([doc]))
+            return counts.indices.astype(np.int64), counts.data.astype(np.float64)
+        freq = Counter(doc)
+        ids = np.empty(len(freq), dtype=np.int64)
+        for j, term in enumerate(freq):
+            idx = self.vocab.get(term)
+            if idx is None:
+                idx = self.vocab[term] = len(self.terms)
+                self.terms.append(term)
+            ids[j] = idx
+        return ids, np.fromiter(freq.values(), dtype=np.float64, count=len(freq))
+
+    def matrix(self, entries):
+        """entries: [(key, signature)] -> 캐시된 행으로 만든 count 행렬 (CSR, n_columns 열)"""
+        rows = [self._rows[e] for e in entries]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        if rows:
+            indptr[1:] = np.cumsum([len(ids) for ids, _ in rows])
+            indices = np.concatenate([ids for ids, _ in rows])
+            data = np.concatenate([counts for _, counts in rows])
+        else:
+            indices = np.zeros(0, dtype=np.int64)
+            data = np.zeros(0, dtype=np.float64)
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), self.n_columns))
+
+    def retain(self, entries):
+        """현재 어떤 윈도우도 참조하지 않는 행은 버림"""
+        entries = set(entries)
+        for e in [e for e in self._rows if e not in entries]:
+            del self._rows[e]
+
+    def __len__(self):
+        return len(self._rows)
+
+
+class SlidingDocumentFrequency:
+    def __init__(self, cache):
+        self.cache = cache
+        self.weights = {}  # (key, signature) -> 참조 횟수
+        self.df = np.zeros(0, dtype=np.int64)
+        self.tf = np.zeros(0, dtype=np.float64)
+        self.n_docs = 0
+        self.last_delta = 0  # 직전 update에서 통계를 갱신한 날짜 수
+
+    def update(self, keys, docs, weights, n_empty=0):
+        """
+        윈도우를 (keys, docs, weights)로 옮깁니다. weights[i] = docs[i]를 참조하는 (행 x lag) 문서 수,
+        n_empty = 뉴스가 없는 (행 x lag) 문서 수 (DF 분모에만 포함).
+        Returns: 각 문서의 캐시 엔트리 [(key, signature)]
+        """
+        entries = [(key, doc_signature(doc)) for key, doc in zip(keys, docs)]
+        new_weights = {}
+        for e, w in zip(entries, weights):
+            new_weights[e] = new_weights.get(e, 0) + int(w)
+
+        delta = {e: w for e, w in new_weights.items() if w != self.weights.get(e, 0)}
+        for e, w in self.weights.items():
+            if e not in new_weights:
+                delta[e] = 0
+
+        docs_by_entry = dict(zip(entries, docs))
+        for e, w_new in delta.items():
+            dw = w_new - self.weights.get(e, 0)
+            ids, counts = self.cache.row(e[0], e[1], docs_by_entry.get(e))
+            self._grow(self.cache.n_columns)
+            self.df[ids] += dw
+            self.tf[ids] += dw * counts
+
+        self.weights = new_weights
+        self.n_docs = int(sum(new_weights.values())) + int(n_empty)
+        self.last_delta = len(delta)
+        return entries
+
+    def _grow(self, n_columns):
+        if len(self.df) < n_columns:
+            extra = max(n_columns - len(self.df), len(self.df) // 2)
+            self.df = np.concatenate([self.df, np.zeros(extra, dtype=np.int64)])
+            self.tf = np.concatenate([self.tf, np.zeros(extra, dtype=np.float64)])
+
+    def stats(self):
+        """(df, tf, n_docs) - 캐시 컬럼 공간 기준"""
+        n = self.cache.n_columns
+        self._grow(n)
+        return self.df[:n], self.tf[:n], self.n_docs
+
+    def tfidf_vocabulary(self, min_df=1, max_df=1.0, max_features=None):
+        """
+        TfidfVectorizer.fit과 같은 규칙으로 어휘/IDF를 계산합니다 (토큰 id 모드).
+        Returns: (vocabulary {term: col}, idf, kept = 어휘 컬럼 순서의 캐시 컬럼 인덱스)
+        """
+        df, tf, n = self.stats()
+        candidates = np.flatnonzero(df > 0)
+        if len(candidates) == 0:
+            raise ValueError("empty vocabulary; perhaps the documents only contain stop words")
+        terms = self.cache.terms
+        # 어휘는 사전순 정렬 후 빈도 상한/하한과 max_features 적용 (_sort_features -> _limit_features)
+        order = candidates[np.argsort(np.array([terms[i] for i in candidates], dtype=object), kind="stable")]
+        dfs = df[order]
+        high = max_df if isinstance(max_df, (int, np.integer)) else max_df * n
+        low = min_df if isinstance(min_df, (int, np.integer)) else min_df * n
+        if high < low:
+            raise ValueError("max_df corresponds to < documents than min_df")
+        mask = (dfs <= high) & (dfs >= low)
+        if max_features is not None and mask.sum() > max_features:
+            tfs = tf[order]
+            mask_inds = (-tfs[mask]).argsort()[:max_features]
+            new_mask = np.zeros(len(dfs), dtype=bool)
+            new_mask[np.where(mask)[0][mask_inds]] = True
+            mask = new_mask
+        kept = order[mask]
+        if len(kept) == 0:
+            raise ValueError("After pruning, no terms remain. Try a lower min_df or a higher max_df.")
+
+        vocabulary = {terms[i]: j for j, i in enumerate(kept)}
+        # smooth_idf: log((n + 1) / (df + 1)) + 1
+        idf = np.log(float(n + 1) / (df[kept].astype(np.float64) + 1.0)) + 1.0
+        return vocabulary, idf, kept
@@ -0,0 +1,82 @@
+# src/nlp/token_store.py
+"""
+Pre-tokenized news store.
+
+BodyCollector stores the base (1-gram) tokens of each article's `content` in
+tb_news_content.keywords once, at collection time:
+
+    {"v": "<tokenizer fingerprint>", "t": "token1 token2 ..."}
+
+Readers select `keywords->>'v' AS token_version, keywords->>'t' AS stored_tokens`
+and call NewsTokenStore.tokens(...). When the fingerprint matches the current
+Tokenizer (same schema, dictionary and stopwords) the stored tokens are used and
+n-grams are derived in Python; otherwise the content is re-tokenized with MeCab.
+"""
+import polars as pl
+from src.nlp.tokenizer import Tokenizer
+
+TOKEN_SEPARATOR = " "
+
+
+class NewsTokenStore:
+    def __init__(self, tokenizer=None):
+        self.tokenizer = tokenizer or Tokenizer()
+
+    @property
+    def fingerprint(self):
+        return self.tokenizer.fingerprint
+
+    def encode(self, content):
+        """content를 토큰화하여 tb_news_content.keywords에 저장할 JSON 객체를 반환합니다."""
+        base_tokens = self.tokenizer.tokenize_base(content) if content else []
+        return {"v": self.fingerprint, "t": TOKEN_SEPARATOR.join(base_tokens)}
+
+    def is_current(self, token_version):
+        return token_version == self.fingerprint
+
+    def decode(self, token_version, stored_tokens):
+        """저장된 토큰이 현재 토크나이저 버전과 일치하면 1-gram 리스트, 아니면 None."""
+        if stored_tokens is None or not self.is_current(token_version):
+            return None
+        return stored_tokens.split()
+
+    def base_tokens(self, content, token_version=None, stored_tokens=None):
+        tokens = self.decode(token_version, stored_tokens)
+        if tokens is None:
+            tokens = self.tokenizer.tokenize_base(content) if content else []
+        return tokens
+
+    def tokens(self, content, token_version=None, stored_tokens=None, n_gram=1):
+        """Tokenizer.tokenize(content, n_gram)과 동일한 결과를 저장된 토큰 우선으로 반환합니다."""
+        return Tokenizer.expand_ngrams(self.base_tokens(content, token_version, stored_tokens), n_gram)
+
+    def add_tokens_column(self, df, n_gram=1, content_col="final_content", use_stored=True, cache=None, cache_limit=20000):
+        """
+        DataFrame에 'tokens' 리스트 컬럼을 추가합니다.
+        use_stored: content_col이 원문(content)일 때만 True (요약문 사용 시 저장 토큰과 불일치)
+        cache: 재토큰화 결과를 content 키로 보관할 dict (선택)
+        """
+        if df.is_empty():
+            return df.with_columns(pl.lit([], dtype=pl.List(pl.String)).alias("tokens"))
+
+        has_stored = use_stored and "token_version" in df.columns and "stored_tokens" in df.columns
+        fingerprint = self.fingerprint
+
+        def to_tokens(row):
+            if has_stored and row["token_version"] == fingerprint and row["stored_tokens"] is not None:
+                return Tokenizer.expand_ngrams(row["stored_tokens"].split(), n_gram)
+            content = row[content_col]
+            if cache is not None and content in cache:
+                return cache[content]
+            tokens = self.tokenizer.tokenize(content, n_gram=n_gram)
+            if cache is not None:
+                if len(cache) > cache_limit:
+                    for k in list(cache.keys())[:cache_limit // 4]:
+                        del cache[k]
+                cache[content] = tokens
+            return tokens
+
+        cols = [content_col] + (["token_version", "stored_tokens"] if has_stored else [])
+        return df.with_columns(
+            pl.struct(cols).map_elements(to_tokens, return_dtype=pl.List(pl.String)).alias("tokens")
+        )
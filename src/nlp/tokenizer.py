@@ -1,5 +1,9 @@
 import mecab_ko as MeCab
 import os
+import hashlib
+
+# Bump when tokenize_base() logic changes so stored tokens (tb_news_content.keywords) are invalidated
+TOKENIZER_SCHEMA_VERSION = 1
 
 class Tokenizer:
     def __init__(self, dic_path=None, user_dic_path=None, stopwords_path=None):
@@ -13,14 +17,34 @@ class Tokenizer:
         # Stopwords 로딩
         self.stopwords = self._load_stopwords(stopwords_path)
             
+        self.dic_path = dic_path
+        self.user_dic_path = None
         if user_dic_path and os.path.exists(user_dic_path):
             self.tagger = MeCab.Tagger(f"-d {dic_path} -u {user_dic_path}")
+            self.user_dic_path = user_dic_path
         else:
             # 로컬 환경에서 dic_path가 없을 경우 기본 Tagger 사용
             try:
                 self.tagger = MeCab.Tagger(f"-d {dic_path}")
             except Exception:
                 self.tagger = MeCab.Tagger()
+                self.dic_path = None
+        
+        self.fingerprint = self._compute_fingerprint()
+    
+    def _compute_fingerprint(self):
+        """
+        토크나이저 구성(스키마 버전, 시스템/사용자 사전, 불용어)의 지문.
+        저장된 토큰(tb_news_content.keywords)이 현재 토크나이저와 호환되는지 판단하는 데 사용합니다.
+        """
+        h = hashlib.sha1()
+        h.update(f"schema={TOKENIZER_SCHEMA_VERSION}|dic={self.dic_path or 'default'}".encode())
+        if self.user_dic_path:
+            st = os.stat(self.user_dic_path)
+            h.update(f"|udic={st.st_size}:{int(st.st_mtime)}".encode())
+        h.update("|stop=".encode())
+        h.update("\n".join(sorted(self.stopwords)).encode('utf-8'))
+        return h.hexdigest()[:12]
     
     def _load_stopwords(self, stopwords_path=None, stock_code=None):
         """불용어 목록 로드 (정적 + 동적 학습된 불용어)"""
@@ -87,6 +111,10 @@ class Tokenizer:
         2. 불용어 필터 (stopwords.txt)
         3. 길이 필터 (1자 이하 제외)
         """
+        return self.expand_ngrams(self.tokenize_base(text), n_gram)
+
+    def tokenize_base(self, text):
+        """POS/길이/불용어 필터를 거친 1-gram 토큰 (N-gram은 expand_ngrams로 파생)"""
         if not text:
             return []
             
@@ -101,9 +129,13 @@ class Tokenizer:
                     if token not in self.stopwords:  # 불용어 필터링
                         base_tokens.append(str(token))
             node = node.next
-        
+        return base_tokens
+
+    @staticmethod
+    def expand_ngrams(base_tokens, n_gram=1):
+        """1-gram 토큰 리스트로부터 1~n_gram 토큰을 생성합니다 (tokenize와 동일한 순서)."""
         if n_gram <= 1:
-            return base_tokens
+            return list(base_tokens)
         
         result_tokens = list(base_tokens)
         for n in range(2, n_gram + 1):
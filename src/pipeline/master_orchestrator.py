@@ -51,6 +51,41 @@ class MasterOrchestrator:
                 })
                 logger.info(f"[Orchestrator] Successfully queued {v_type} #{v_job_id}")
 
+    @staticmethod
+    def trigger_batch_training(stock_codes=None):
+        """
+        Nightly retrain of many stocks as one DAILY_UPDATE_BATCH job: the union of their
+        news is fetched and tokenized once and shared across the per-stock fits.
+        stock_codes=None trains every active daily target.
+        """
+        v_type = "DAILY_UPDATE_BATCH"
+        logger.info(f"[Orchestrator] Triggering Batch Training for {len(stock_codes) if stock_codes else 'all active'} stocks")
+
+        with get_db_cursor() as cur:
+            cur.execute("""
+                SELECT v_job_id FROM tb_verification_jobs
+                WHERE v_type = %s AND status IN ('pending', 'running')
+            """, (v_type,))
+            if cur.fetchone():
+                logger.warning(f"[Orchestrator] {v_type} already pending/running. Skipping trigger.")
+                return None
+
+            params = {"reason": "automated_master_pipeline_trigger", "stock_codes": stock_codes}
+            cur.execute("""
+                INSERT INTO tb_verification_jobs (stock_code, v_type, status, params)
+                VALUES (NULL, %s, 'pending', %s)
+                RETURNING v_job_id
+            """, (v_type, json.dumps(params)))
+            v_job_id = cur.fetchone()['v_job_id']
+
+        publish_verification_job({
+            "v_job_id": v_job_id,
+            "v_type": v_type,
+            "stock_codes": stock_codes
+        })
+        logger.info(f"[Orchestrator] Successfully queued {v_type} #{v_job_id}")
+        return v_job_id
+
     @staticmethod
     def trigger_stage_3_report(stock_code, target_date=None, v_job_id=None):
         """
@@ -64,6 +99,10 @@ class MasterOrchestrator:
 
 if __name__ == "__main__":
     import sys
+    if len(sys.argv) > 1 and sys.argv[1] == "train-batch":
+        # python -m src.pipeline.master_orchestrator train-batch [stock_code ...]
+        MasterOrchestrator.trigger_batch_training(sys.argv[2:] or None)
+        sys.exit(0)
     if len(sys.argv) > 2:
         cmd = sys.argv[1]
         stock = sys.argv[2]
@@ -3,6 +3,7 @@ from src.db.connection import get_db_cursor
 import json
 import logging
 import math
+import polars as pl
 from datetime import datetime, date, timedelta
 
 logger = logging.getLogger(__name__)
@@ -13,8 +14,50 @@ CRITICAL_WORDS = {
     "부도", "파산", "상장폐지", "거래정지", "분식회계", "하한가", "유상증자"
 }
 
+# Threshold for filtering near-zero noise
+CONTRIBUTION_THRESHOLD = 1e-5
+
 class Predictor:
+    def __init__(self, registry=None):
+        # ModelRegistry (백테스트 모드): 학습 직후의 사전을 DB 대신 메모리에서 조회
+        self.registry = registry
+
+    @property
+    def token_store(self):
+        # MeCab 초기화 비용이 있으므로 최초 사용 시 한 번만 생성
+        if getattr(self, "_token_store", None) is None:
+            from src.nlp.token_store import NewsTokenStore
+            self._token_store = NewsTokenStore()
+        return self._token_store
+
+    def load_artifact(self, version, stock_code, source='Main'):
+        """tb_model_artifact의 바이너리 모델 (없거나 테이블이 아직 없으면 None)"""
+        from src.learner.model_artifact import ModelArtifact
+        try:
+            with get_db_cursor() as cur:
+                cur.execute(
+                    "SELECT payload FROM tb_model_artifact WHERE version = %s AND source = %s AND stock_code = %s",
+                    (version, source, stock_code)
+                )
+                row = cur.fetchone()
+        except Exception as e:
+            logger.debug(f"Model artifact lookup failed for {stock_code} {version} ({source}): {e}")
+            return None
+        if not row or row['payload'] is None:
+            return None
+        try:
+            return ModelArtifact.from_bytes(row['payload'])
+        except Exception as e:
+            logger.warning(f"Ignoring model artifact for {stock_code} {version} ({source}): {e}")
+            return None
+
     def load_dict(self, version, stock_code, source='Main'):
+        if self.registry is not None and self.registry.has_version(stock_code, version):
+            return self.registry.get_dict(stock_code, version, source)
+        # 바이너리 artifact가 있으면 단어별 사전 행 대신 한 번에 로드
+        artifact = self.load_artifact(version, stock_code, source)
+        if artifact is not None:
+            return artifact.to_dict()
         with get_db_cursor() as cur:
             cur.execute(
                 """SELECT word, beta FROM tb_sentiment_dict 
@@ -26,6 +69,8 @@ class Predictor:
 
     def load_meta_metrics(self, version, stock_code, source='Main'):
         """Load metadata metrics (including scaler params)"""
+        if self.registry is not None and self.registry.has_version(stock_code, version):
+            return self.registry.get_metrics(stock_code, version, source)
         with get_db_cursor() as cur:
             cur.execute(
                 "SELECT metrics FROM tb_sentiment_dict_meta WHERE version = %s AND source = %s AND stock_code = %s",
@@ -74,6 +119,52 @@ class Predictor:
         tech_indicators: dict {'tech_rsi_14': val, ...} (Optional)
         version: specific version or None (Active)
         """
+        combined_dict, meta, scaler_params = self._load_models(stock_code, version)
+        pos_score, neg_score, contributions = self._text_contributions(news_by_lag, combined_dict)
+        pos_score, neg_score = self._dense_contributions(
+            pos_score, neg_score, contributions, combined_dict, scaler_params, fundamentals, tech_indicators
+        )
+        v_multiplier, volatility = self._market_stats(stock_code)
+        return self._finalize(stock_code, pos_score, neg_score, contributions, news_by_lag, meta, fundamentals, v_multiplier, volatility)
+
+    def predict_batch(self, stock_code, requests):
+        """
+        여러 날짜(와 버전)의 predict_advanced를 한 번에 계산합니다 (Walk-forward 검증용).
+        requests: [{"news_by_lag": ..., "version": ..., "fundamentals": ..., "tech_indicators": ...}, ...]
+        Returns: predict_advanced와 같은 결과 dict 리스트 (requests 순서)
+
+        - 버전별 사전/meta와 거래량·변동성 통계는 배치당 한 번만 조회
+        - 모든 날짜의 (lag, 토큰) 발생을 하나의 프레임으로 펼쳐 모델별 가중치와 한 번에 조인/집계
+          (토큰마다 f"{token}_L{lag}" 키를 만들어 dict를 조회하는 루프 없음)
+        """
+        if not requests:
+            return []
+        models, model_ids = [], []
+        index_of = {}
+        for req in requests:
+            version = req.get("version")
+            if version not in index_of:
+                index_of[version] = len(models)
+                models.append(self._load_models(stock_code, version))
+            model_ids.append(index_of[version])
+
+        text = self._batch_text_contributions(requests, model_ids, [m[0] for m in models])
+        v_multiplier, volatility = self._market_stats(stock_code)
+
+        results = []
+        for req, model_id, (pos_score, neg_score, contributions) in zip(requests, model_ids, text):
+            combined_dict, meta, scaler_params = models[model_id]
+            fundamentals, tech_indicators = req.get("fundamentals"), req.get("tech_indicators")
+            pos_score, neg_score = self._dense_contributions(
+                pos_score, neg_score, contributions, combined_dict, scaler_params, fundamentals, tech_indicators
+            )
+            results.append(self._finalize(
+                stock_code, pos_score, neg_score, contributions, req["news_by_lag"], meta, fundamentals, v_multiplier, volatility
+            ))
+        return results
+
+    def _load_models(self, stock_code, version):
+        """(Main + Buffer 합산 사전, Main meta, scaler params)"""
         if version:
             main_dict = self.load_dict(version, stock_code, 'Main')
             buffer_dict = self.load_dict(version, stock_code, 'Buffer')
@@ -107,15 +198,13 @@ class Predictor:
         combined_dict = main_dict.copy()
         for word, beta in buffer_dict.items():
             combined_dict[word] = combined_dict.get(word, 0.0) + beta
-            
+        return combined_dict, meta, scaler_params
+
+    def _text_contributions(self, news_by_lag, combined_dict):
         pos_score = 0.0
         neg_score = 0.0
         contributions = []
         
-        
-        # Threshold for filtering near-zero noise
-        THRESHOLD = 1e-5
-        
         for lag, items in news_by_lag.items():
             suffix = f"_L{lag}"
             # Check if items are tuples (token, weight) or just tokens
@@ -131,13 +220,94 @@ class Predictor:
                 # Apply Time Decay Weight (Hourly Decay from Weekend/Evening)
                 weight = base_weight * time_weight
                 
-                if abs(weight) > THRESHOLD:  # Filter out near-zero weights
+                if abs(weight) > CONTRIBUTION_THRESHOLD:  # Filter out near-zero weights
                     if weight > 0:
                         pos_score += weight
                     else:
                         neg_score += weight
                     contributions.append({"word": token, "weight": weight})
-        
+        return pos_score, neg_score, contributions
+
+    def _batch_text_contributions(self, requests, model_ids, combined_dicts):
+        """
+        requests 전체의 (요청, lag, 토큰) 발생을 한 번의 조인으로 모델 가중치와 매칭합니다.
+        - 토큰 목록은 객체 단위로 한 번만 펼침 (검증기는 오늘의 L1 묶음을 내일 L2로 그대로 재사용)
+        - 가중치 키(f"{token}_L{lag}")는 모델 사전 쪽에서 한 번 (token, lag)로 분해: 발생마다 키 문자열을 만들지 않음
+        Returns: 요청별 (pos_score, neg_score, contributions)
+        contributions는 최종 판정에 필요한 항목만 발생 순서대로 담음 (부호별 상위 3개 + Critical 단어):
+        _finalize의 상위 키워드/Black Swan 판정은 전체 목록을 쓴 것과 같음.
+        """
+        out = [(0.0, 0.0, []) for _ in requests]
+        bag_index, bags = {}, []
+        pair_cols = {"req": [], "order": [], "lag": [], "model": [], "bag": []}
+        for r, (req, model_id) in enumerate(zip(requests, model_ids)):
+            items_by_lag = list(req["news_by_lag"].items())
+            if any(items and isinstance(items[0], tuple) for _, items in items_by_lag):
+                # (token, time_weight) 입력은 기존 루프로 계산
+                out[r] = self._text_contributions(req["news_by_lag"], combined_dicts[model_id])
+                continue
+            for order, (lag, items) in enumerate(items_by_lag):
+                b = bag_index.get(id(items))
+                if b is None:
+                    b = bag_index[id(items)] = len(bags)
+                    bags.append(items)
+                for col, value in zip(("req", "order", "lag", "model", "bag"), (r, order, str(lag), model_id, b)):
+                    pair_cols[col].append(value)
+        if not bags:
+            return out
+
+        tokens = (
+            pl.DataFrame({"token": pl.Series(bags, dtype=pl.List(pl.String))})
+            .with_row_index("bag")
+            .with_columns(pl.col("bag").cast(pl.Int64))
+            .explode("token")
+            .drop_nulls("token")
+            .with_row_index("pos")
+        )
+        pairs = pl.DataFrame(pair_cols, schema={"req": pl.Int64, "order": pl.Int64, "lag": pl.String, "model": pl.Int64, "bag": pl.Int64})
+        weights = (
+            pl.concat([
+                pl.DataFrame({"model": [m] * len(d), "key": list(d.keys()), "w": list(d.values())},
+                             schema={"model": pl.Int64, "key": pl.String, "w": pl.Float64})
+                for m, d in enumerate(combined_dicts)
+            ])
+            .lazy()
+            .filter(pl.col("w").abs() > CONTRIBUTION_THRESHOLD)
+            .with_columns(pl.col("key").str.extract(r"_L(\d+)$", 1).alias("lag"))
+            .drop_nulls("lag")  # __F_ / __T_ 등 dense 피처
+            # "{token}_L{lag}" -> token (접미사 길이만큼 잘라냄)
+            .with_columns(pl.col("key").str.head(-(pl.col("lag").str.len_chars().cast(pl.Int64) + 2)).alias("token"))
+        )
+        occ = (
+            pairs.lazy()
+            .join(weights, on=["model", "lag"], how="inner")
+            .join(tokens.lazy(), on=["bag", "token"], how="inner")
+            .sort(["req", "order", "pos"])  # predict_advanced의 발생 순서 (lag 순회 -> 목록 순서)
+            .select(["req", "token", "w"])
+            .collect()
+        )
+        if occ.is_empty():
+            return out
+
+        sums = occ.group_by("req").agg(
+            pl.col("w").filter(pl.col("w") > 0).sum().alias("pos_score"),
+            pl.col("w").filter(pl.col("w") < 0).sum().alias("neg_score"),
+        )
+        for r, pos_score, neg_score in sums.iter_rows():
+            out[r] = (pos_score, neg_score, [])
+
+        # 부호별 순위: 양수는 큰 순, 음수는 작은 순 (동률은 발생 순서 = ordinal)
+        rank = (
+            pl.when(pl.col("w") > 0)
+            .then(pl.col("w").rank("ordinal", descending=True).over(["req", pl.col("w") > 0]))
+            .otherwise(pl.col("w").rank("ordinal").over(["req", pl.col("w") > 0]))
+        )
+        keep = occ.filter((rank <= 3) | pl.col("token").is_in(list(CRITICAL_WORDS)))
+        for r, token, w in keep.select("req", "token", "w").iter_rows():
+            out[r][2].append({"word": token, "weight": w})
+        return out
+
+    def _dense_contributions(self, pos_score, neg_score, contributions, combined_dict, scaler_params, fundamentals, tech_indicators):
         # Add Dense (Fundamental: __F_) Contributions
         if fundamentals and scaler_params:
             cols = scaler_params.get('cols', [])
@@ -185,23 +355,10 @@ class Predictor:
                     if contribution > 0: pos_score += contribution
                     else: neg_score += contribution
                     contributions.append({"word": key, "weight": contribution, "raw_val": val})
-            
-        # --- Multi-Factor Hybrid Scaling (Valuation Normalization) ---
-        valuation_multiplier = 1.0
-        pbr = fundamentals.get('pbr', 1.0) if fundamentals else 1.0
-        
-        # If PBR > 6.0, start penalizing aggressive Buy signals (Conservative stance)
-        if pos_score > 0 and pbr > 6.0:
-            # Overvaluation penalty: reduces pos_score by up to 30% for high PBR
-            penalty = min(0.3, (pbr - 6.0) / 10.0)
-            valuation_multiplier = 1.0 - penalty
-            pos_score *= valuation_multiplier
-            logger.info(f"Applying Valuation Penalty for {stock_code} (PBR: {pbr:.1f}, Multiplier: {valuation_multiplier:.2f})")
+        return pos_score, neg_score
 
-        net_score = pos_score + neg_score
-        intensity = abs(pos_score) + abs(neg_score)
-        
-        # Volume-weighted Intensity (PRD Section 16.2)
+    def _market_stats(self, stock_code):
+        """Volume-weighted Intensity 배수와 일별 변동성 (tb_daily_price 최근 구간)"""
         v_multiplier = 1.0
         volatility = 0.02 # Default daily volatility (2%)
         
@@ -242,8 +399,25 @@ class Predictor:
                 
                 if row['volatility'] and row['vol_cnt'] >= 20:
                      volatility = float(row['volatility'])
-                
-        # Apply volume weighting
+        return v_multiplier, volatility
+
+    def _finalize(self, stock_code, pos_score, neg_score, contributions, news_by_lag, meta, fundamentals, v_multiplier, volatility):
+        # --- Multi-Factor Hybrid Scaling (Valuation Normalization) ---
+        valuation_multiplier = 1.0
+        pbr = fundamentals.get('pbr', 1.0) if fundamentals else 1.0
+        
+        # If PBR > 6.0, start penalizing aggressive Buy signals (Conservative stance)
+        if pos_score > 0 and pbr > 6.0:
+            # Overvaluation penalty: reduces pos_score by up to 30% for high PBR
+            penalty = min(0.3, (pbr - 6.0) / 10.0)
+            valuation_multiplier = 1.0 - penalty
+            pos_score *= valuation_multiplier
+            logger.info(f"Applying Valuation Penalty for {stock_code} (PBR: {pbr:.1f}, Multiplier: {valuation_multiplier:.2f})")
+
+        net_score = pos_score + neg_score
+        intensity = abs(pos_score) + abs(neg_score)
+        
+        # Apply volume weighting (PRD Section 16.2)
         original_intensity = intensity
         intensity = intensity * v_multiplier
         net_score = net_score * v_multiplier
@@ -396,9 +570,8 @@ class Predictor:
         return results
 
     def fetch_news_by_lag(self, stock_code, lag_limit):
-        from src.nlp.tokenizer import Tokenizer
         from src.utils.calendar import Calendar
-        tokenizer = Tokenizer()
+        token_store = self.token_store
         news_by_lag = {}
         
         # 1. 대상 종목의 거래일 목록 가져오기
@@ -448,7 +621,8 @@ class Predictor:
                 # 정확히는 (prev_trading_day) 16:00 <= published_at < (actual_impact_date) 16:00
                 
                 cur.execute("""
-                    SELECT c.content, c.published_at
+                    SELECT c.content, c.published_at,
+                           c.keywords->>'v' AS token_version, c.keywords->>'t' AS stored_tokens
                     FROM tb_news_content c
                     JOIN tb_news_mapping m ON c.url_hash = m.url_hash
                     WHERE m.stock_code = %s 
@@ -490,7 +664,7 @@ class Predictor:
                         else:
                             time_weight = 1.0
                             
-                        item_tokens = tokenizer.tokenize(row['content'])
+                        item_tokens = token_store.tokens(row['content'], row['token_version'], row['stored_tokens'])
                         
                         # Store as (token, weight) tuples
                         for t in item_tokens:
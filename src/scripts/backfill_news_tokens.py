@@ -0,0 +1,84 @@
+import os
+import sys
+import json
+import time
+
+# Add project root to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, "../../"))
+sys.path.append(project_root)
+
+from psycopg2.extras import execute_values
+from src.db.connection import get_db_cursor
+from src.nlp.token_store import NewsTokenStore
+
+
+def backfill_tokens(batch_size=500, limit=None, force=False):
+    """
+    tb_news_content.keywords에 사전 토큰화 결과를 채웁니다.
+    - 기본: keywords가 비어있거나 토크나이저 fingerprint가 다른 행만 갱신
+    - force: 모든 행을 다시 토큰화
+    """
+    token_store = NewsTokenStore()
+    fingerprint = token_store.fingerprint
+    print(f"[*] Starting Backfill for News Tokens (fingerprint={fingerprint})...")
+
+    stale_filter = "TRUE" if force else "(keywords IS NULL OR keywords->>'v' IS DISTINCT FROM %(fp)s)"
+
+    with get_db_cursor() as cur:
+        cur.execute(f"""
+            SELECT COUNT(*) FROM tb_news_content
+            WHERE content IS NOT NULL AND {stale_filter}
+        """, {"fp": fingerprint})
+        count = cur.fetchone()['count']
+    if limit:
+        count = min(count, limit)
+    print(f"[*] Found {count} rows to tokenize.")
+
+    if count == 0:
+        print("[v] No backfill needed.")
+        return 0
+
+    # url_hash 기준 keyset pagination (갱신된 행이 필터에서 빠져도 누락/중복 없음)
+    last_hash = ""
+    updated = 0
+    start = time.time()
+    while updated < count:
+        size = min(batch_size, count - updated)
+        with get_db_cursor() as cur:
+            cur.execute(f"""
+                SELECT url_hash, content FROM tb_news_content
+                WHERE content IS NOT NULL AND {stale_filter} AND url_hash > %(last)s
+                ORDER BY url_hash
+                LIMIT %(size)s
+            """, {"fp": fingerprint, "last": last_hash, "size": size})
+            rows = cur.fetchall()
+            if not rows:
+                break
+
+            values = [(r['url_hash'], json.dumps(token_store.encode(r['content']), ensure_ascii=False)) for r in rows]
+            execute_values(cur, """
+                UPDATE tb_news_content AS c
+                SET keywords = v.keywords::jsonb
+                FROM (VALUES %s) AS v(url_hash, keywords)
+                WHERE c.url_hash = v.url_hash
+            """, values)
+
+        last_hash = rows[-1]['url_hash']
+        updated += len(rows)
+        rate = updated / max(time.time() - start, 1e-6)
+        print(f"    [{updated}/{count}] tokenized ({rate:.0f} rows/s)")
+
+    print(f"[v] Successfully tokenized {updated} rows.")
+    return updated
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Backfill pre-tokenized news (tb_news_content.keywords)")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per UPDATE batch")
+    parser.add_argument("--limit", type=int, default=None, help="Max rows to process")
+    parser.add_argument("--force", action="store_true", help="Re-tokenize rows even if the fingerprint matches")
+    args = parser.parse_args()
+
+    backfill_tokens(batch_size=args.batch_size, limit=args.limit, force=args.force)
@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 """
-Celer vs MLX Lasso Benchmark with Extended Parameters
+Celer vs MLX vs Sparse FISTA Lasso Benchmark with Extended Parameters
 n-gram=3, lag=5, with dynamic decay rate calculation
 
+--synthetic: DB 없이 합성 TF-IDF 형태 희소 행렬(25k 어휘 x 5 lag)에서 solver만 비교
+
 Phase: Extended Benchmark for N-SentiTrader
 """
 import time
 import sys
 import gc
+import argparse
+import tracemalloc
 import numpy as np
 import resource  # Standard library alternative to psutil
 
@@ -94,6 +98,67 @@ def run_benchmark(engine: str, n_gram: int, lags: int, stock_code: str = "005930
         }
 
 
+def make_synthetic_design(n_samples=250, n_features=125000, density=0.003, n_signal=40, seed=0):
+    """TF-IDF 형태 합성 설계 행렬 (CSC, 비음수 희소) + 일부 피처에 신호를 심은 수익률"""
+    from scipy import sparse
+    rng = np.random.default_rng(seed)
+    X = sparse.random(n_samples, n_features, density=density, random_state=seed, format="csc")
+    beta = np.zeros(n_features)
+    beta[rng.choice(n_features, n_signal, replace=False)] = rng.normal(0, 0.05, n_signal)
+    y = X @ beta + rng.normal(0, 0.01, n_samples)
+    return X, y
+
+
+def run_solver_benchmark(engine: str, X, y, alpha: float):
+    """
+    설계 행렬이 주어졌을 때 LassoLearner(engine=...)가 쓰는 solver만 학습 (시간/피크 메모리/목적함수)
+    """
+    learner = LassoLearner(alpha=alpha, engine=engine)
+    model = learner.model
+
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    model.fit(X, y)
+    elapsed = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    coef = np.asarray(model.coef_).ravel()
+    pred = np.asarray(X @ coef).ravel() + float(getattr(model, "intercept_", 0.0))
+    objective = 0.5 * np.mean((y - pred) ** 2) + alpha * np.abs(coef).sum()
+    return {
+        "engine": engine,
+        "alpha": alpha,
+        "time_seconds": elapsed,
+        "peak_memory_mb": peak / 1024 / 1024,
+        "n_iter": getattr(model, "n_iter_", None),
+        "objective": objective,
+        "non_zero_coef": int(np.count_nonzero(coef)),
+    }
+
+
+def synthetic_main(args):
+    from src.learner.lasso import MLX_AVAILABLE
+
+    print("=" * 70)
+    print(f"Solver Benchmark (synthetic): {args.samples} samples x {args.features:,} features, density={args.density}")
+    print("=" * 70)
+    X, y = make_synthetic_design(args.samples, args.features, args.density)
+    engines = ["celer", "fista"] + (["mlx"] if MLX_AVAILABLE else [])
+
+    results = []
+    for alpha in args.alphas:
+        for engine in engines:
+            results.append(run_solver_benchmark(engine, X, y, alpha))
+
+    print(f"\n{'Engine':<8} {'alpha':<8} {'Time(s)':<9} {'Peak(MB)':<10} {'Iters':<7} {'Objective':<14} {'Non-zero':<8}")
+    print("-" * 70)
+    for r in results:
+        print(f"{r['engine']:<8} {r['alpha']:<8g} {r['time_seconds']:<9.3f} {r['peak_memory_mb']:<10.1f} {str(r['n_iter']):<7} {r['objective']:<14.8e} {r['non_zero_coef']:<8,}")
+    return results
+
+
 def calculate_dynamic_decay_rate(df_prices, df_news, lags: int = 5) -> dict:
     """
     동적 감쇠율 계산
@@ -123,7 +188,7 @@ def calculate_dynamic_decay_rate(df_prices, df_news, lags: int = 5) -> dict:
 
 def main():
     print("="*70)
-    print("Celer vs MLX Lasso Benchmark - Extended Parameters")
+    print("Celer vs MLX vs Sparse FISTA Lasso Benchmark - Extended Parameters")
     print("n-gram=3, lag=5, dynamic decay rate")
     print("="*70)
     
@@ -132,10 +197,12 @@ def main():
         # 기본 설정 (현재 프로덕션)
         {"engine": "celer", "n_gram": 2, "lags": 3},
         {"engine": "mlx", "n_gram": 2, "lags": 3},
+        {"engine": "fista", "n_gram": 2, "lags": 3},
         
         # 확장 설정 (목표)
         {"engine": "celer", "n_gram": 3, "lags": 5},
         {"engine": "mlx", "n_gram": 3, "lags": 5},
+        {"engine": "fista", "n_gram": 3, "lags": 5},
     ]
     
     results = []
@@ -166,4 +233,12 @@ def main():
 
 
 if __name__ == "__main__":
-    results = main()
+    parser = argparse.ArgumentParser(description="Lasso engine benchmark")
+    parser.add_argument("--synthetic", action="store_true", help="DB 없이 합성 희소 행렬로 solver만 비교")
+    parser.add_argument("--samples", type=int, default=250)
+    parser.add_argument("--features", type=int, default=125000)
+    parser.add_argument("--density", type=float, default=0.003)
+    parser.add_argument("--alphas", type=float, nargs="+", default=[1e-4, 1e-5])
+    args = parser.parse_args()
+
+    results = synthetic_main(args) if args.synthetic else main()
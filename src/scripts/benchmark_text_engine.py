@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+TF-IDF vs Hashing text engine benchmark (LassoLearner text_engine=)
+
+DB 없이 합성 뉴스 코퍼스(Zipf 분포 n-gram 토큰)로 슬라이딩 윈도우 재학습을 재현하고
+엔진별 피처 행렬 생성 시간, 학습 시간, 피크 메모리, 피처 수, 사전 일치율을 비교합니다.
+"""
+import os
+import sys
+import gc
+import time
+import argparse
+import tracemalloc
+import numpy as np
+import polars as pl
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import src.learner.lasso as lasso_module
+from src.learner.lasso import LassoLearner
+
+
+def make_corpus(n_days, tokens_per_day, vocab_size, seed=42):
+    """거래일별 토큰 리스트와 수익률을 생성 (상위 일부 토큰에 실제 신호를 심음)"""
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f"토큰{i}" for i in range(vocab_size)], dtype=object)
+    probs = 1.0 / np.arange(1, vocab_size + 1)
+    probs /= probs.sum()
+    docs = [vocab[rng.choice(vocab_size, size=tokens_per_day, p=probs)].tolist() for _ in range(n_days)]
+    signal = {f"토큰{i}": rng.normal(0, 0.01) for i in range(50, 80)}
+    returns = np.array([sum(signal.get(t, 0.0) for t in set(doc)) for doc in docs])
+    returns += rng.normal(0, 0.01, n_days)
+    days = [date(2023, 1, 2) + timedelta(days=i) for i in range(n_days)]
+    return days, docs, returns
+
+
+def window_frame(days, returns, start, length, lags):
+    cols = {"date": days[start:start + length], "excess_return": returns[start:start + length]}
+    rows = np.arange(start, start + length)
+    for k in range(1, lags + 1):
+        cols[f"news_idx_L{k}"] = (rows - k + 1).astype(np.int32)
+    return pl.DataFrame(cols)
+
+
+def run_engine(text_engine, days, docs, returns, args):
+    learner = LassoLearner(
+        lags=args.lags, min_df=3, max_features=args.max_features,
+        use_fundamentals=False, decay_rate=0.4, text_engine=text_engine,
+        hash_features=args.hash_features,
+    )
+    learner.daily_news = pl.Series("daily_news", docs, dtype=pl.List(pl.String))
+
+    gc.collect()
+    tracemalloc.start()
+    design_time, fit_time, n_text, n_kept, dicts = 0.0, 0.0, 0, 0, []
+    for w in range(args.windows):
+        df = window_frame(days, returns, args.lags + w * args.step, args.window, args.lags)
+        t0 = time.perf_counter()
+        design = learner._build_design(df)
+        t1 = time.perf_counter()
+        learner.model.fit(design["X"], design["y"])
+        sentiment_dict = learner._coef_to_dict(design, learner.model.coef_, [])
+        t2 = time.perf_counter()
+        design_time += t1 - t0
+        fit_time += t2 - t1
+        n_text = len(learner._text_vocab_names())
+        n_kept = design["X"].shape[1]
+        dicts.append(sentiment_dict)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "engine": text_engine,
+        "design_s": design_time / args.windows,
+        "fit_s": fit_time / args.windows,
+        "peak_mb": peak / 1024 / 1024,
+        "vocab": n_text,
+        "kept": n_kept,
+        "nonzero": len(dicts[-1]),
+        "dicts": dicts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TF-IDF vs Hashing text engine benchmark")
+    parser.add_argument("--days", type=int, default=400)
+    parser.add_argument("--tokens-per-day", type=int, default=3000)
+    parser.add_argument("--vocab", type=int, default=200000)
+    parser.add_argument("--window", type=int, default=120)
+    parser.add_argument("--step", type=int, default=20)
+    parser.add_argument("--windows", type=int, default=5)
+    parser.add_argument("--lags", type=int, default=5)
+    parser.add_argument("--max-features", type=int, default=25000)
+    parser.add_argument("--hash-features", type=int, default=2 ** 18)
+    args = parser.parse_args()
+
+    # DB 없는 벤치마크: Global Lexicon 조회를 건너뛰도록 합성 단어로 채움
+    lasso_module.GLOBAL_LEXICON_CACHE = {f"토큰{i}" for i in range(100, 120)}
+
+    print(f"[*] Generating corpus: {args.days} days x {args.tokens_per_day} tokens (vocab={args.vocab:,})")
+    days, docs, returns = make_corpus(args.days, args.tokens_per_day, args.vocab)
+
+    results = [run_engine(engine, days, docs, returns, args) for engine in ("tfidf", "hashing")]
+
+    print("\n" + "=" * 78)
+    print(f"TEXT ENGINE BENCHMARK ({args.windows} windows x {args.window}d, lags={args.lags}, hash_features={args.hash_features:,})")
+    print("=" * 78)
+    print(f"{'Engine':<9} {'Design(s)':<10} {'Fit(s)':<8} {'Peak(MB)':<10} {'Vocab':<9} {'Kept cols':<10} {'Nonzero':<8}")
+    print("-" * 78)
+    for r in results:
+        print(f"{r['engine']:<9} {r['design_s']:<10.3f} {r['fit_s']:<8.3f} {r['peak_mb']:<10.1f} {r['vocab']:<9,} {r['kept']:<10,} {r['nonzero']:<8,}")
+
+    # 사전 키 일치율 (해시 충돌이 없으면 동일한 단어가 선택됨)
+    overlaps = []
+    for d_tfidf, d_hash in zip(results[0]["dicts"], results[1]["dicts"]):
+        union = set(d_tfidf) | set(d_hash)
+        overlaps.append(len(set(d_tfidf) & set(d_hash)) / len(union) if union else 1.0)
+    print(f"\n[v] Dictionary key overlap (Jaccard, mean over windows): {np.mean(overlaps):.3f}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import FinanceDataReader as fdr
 from datetime import datetime, timedelta
 from src.db.connection import get_db_cursor
+from src.utils.calendar import Calendar
 
 def collect_stock_data(stock_code, start_date, end_date):
     """
@@ -48,6 +49,7 @@ def collect_stock_data(stock_code, start_date, end_date):
                 excess_return = EXCLUDED.excess_return
             """, (date_str, stock_code, close_price, return_rate, excess_return))
             
+    Calendar.invalidate(stock_code)
     print(f"Successfully saved {len(df)} days of stock data.")
 
 if __name__ == "__main__":
@@ -33,6 +33,11 @@ def run_job_process(data):
         elif job_type == "DAILY_UPDATE":
             am = AnalysisManager(stock_code)
             am.run_daily_update(v_job_id=v_job_id)
+
+        elif job_type == "DAILY_UPDATE_BATCH":
+            # 여러 종목을 하나의 공유 뉴스 corpus로 재학습 (stock_codes 없으면 모든 active 종목)
+            from src.learner.batch_trainer import BatchTrainer
+            BatchTrainer(stock_codes=data.get("stock_codes")).run(v_job_id=v_job_id)
         
         elif job_type == "WF_CHECK":
             am = AnalysisManager(stock_code)
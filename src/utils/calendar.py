@@ -1,49 +1,210 @@
 # src/utils/calendar.py
+"""
+프로세스 전역 KRX 거래일 인덱스 (TRADING_CALENDAR).
+
+- 시장 거래일: exchange_calendars XKRX 세션을 프로세스당 한 번 정렬된 date 리스트로 로드
+- 종목 거래일: tb_daily_price에 가격이 있는 날 (상장 이전/거래정지일은 자연히 빠짐 = 종목별 override)
+  마지막 가격일 이후는 시장 거래일로 이어 붙여 미래 날짜도 휴장일을 건너뜀
+- 조회는 모두 bisect (next / prev / N거래일 이동 / 거래일 여부)
+- 같은 프로세스에서 가격을 저장하면 invalidate(stock_code)로 재조회, 다른 프로세스가 넣은 가격은
+  CALENDAR_REFRESH_SECONDS 경과 후 마지막 가격일 이후만 증분 조회하여 반영
+"""
+import os
+import time
+import bisect
+import threading
 from datetime import datetime, date, timedelta
 from src.db.connection import get_db_cursor
+import numpy as np
+import polars as pl
 import logging
 
 logger = logging.getLogger(__name__)
 
-class Calendar:
-    _trading_days_cache = {}
+CALENDAR_REFRESH_SECONDS = int(os.getenv("CALENDAR_REFRESH_SECONDS", "600"))
 
-    @classmethod
-    def get_trading_days(cls, stock_code, start_date=None, end_date=None):
-        """특정 종목의 거래일 목록을 가져옵니다 (tb_daily_price 기반)"""
-        if stock_code in cls._trading_days_cache:
-            # Simple cache for performance within a single run
-            # In a long-running process, this might need more robust invalidation
-            return cls._trading_days_cache[stock_code]
 
+def _to_date(value):
+    if isinstance(value, str):
+        return datetime.strptime(value[:10], '%Y-%m-%d').date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _next_weekday(d):
+    # 캘린더 범위 밖 (DB/XKRX 세션 모두 없음): 주말만 건너뜀
+    while d.weekday() >= 5:
+        d += timedelta(days=1)
+    return d
+
+
+class _StockDays:
+    __slots__ = ("days", "combined", "array", "checked_at")
+
+    def __init__(self):
+        self.days = []        # 가격이 있는 날 (get_trading_days 반환값)
+        self.combined = None  # days + 마지막 가격일 이후의 시장 거래일 (가격일 이후 조회 시에만 생성)
+        self.array = None     # combined의 epoch-day int32 배열 (get_impact_dates용, 필요 시 생성)
+        self.checked_at = 0.0
+
+
+class TradingCalendarIndex:
+    def __init__(self, refresh_seconds=CALENDAR_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._market = None
+        self._stocks = {}
+        self._lock = threading.Lock()
+
+    # --- 로드 / 갱신 ---
+    def _load_market_sessions(self):
+        import exchange_calendars as ecals
+        return [ts.date() for ts in ecals.get_calendar("XKRX").sessions]
+
+    def _fetch_price_days(self, stock_code, after=None):
         with get_db_cursor() as cur:
-            cur.execute("""
-                SELECT DISTINCT date FROM tb_daily_price 
-                WHERE stock_code = %s
-                ORDER BY date ASC
-            """, (stock_code,))
-            rows = cur.fetchall()
-            days = [r['date'] for r in rows]
-            cls._trading_days_cache[stock_code] = days
+            if after is None:
+                cur.execute("""
+                    SELECT DISTINCT date FROM tb_daily_price
+                    WHERE stock_code = %s
+                    ORDER BY date ASC
+                """, (stock_code,))
+            else:
+                cur.execute("""
+                    SELECT DISTINCT date FROM tb_daily_price
+                    WHERE stock_code = %s AND date > %s
+                    ORDER BY date ASC
+                """, (stock_code, after))
+            return [r['date'] for r in cur.fetchall()]
+
+    def market_days(self):
+        if self._market is None:
+            with self._lock:
+                if self._market is None:
+                    try:
+                        self._market = self._load_market_sessions()
+                    except Exception as e:
+                        logger.warning(f"KRX calendar unavailable, falling back to weekdays: {e}")
+                        self._market = []
+        return self._market
+
+    def _stock(self, stock_code):
+        entry = self._stocks.get(stock_code)
+        if entry is not None and time.monotonic() - entry.checked_at < self.refresh_seconds:
+            return entry
+        with self._lock:
+            entry = self._stocks.get(stock_code)
+            if entry is not None and time.monotonic() - entry.checked_at < self.refresh_seconds:
+                return entry
+            fresh = _StockDays()
+            if entry is None:
+                fresh.days = self._fetch_price_days(stock_code)
+            else:
+                # 증분: 마지막 가격일 이후만 조회
+                last = entry.days[-1] if entry.days else None
+                fresh.days = entry.days + self._fetch_price_days(stock_code, after=last)
+            fresh.checked_at = time.monotonic()
+            # 교체 방식이므로 다른 스레드가 들고 있는 리스트는 변하지 않음
+            self._stocks[stock_code] = fresh
+            return fresh
+
+    def invalidate(self, stock_code=None):
+        """새 가격 저장 후 호출: 해당 종목(None이면 전체)을 버려 다음 조회 때 전체 재조회 (과거 구간 backfill 포함)"""
+        with self._lock:
+            if stock_code is None:
+                self._stocks.clear()
+            else:
+                self._stocks.pop(stock_code, None)
+
+    def _combined(self, entry):
+        # XKRX 세션 생성은 프로세스당 ~2.5s이므로 마지막 가격일 이후를 조회할 때만 로드
+        if entry.combined is None:
+            market = self.market_days()
+            tail = market[bisect.bisect_right(market, entry.days[-1]):] if entry.days else market
+            entry.combined = entry.days + tail
+        return entry.combined
+
+    def _days(self, stock_code, upto=None):
+        """upto(가장 늦은 조회 날짜)까지 bisect할 거래일 리스트"""
+        if stock_code is None:
+            return self.market_days()
+        entry = self._stock(stock_code)
+        if entry.days and upto is not None and upto <= entry.days[-1]:
+            return entry.days
+        return self._combined(entry)
+
+    # --- 조회 ---
+    def trading_days(self, stock_code=None, start_date=None, end_date=None):
+        """종목 거래일 (stock_code=None이면 KRX 시장 거래일), [start_date, end_date] 구간"""
+        days = self.market_days() if stock_code is None else self._stock(stock_code).days
+        if start_date is None and end_date is None:
             return days
+        lo = 0 if start_date is None else bisect.bisect_left(days, _to_date(start_date))
+        hi = len(days) if end_date is None else bisect.bisect_right(days, _to_date(end_date))
+        return days[lo:hi]
+
+    def offset(self, target_date, n, stock_code=None):
+        """target_date 이후(포함) 첫 거래일에서 n거래일 이동 (n=0: 다음 거래일, n=-1: 직전 거래일)"""
+        target_date = _to_date(target_date)
+        days = self._days(stock_code, None if n > 0 else target_date)
+        i = bisect.bisect_left(days, target_date) + n
+        if 0 <= i < len(days):
+            return days[i]
+        if i >= len(days) and n == 0:
+            return _next_weekday(target_date)
+        return None
+
+    def next_trading_day(self, target_date, stock_code=None):
+        return self.offset(target_date, 0, stock_code)
+
+    def prev_trading_day(self, target_date, stock_code=None):
+        """target_date 이전(미포함) 마지막 거래일"""
+        return self.offset(target_date, -1, stock_code)
+
+    def is_trading_day(self, target_date, stock_code=None):
+        target_date = _to_date(target_date)
+        days = self._days(stock_code, target_date)
+        i = bisect.bisect_left(days, target_date)
+        return i < len(days) and days[i] == target_date
+
+    def day_array(self, stock_code, upto=None):
+        """_days(stock_code, upto)의 epoch-day int32 배열 (searchsorted용)"""
+        entry = self._stock(stock_code)
+        days = self._days(stock_code, upto)
+        if days is entry.days:
+            return pl.Series(days, dtype=pl.Date).cast(pl.Int32).to_numpy()
+        if entry.array is None:
+            entry.array = pl.Series(days, dtype=pl.Date).cast(pl.Int32).to_numpy()
+        return entry.array
+
+
+TRADING_CALENDAR = TradingCalendarIndex()
+
+
+class Calendar:
+    @classmethod
+    def get_trading_days(cls, stock_code, start_date=None, end_date=None):
+        """특정 종목의 거래일 목록 (tb_daily_price 기반, 프로세스 전역 인덱스에서 조회)"""
+        return TRADING_CALENDAR.trading_days(stock_code, start_date, end_date)
+
+    @classmethod
+    def invalidate(cls, stock_code=None):
+        TRADING_CALENDAR.invalidate(stock_code)
 
     @classmethod
     def get_next_trading_day(cls, stock_code, target_date):
         """target_date 이후(포함)의 첫 번째 거래일을 반환합니다."""
-        if isinstance(target_date, str):
-            target_date = datetime.strptime(target_date, '%Y-%m-%d').date()
-        
-        days = cls.get_trading_days(stock_code)
-        for d in days:
-            if d >= target_date:
-                return d
-        
-        # 만약 DB에 미래 데이터가 없다면, 가상의 다음 영업일 반환 (단순화: 주말 제외)
-        curr = target_date
-        while True:
-            if curr.weekday() < 5: # Mon-Fri
-                return curr
-            curr += timedelta(days=1)
+        return TRADING_CALENDAR.next_trading_day(target_date, stock_code)
+
+    @classmethod
+    def get_prev_trading_day(cls, stock_code, target_date):
+        """target_date 이전(미포함)의 마지막 거래일을 반환합니다 (없으면 None)."""
+        return TRADING_CALENDAR.prev_trading_day(target_date, stock_code)
+
+    @classmethod
+    def offset_trading_days(cls, stock_code, target_date, n):
+        """target_date 이후(포함) 첫 거래일 기준 n거래일 이동 (범위 밖이면 None)"""
+        return TRADING_CALENDAR.offset(target_date, n, stock_code)
 
     @classmethod
     def get_impact_date(cls, stock_code, published_at):
@@ -58,16 +219,51 @@ class Calendar:
         else:
             p_date = published_at
             p_hour = 12 # Default to midday if time is missing
-            
+
         # 장 마감(15:30) 이후 뉴스는 다음 거래일로 할당
         if p_hour >= 16:
             p_date += timedelta(days=1)
-            
+
         return cls.get_next_trading_day(stock_code, p_date)
 
+    @classmethod
+    def get_impact_dates(cls, stock_code, published):
+        """
+        get_impact_date의 벡터화 버전 (기사 단위 lambda 호출 없음).
+        published: pl.Series (Date / Datetime / 'YYYY-MM-DD' String) -> 같은 길이의 impact date pl.Series (Date)
+        16시 이후 Datetime은 다음 날로 옮긴 뒤, 정렬된 거래일 배열에 대한 searchsorted 한 번으로
+        '그 날 이후(포함) 첫 거래일'을 찾습니다. 캘린더 범위 밖은 get_next_trading_day처럼 주말만 건너뜀.
+        """
+        if published.dtype == pl.String:
+            published = published.str.to_date("%Y-%m-%d")
+        if isinstance(published.dtype, pl.Datetime):
+            p_date = (
+                pl.select(
+                    pl.when(published.dt.hour() >= 16)
+                    .then(published.dt.date() + timedelta(days=1))
+                    .otherwise(published.dt.date())
+                ).to_series()
+            )
+        else:
+            p_date = published.cast(pl.Date)
+
+        nulls = p_date.is_null()
+        query = p_date.cast(pl.Int32).fill_null(0).to_numpy()
+
+        # 1970-01-01(epoch 0)은 목요일(weekday 3) -> 토요일 +2일, 일요일 +1일
+        weekday = (query + 3) % 7
+        impact = query + np.where(weekday == 5, 2, np.where(weekday == 6, 1, 0))
+
+        upto = p_date.max()
+        trading = TRADING_CALENDAR.day_array(stock_code, upto)
+        if len(trading):
+            idx = np.searchsorted(trading, query, side="left")
+            known = idx < len(trading)
+            impact[known] = trading[idx[known]]
+
+        result = pl.Series(published.name, impact.astype(np.int32)).cast(pl.Date)
+        return pl.select(pl.when(nulls).then(None).otherwise(result)).to_series().alias(published.name)
+
     @classmethod
     def is_trading_day(cls, stock_code, target_date):
-        if isinstance(target_date, str):
-            target_date = datetime.strptime(target_date, '%Y-%m-%d').date()
-        days = cls.get_trading_days(stock_code)
-        return target_date in days
+        return TRADING_CALENDAR.is_trading_day(target_date, stock_code)
@@ -1,7 +1,7 @@
 import exchange_calendars as ecals
 import pandas as pd
 from datetime import datetime, timedelta
-import pytz
+from src.utils.calendar import TRADING_CALENDAR
 
 def get_krx_calendar():
     """Returns the KRX exchange calendar."""
@@ -11,28 +11,21 @@ def get_trading_days(start_date=None, days=10):
     """
     Returns the next N trading days from start_date (inclusive if it's a trading day).
     """
-    krx = get_krx_calendar()
-    
     if start_date is None:
         start_date = datetime.now()
-        
-    # Convert to pandas timestamp
-    start_ts = pd.Timestamp(start_date).tz_localize(None)
-    
+
+    start = pd.Timestamp(start_date).tz_localize(None).date()
+
     # Get a range of days (safety margin of 30 days to find 10 trading days)
-    end_ts = start_ts + timedelta(days=30)
-    
-    sessions = krx.sessions_in_range(start_ts, end_ts)
-    
+    sessions = TRADING_CALENDAR.trading_days(None, start, start + timedelta(days=30))
+
     # Return as list of strings YYYY-MM-DD
     return [s.strftime('%Y-%m-%d') for s in sessions[:days]]
 
 def is_trading_day(date_str):
-    """Checks if a given date string is a KRX trading day."""
-    krx = get_krx_calendar()
+    """Checks if a given date string is a KRX trading day (shared in-process index, no per-call calendar build)."""
     try:
-        dt = pd.Timestamp(date_str).tz_localize(None)
-        return krx.is_session(dt)
+        return TRADING_CALENDAR.is_trading_day(pd.Timestamp(date_str).tz_localize(None).date())
     except:
         return False
 
@@ -0,0 +1,165 @@
+# src/utils/job_control.py
+"""
+작업 제어 채널: 중단 신호 push + progress 쓰기 rate limit.
+
+- 중단: 대시보드/JobManager가 상태를 바꾸는 같은 트랜잭션에서 notify_job_stop()으로
+  pg_notify('job_control', '<kind>:<id>')를 보내고 (commit 시 전달), 작업 프로세스의 백그라운드
+  LISTEN 스레드가 받은 신호를 메모리 플래그로 보관 -> 루프의 is_stopped()는 DB 조회 없음
+- 작업을 처음 조회할 때와 LISTEN (재)연결 직후에만 상태를 한 번 SELECT하여 그 전에 들어온 중단도 반영
+- LISTEN 연결이 없는 동안은 작업별 JOB_STOP_POLL_SECONDS 간격의 상태 조회로 대체
+- progress: ProgressThrottle이 최신 값만 남겨 JOB_PROGRESS_INTERVAL초에 한 번 기록 (flush()로 마지막 값 기록)
+"""
+import os
+import time
+import select
+import threading
+import logging
+from src.db.connection import get_db_cursor, _connect
+
+logger = logging.getLogger(__name__)
+
+JOB_CONTROL_CHANNEL = "job_control"
+JOB_STOP_POLL_SECONDS = float(os.getenv("JOB_STOP_POLL_SECONDS", "10"))
+JOB_PROGRESS_INTERVAL = float(os.getenv("JOB_PROGRESS_INTERVAL", "5"))
+
+# kind -> (상태 조회 SQL, 중단으로 보는 상태). 행이 없으면(삭제된 작업) 중단으로 봄
+JOB_KINDS = {
+    "verification": ("SELECT status FROM tb_verification_jobs WHERE v_job_id = %s", ("stopped",)),
+    "job": ("SELECT status FROM jobs WHERE job_id = %s", ("stop_requested", "stopped")),
+}
+
+
+def notify_job_stop(cur, kind, job_id):
+    """중단/삭제 UPDATE와 같은 트랜잭션에서 호출 (NOTIFY는 commit 시점에 전달)"""
+    cur.execute("SELECT pg_notify(%s, %s)", (JOB_CONTROL_CHANNEL, f"{kind}:{job_id}"))
+
+
+class JobControl:
+    def __init__(self, poll_seconds=JOB_STOP_POLL_SECONDS):
+        self.poll_seconds = poll_seconds
+        self.pid = None
+        self._stopped = set()   # {(kind, job_id)}
+        self._checked = {}      # (kind, job_id) -> 마지막 상태 조회 시각 (monotonic)
+        self._listening = threading.Event()
+        self._lock = threading.Lock()
+
+    # --- LISTEN 스레드 ---
+    def _ensure_listener(self):
+        if self.pid == os.getpid():
+            return
+        with self._lock:
+            if self.pid == os.getpid():
+                return
+            # 프로세스마다 자체 LISTEN 연결/스레드 (fork된 자식은 부모의 스레드를 물려받지 않음)
+            self.pid = os.getpid()
+            self._stopped = set()
+            self._checked = {}
+            self._listening.clear()
+            threading.Thread(target=self._listen_loop, name="job-control-listener", daemon=True).start()
+
+    def _listen_loop(self):
+        backoff = 1.0
+        warned = False
+        while True:
+            conn = None
+            try:
+                conn = _connect()
+                conn.autocommit = True
+                with conn.cursor() as cur:
+                    cur.execute(f"LISTEN {JOB_CONTROL_CHANNEL}")
+                # LISTEN 이전(또는 끊겨 있던 동안)의 중단은 상태 조회로 반영
+                for key in list(self._checked):
+                    self._refresh(key)
+                self._listening.set()
+                backoff, warned = 1.0, False
+                while True:
+                    select.select([conn], [], [], 60)
+                    conn.poll()  # 끊긴 연결이면 예외 -> 재연결
+                    while conn.notifies:
+                        self._on_notify(conn.notifies.pop(0).payload)
+            except Exception as e:
+                self._listening.clear()
+                if not warned:
+                    logger.warning(f"Job control LISTEN unavailable, polling job status every {self.poll_seconds}s: {e}")
+                    warned = True
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+    def _on_notify(self, payload):
+        kind, _, job_id = payload.partition(":")
+        try:
+            key = (kind, int(job_id))
+        except ValueError:
+            return
+        with self._lock:
+            self._stopped.add(key)
+        logger.info(f"[JobControl] Stop signal received for {kind} #{job_id}")
+
+    def _refresh(self, key):
+        kind, job_id = key
+        sql, stop_statuses = JOB_KINDS[kind]
+        try:
+            with get_db_cursor() as cur:
+                cur.execute(sql, (job_id,))
+                row = cur.fetchone()
+        except Exception as e:
+            logger.warning(f"[JobControl] Status check failed for {kind} #{job_id}: {e}")
+            return
+        with self._lock:
+            self._checked[key] = time.monotonic()
+            if not row or row['status'] in stop_statuses:
+                self._stopped.add(key)
+
+    # --- 조회 ---
+    def is_stopped(self, kind, job_id):
+        """중단(또는 삭제)된 작업인지. LISTEN 중이면 메모리 플래그만 확인"""
+        if job_id is None:
+            return False
+        self._ensure_listener()
+        key = (kind, job_id)
+        if key in self._stopped:
+            return True
+        checked = self._checked.get(key)
+        if checked is None or (not self._listening.is_set() and time.monotonic() - checked >= self.poll_seconds):
+            self._refresh(key)
+        return key in self._stopped
+
+    def forget(self, kind, job_id):
+        """작업 종료 후 플래그 정리 (같은 id로 재시작되는 작업이 이전 중단 신호를 보지 않도록)"""
+        with self._lock:
+            self._stopped.discard((kind, job_id))
+            self._checked.pop((kind, job_id), None)
+
+
+JOB_CONTROL = JobControl()
+
+
+class ProgressThrottle:
+    """
+    progress 쓰기를 최신 값으로 합쳐 interval초에 한 번만 기록합니다 (첫 호출은 즉시).
+    write: 실제 기록 함수 - update(*args)의 인자를 그대로 전달
+    """
+
+    def __init__(self, write, interval=JOB_PROGRESS_INTERVAL):
+        self.write = write
+        self.interval = interval
+        self._pending = None
+        self._last_write = None
+
+    def update(self, *args):
+        self._pending = args
+        if self._last_write is None or time.monotonic() - self._last_write >= self.interval:
+            self.flush()
+
+    def flush(self):
+        if self._pending is None:
+            return
+        args, self._pending = self._pending, None
+        self._last_write = time.monotonic()
+        self.write(*args)
@@ -33,6 +33,14 @@ BACKTEST_JOBS_BY_STATUS = Gauge('nsenti_backtest_jobs_by_status', 'Number of bac
 BACKTEST_PROGRESS = Gauge('nsenti_backtest_progress', 'Progress of backtest jobs', ['job_id', 'stock_code', 'job_type'])
 BACKTEST_DURATION = Histogram('nsenti_backtest_duration_seconds', 'Time taken to complete backtest jobs', ['stock_code', 'type'])
 
+# DB Connection Pool Metrics
+DB_POOL_WAIT_SECONDS = Histogram('nsenti_db_pool_wait_seconds', 'Time spent waiting to check out a pooled DB connection',
+                                 buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30))
+DB_POOL_CHECKOUT_SECONDS = Histogram('nsenti_db_pool_checkout_seconds', 'Time a pooled DB connection was held by the caller',
+                                     buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30, 120))
+DB_POOL_CONNECTIONS = Gauge('nsenti_db_pool_connections', 'Number of pooled DB connections by state', ['state'])
+DB_POOL_CHECKOUT_ERRORS_TOTAL = Counter('nsenti_db_pool_checkout_errors_total', 'Pool checkouts that timed out or hit an unhealthy connection', ['reason'])
+
 def start_metrics_server(port=None):
     """
     Start Prometheus metrics server based on environment variable or provided port.
@@ -3,7 +3,7 @@ import logging
 from datetime import datetime, timezone
 import json
 from src.db.connection import get_db_cursor
-from src.utils.mq import get_queue_depths, JOB_QUEUE_NAME, VERIFICATION_QUEUE_NAME, VERIFICATION_DAILY_QUEUE_NAME, DAILY_JOB_QUEUE_NAME
+from src.utils.mq import get_queue_depths, JOB_QUEUE_NAME, VERIFICATION_QUEUE_NAME, VERIFICATION_DAILY_QUEUE_NAME, DAILY_JOB_QUEUE_NAME, DAILY_VERIFICATION_TYPES
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +69,7 @@ class SystemWatchdog:
             for job in v_running_data:
                 v_type = job.get("v_type")
                 # Map job type to its specific target queue
-                target_q = VERIFICATION_DAILY_QUEUE_NAME if v_type == "DAILY_UPDATE" else VERIFICATION_QUEUE_NAME
+                target_q = VERIFICATION_DAILY_QUEUE_NAME if v_type in DAILY_VERIFICATION_TYPES else VERIFICATION_QUEUE_NAME
                 consumers = mq_state.get(target_q, {}).get("consumers", 0)
                 
                 started_at = job.get('started_at')
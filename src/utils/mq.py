@@ -2,6 +2,7 @@
 import os
 import pika
 import json
+import threading
 
 MQ_HOST = os.getenv("MQ_HOST", "localhost")
 MQ_USER = os.getenv("MQ_USER", "guest")
@@ -11,6 +12,8 @@ JOB_QUEUE_NAME = "address_jobs"
 VERIFICATION_QUEUE_NAME = "verification_jobs"
 VERIFICATION_DAILY_QUEUE_NAME = "verification_daily"
 DAILY_JOB_QUEUE_NAME = "daily_address_jobs"
+# 경량 daily queue로 라우팅되는 검증 작업 유형
+DAILY_VERIFICATION_TYPES = ("DAILY_UPDATE", "DAILY_UPDATE_BATCH")
 
 DLX_NAME = "nsenti.dlx"
 DLQ_NAME = "dead_letter_queue"
@@ -68,57 +71,152 @@ def get_mq_channel(queue_name=QUEUE_NAME):
             raise
     return connection, channel
 
-def publish_url(url_data):
-    connection, channel = get_mq_channel(QUEUE_NAME)
-    channel.basic_publish(
-        exchange='',
-        routing_key=QUEUE_NAME,
-        body=json.dumps(url_data),
-        properties=pika.BasicProperties(
-            delivery_mode=2,  # make message persistent
+class MQPublisher:
+    """
+    Long-lived, thread-safe publisher (one connection/channel per process).
+
+    - Lazily connects on first publish and reconnects once on a dead connection.
+    - Queues are declared (with DLX args) once per connection, not per message.
+    - The channel runs in AMQP transaction mode: `publish_batch` sends every
+      message and then waits for a single Tx.Commit-Ok, so N messages cost one
+      broker round-trip while still being durably accepted before we return.
+      (BlockingChannel.confirm_delivery() waits for an ack after *each*
+      basic_publish, which would defeat batching.)
+    - Bound to the PID that created it; forked children get their own.
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self._lock = threading.RLock()
+        self._connection = None
+        self._channel = None
+        self._declared = set()
+
+    def _connect(self):
+        credentials = pika.PlainCredentials(MQ_USER, MQ_PASS)
+        self._connection = pika.BlockingConnection(
+            pika.ConnectionParameters(
+                host=MQ_HOST,
+                credentials=credentials,
+                heartbeat=60,
+                blocked_connection_timeout=60
+            )
         )
-    )
-    connection.close()
+        self._channel = self._connection.channel()
+        setup_dlx(self._channel)
+        self._channel.tx_select()
+        self._declared = set()
+
+    def _ensure_channel(self):
+        if self._connection is None or self._connection.is_closed or self._channel is None or self._channel.is_closed:
+            self.close()
+            self._connect()
+        else:
+            # Service heartbeats that piled up while the connection sat idle
+            self._connection.process_data_events(time_limit=0)
+
+    def _declare(self, queue_name):
+        if queue_name in self._declared:
+            return
+        try:
+            self._channel.queue_declare(
+                queue=queue_name,
+                durable=True,
+                arguments={
+                    'x-dead-letter-exchange': DLX_NAME,
+                    'x-dead-letter-routing-key': queue_name
+                }
+            )
+        except pika.exceptions.ChannelClosedByBroker as e:
+            if e.reply_code != 406:
+                raise
+            # Queue exists with different args (legacy). Publishing still works,
+            # so reopen the channel instead of deleting a live queue.
+            self._channel = self._connection.channel()
+            setup_dlx(self._channel)
+            self._channel.tx_select()
+        self._declared.add(queue_name)
+
+    def _publish_locked(self, queue_name, messages):
+        self._ensure_channel()
+        self._declare(queue_name)
+        properties = pika.BasicProperties(delivery_mode=2)  # make message persistent
+        for message in messages:
+            self._channel.basic_publish(
+                exchange='',
+                routing_key=queue_name,
+                body=json.dumps(message),
+                properties=properties
+            )
+        self._channel.tx_commit()
+
+    def publish_batch(self, queue_name, messages, chunk_size=500):
+        """Publishes many messages with one commit round-trip per chunk. Returns the count sent."""
+        messages = list(messages)
+        if not messages:
+            return 0
+        with self._lock:
+            for i in range(0, len(messages), chunk_size):
+                chunk = messages[i:i + chunk_size]
+                try:
+                    self._publish_locked(queue_name, chunk)
+                except (pika.exceptions.AMQPConnectionError, pika.exceptions.AMQPChannelError,
+                        pika.exceptions.StreamLostError, ConnectionError):
+                    # Uncommitted messages are discarded by the broker, so a retry cannot duplicate them
+                    self.close()
+                    self._publish_locked(queue_name, chunk)
+        return len(messages)
+
+    def publish(self, queue_name, message):
+        return self.publish_batch(queue_name, [message])
+
+    def close(self):
+        with self._lock:
+            try:
+                if self._connection is not None and self._connection.is_open:
+                    self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+            self._channel = None
+            self._declared = set()
+
+
+_publisher = None
+_publisher_lock = threading.Lock()
+_inherited_publishers = []  # Parent publishers seen after fork; never closed from the child
+
+
+def get_publisher():
+    global _publisher
+    if _publisher is not None and _publisher.pid == os.getpid():
+        return _publisher
+    with _publisher_lock:
+        if _publisher is None or _publisher.pid != os.getpid():
+            if _publisher is not None:
+                _inherited_publishers.append(_publisher)
+            _publisher = MQPublisher()
+    return _publisher
+
+
+def publish_url(url_data):
+    get_publisher().publish(QUEUE_NAME, url_data)
+
+def publish_urls(url_data_list):
+    """Batch variant of publish_url (one broker round-trip per chunk)."""
+    return get_publisher().publish_batch(QUEUE_NAME, url_data_list)
 
 def publish_job(job_data):
-    connection, channel = get_mq_channel(JOB_QUEUE_NAME)
-    channel.basic_publish(
-        exchange='',
-        routing_key=JOB_QUEUE_NAME,
-        body=json.dumps(job_data),
-        properties=pika.BasicProperties(
-            delivery_mode=2,
-        )
-    )
-    connection.close()
+    get_publisher().publish(JOB_QUEUE_NAME, job_data)
 
 def publish_verification_job(job_data):
     # Route to different queues based on job type
     v_type = job_data.get("v_type")
-    queue = VERIFICATION_DAILY_QUEUE_NAME if v_type == "DAILY_UPDATE" else VERIFICATION_QUEUE_NAME
-    
-    connection, channel = get_mq_channel(queue)
-    channel.basic_publish(
-        exchange='',
-        routing_key=queue,
-        body=json.dumps(job_data),
-        properties=pika.BasicProperties(
-            delivery_mode=2,
-        )
-    )
-    connection.close()
+    queue = VERIFICATION_DAILY_QUEUE_NAME if v_type in DAILY_VERIFICATION_TYPES else VERIFICATION_QUEUE_NAME
+    get_publisher().publish(queue, job_data)
 
 def publish_daily_job(job_data):
-    connection, channel = get_mq_channel(DAILY_JOB_QUEUE_NAME)
-    channel.basic_publish(
-        exchange='',
-        routing_key=DAILY_JOB_QUEUE_NAME,
-        body=json.dumps(job_data),
-        properties=pika.BasicProperties(
-            delivery_mode=2,
-        )
-    )
-    connection.close()
+    get_publisher().publish(DAILY_JOB_QUEUE_NAME, job_data)
 
 def get_active_worker_count():
     import requests
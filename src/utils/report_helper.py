@@ -2,7 +2,7 @@
 import math
 from datetime import datetime, timedelta
 from src.db.connection import get_db_cursor
-from src.nlp.tokenizer import Tokenizer
+from src.nlp.token_store import NewsTokenStore
 from src.utils.calendar import Calendar
 
 class ReportHelper:
@@ -16,7 +16,7 @@ class ReportHelper:
         Calculates which news articles most influenced a prediction.
         Targeted for the "Why Gap" in consumer reports.
         """
-        tokenizer = Tokenizer()
+        token_store = NewsTokenStore()
         target_date = datetime.strptime(target_date_str, '%Y-%m-%d').date()
         
         # 1. Get Trading Days context
@@ -50,7 +50,8 @@ class ReportHelper:
                 # - Old news (no timestamp, only hint date): use hint date directly
                 # Impact date logic: post-16:00 news → next trading day
                 cur.execute("""
-                    SELECT c.title, c.content, c.published_at, u.url, u.published_at_hint
+                    SELECT c.title, c.content, c.published_at, u.url, u.published_at_hint,
+                           c.keywords->>'v' AS token_version, c.keywords->>'t' AS stored_tokens
                     FROM tb_news_content c
                     JOIN tb_news_mapping m ON c.url_hash = m.url_hash
                     JOIN tb_news_url u ON c.url_hash = u.url_hash
@@ -72,8 +73,10 @@ class ReportHelper:
                 market_open_dt = datetime.combine(actual_impact_date, datetime.min.time()) + timedelta(hours=9)
                 
                 for r in rows:
-                    content = (r['content'] or "") + " " + (r['title'] or "")
-                    tokens = tokenizer.tokenize(content)
+                    # 본문은 저장된 토큰을 재사용하고 제목만 토큰화
+                    tokens = token_store.tokens(r['content'], r['token_version'], r['stored_tokens'])
+                    if r['title']:
+                        tokens = tokens + token_store.tokenizer.tokenize(r['title'])
                     
                     base_score = 0.0
                     suffix = f"_L{lag}"
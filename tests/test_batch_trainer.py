@@ -0,0 +1,46 @@
+# tests/test_batch_trainer.py
+import polars as pl
+from datetime import date
+from unittest.mock import patch, MagicMock
+from src.learner.batch_trainer import BatchTrainer
+
+
+def _rows():
+    return [
+        {"url_hash": "h1", "date": date(2024, 1, 2), "content": "x", "extracted_content": None,
+         "token_version": None, "stored_tokens": None, "stock_codes": ["000660", "005930"]},
+        {"url_hash": "h2", "date": date(2024, 1, 3), "content": "y", "extracted_content": None,
+         "token_version": None, "stored_tokens": None, "stock_codes": ["005930"]},
+    ]
+
+
+def test_batch_tokenizes_each_article_once_and_trains_each_stock():
+    targets = [
+        {"stock_code": "000660", "optimal_lag": 2, "optimal_window_months": 1, "optimal_alpha": 1e-4, "model_type": "tfidf"},
+        {"stock_code": "005930", "optimal_lag": 3, "optimal_window_months": 1, "optimal_alpha": 1e-4, "model_type": "tfidf"},
+    ]
+    tokenized = []
+
+    def fake_add_tokens(df, **kwargs):
+        tokenized.extend(df["url_hash"].to_list())
+        return df.with_columns(pl.col("final_content").map_elements(lambda c: [c], return_dtype=pl.List(pl.String)).alias("tokens"))
+
+    trained = {}
+
+    def fake_update(self, v_job_id=None, target=None, prefetched_df_news=None):
+        trained[self.stock_code] = prefetched_df_news["tokens"].to_list()
+
+    trainer = BatchTrainer(max_workers=1)
+    with patch.object(trainer, "load_targets", return_value=targets), \
+         patch.object(trainer, "fetch_union_news", return_value=_rows()), \
+         patch("src.learner.batch_trainer.datetime") as mock_dt, \
+         patch("src.nlp.token_store.NewsTokenStore.add_tokens_column", side_effect=fake_add_tokens), \
+         patch("src.learner.manager.AnalysisManager.run_daily_update", fake_update), \
+         patch("src.learner.manager.LassoLearner", MagicMock()):
+        mock_dt.now.return_value.date.return_value = date(2024, 1, 10)
+        results = trainer.run()
+
+    assert sorted(tokenized) == ["h1", "h2"]
+    assert trained == {"000660": [["x"]], "005930": [["x"], ["y"]]}
+    assert all(r["error"] is None for r in results.values())
+    assert trainer.stats[False] == {"articles": 2, "pairs": 3, "build_s": trainer.stats[False]["build_s"]}
@@ -0,0 +1,73 @@
+# tests/test_calendar_impact.py
+import polars as pl
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+from src.utils.calendar import Calendar, TradingCalendarIndex
+
+# 종목 가격일: 2024-01-05(금), 2024-01-08(월), 2024-01-10(수) (01-09 거래정지)
+TRADING_DAYS = [date(2024, 1, 5), date(2024, 1, 8), date(2024, 1, 10)]
+# 시장 거래일: 01-12(금) 휴장 가정
+SESSIONS = [date(2024, 1, d) for d in (2, 3, 4, 5, 8, 9, 10, 11, 15, 16)]
+
+
+def _calendar(days, sessions=()):
+    index = TradingCalendarIndex()
+    index._fetch_price_days = lambda stock_code, after=None: [d for d in days if after is None or d > after]
+    index._market = list(sessions)
+    return index
+
+
+def test_impact_dates_match_scalar_mapping():
+    dates = [date(2024, 1, 1) + timedelta(days=i) for i in range(18)] + [None]
+    stamps = [
+        datetime(2024, 1, 5, 15, 59), datetime(2024, 1, 5, 16, 0), datetime(2024, 1, 8, 23, 30),
+        datetime(2024, 1, 10, 16, 5), datetime(2024, 1, 11, 18, 0), None,
+    ]
+    with patch("src.utils.calendar.TRADING_CALENDAR", _calendar(TRADING_DAYS, SESSIONS)):
+        for values, dtype in ((dates, pl.Date), (stamps, pl.Datetime)):
+            series = pl.Series("date", values, dtype=dtype)
+            got = Calendar.get_impact_dates("005930", series)
+            expected = [None if v is None else Calendar.get_impact_date("005930", v) for v in values]
+            assert got.dtype == pl.Date
+            assert got.to_list() == expected
+
+        strings = pl.Series("date", ["2024-01-06", "2024-01-09", "2024-01-12"])
+        # 01-09 거래정지 -> 01-10, 마지막 가격일 이후 01-12 휴장 -> 01-15
+        assert Calendar.get_impact_dates("005930", strings).to_list() == [date(2024, 1, 8), date(2024, 1, 10), date(2024, 1, 15)]
+
+
+def test_impact_dates_without_any_calendar():
+    series = pl.Series("date", [date(2024, 1, 6), date(2024, 1, 7), date(2024, 1, 9)])
+    with patch("src.utils.calendar.TRADING_CALENDAR", _calendar([])):
+        got = Calendar.get_impact_dates("005930", series)
+    assert got.to_list() == [date(2024, 1, 8), date(2024, 1, 8), date(2024, 1, 9)]
+
+
+def test_bisect_lookups_and_stock_overrides():
+    index = _calendar(TRADING_DAYS, SESSIONS)
+    with patch("src.utils.calendar.TRADING_CALENDAR", index):
+        assert Calendar.get_trading_days("005930") == TRADING_DAYS
+        assert Calendar.get_trading_days("005930", "2024-01-06", "2024-01-10") == TRADING_DAYS[1:]
+        assert Calendar.get_next_trading_day("005930", "2024-01-09") == date(2024, 1, 10)
+        assert Calendar.get_prev_trading_day("005930", date(2024, 1, 10)) == date(2024, 1, 8)
+        assert Calendar.get_prev_trading_day("005930", date(2024, 1, 5)) is None
+        assert Calendar.offset_trading_days("005930", date(2024, 1, 6), 2) == date(2024, 1, 11)
+        assert Calendar.is_trading_day("005930", "2024-01-08")
+        assert not Calendar.is_trading_day("005930", "2024-01-09")  # 시장은 열렸지만 종목 거래정지
+        assert index.is_trading_day(date(2024, 1, 9))
+        assert not index.is_trading_day(date(2024, 1, 12))
+
+
+def test_refresh_picks_up_new_prices():
+    days = list(TRADING_DAYS)
+    index = _calendar(days, SESSIONS)
+    assert index.next_trading_day(date(2024, 1, 11), "005930") == date(2024, 1, 11)
+
+    days.append(date(2024, 1, 15))  # 01-11 거래정지, 01-15 가격 유입
+    assert index.next_trading_day(date(2024, 1, 11), "005930") == date(2024, 1, 11)  # TTL 내 캐시
+    index.invalidate("005930")
+    assert index.next_trading_day(date(2024, 1, 11), "005930") == date(2024, 1, 15)
+
+    days.append(date(2024, 1, 16))
+    index.refresh_seconds = 0  # TTL 경과 -> 마지막 가격일 이후만 증분 조회
+    assert index.trading_days("005930")[-2:] == [date(2024, 1, 15), date(2024, 1, 16)]
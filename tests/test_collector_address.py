@@ -24,7 +24,7 @@ def test_extract_urls(collector):
     assert len(urls) == 2
 
 @patch("src.collector.news.get_db_cursor")
-@patch("src.collector.news.publish_url")
+@patch("src.collector.news.publish_urls")
 def test_process_page(mock_publish, mock_cursor, collector):
     # Mock DB to return one existing URL
     mock_cur = mock_cursor.return_value.__enter__.return_value
@@ -34,9 +34,10 @@ def test_process_page(mock_publish, mock_cursor, collector):
     
     collector.process_urls(urls)
     
-    # Should only publish the one that doesn't exist
+    # Should only publish the one that doesn't exist, in a single batch
     assert mock_publish.call_count == 1
-    mock_publish.assert_called_once_with({
+    mock_publish.assert_called_once_with([{
         "url": "https://news.naver.com/news/456",
-        "url_hash": collector.get_url_hash("https://news.naver.com/news/456")
-    })
+        "url_hash": collector.get_url_hash("https://news.naver.com/news/456"),
+        "stock_code": None
+    }])
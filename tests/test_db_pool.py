@@ -0,0 +1,98 @@
+# tests/test_db_pool.py
+import pytest
+from unittest.mock import MagicMock, patch
+from psycopg2 import pool as pg_pool
+import src.db.connection as db
+
+
+class FakeThreadedPool:
+    def __init__(self, minconn, maxconn, **kwargs):
+        self._pool = []
+        self.created = 0
+        self.closed = []
+
+    def getconn(self):
+        if self._pool:
+            return self._pool.pop()
+        self.created += 1
+        conn = MagicMock()
+        conn.closed = 0
+        conn.autocommit = False
+        conn.get_transaction_status.return_value = 0
+        return conn
+
+    def putconn(self, conn, close=False):
+        if close:
+            self.closed.append(conn)
+        else:
+            self._pool.append(conn)
+
+    def closeall(self):
+        self._pool.clear()
+
+
+@pytest.fixture
+def fake_pool():
+    with patch.object(db.pg_pool, "ThreadedConnectionPool", FakeThreadedPool), \
+         patch.object(db, "DB_POOL_ENABLED", True):
+        db._pool = None
+        yield
+        db._pool = None
+
+
+def test_connection_is_reused(fake_pool):
+    with db.get_db_cursor():
+        pass
+    with db.get_db_cursor():
+        pass
+    assert db.get_pool()._pool.created == 1
+
+
+def test_error_rolls_back_and_returns_connection(fake_pool):
+    with pytest.raises(ValueError):
+        with db.get_db_connection() as conn:
+            raise ValueError("boom")
+    conn.rollback.assert_called()
+    assert db.get_pool()._in_use == 0
+    assert len(db.get_pool()._pool._pool) == 1
+
+
+def test_broken_connection_is_discarded(fake_pool):
+    import psycopg2
+    with pytest.raises(psycopg2.OperationalError):
+        with db.get_db_connection() as conn:
+            raise psycopg2.OperationalError("server closed the connection")
+    assert db.get_pool()._pool.closed == [conn]
+
+
+def test_pool_is_rebuilt_in_forked_child(fake_pool):
+    parent_pool = db.get_pool()
+    with patch.object(db.os, "getpid", return_value=parent_pool.pid + 1):
+        child_pool = db.get_pool()
+    assert child_pool is not parent_pool
+    assert parent_pool in db._inherited_pools
+
+
+def test_checkout_times_out_when_exhausted(fake_pool):
+    pool = db.ConnectionPool(minconn=0, maxconn=1, timeout=0.01)
+    conn = pool.getconn()
+    with pytest.raises(pg_pool.PoolError):
+        pool.getconn()
+    pool.putconn(conn)
+    pool.putconn(pool.getconn())
+
+
+def test_all_dead_idle_connections_are_skipped(fake_pool):
+    pool = db.get_pool()
+    conns = [pool.getconn() for _ in range(3)]
+    for conn in conns:
+        pool.putconn(conn)
+    alive, dead1, dead2 = conns  # LIFO: dead2, dead1 순으로 먼저 나옴
+    for conn in (dead1, dead2):
+        conn.cursor.return_value.__enter__.return_value.execute.side_effect = Exception("server closed the connection")
+
+    pool.healthcheck_idle = 0  # 모든 유휴 연결을 ping
+    assert pool.getconn() is alive
+    assert pool._pool.closed == [dead2, dead1]
+    assert dead1 not in pool._last_used and dead2 not in pool._last_used
+    assert pool._pool.created == 3
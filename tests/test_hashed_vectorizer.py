@@ -0,0 +1,51 @@
+# tests/test_hashed_vectorizer.py
+import numpy as np
+import polars as pl
+from sklearn.feature_extraction.text import TfidfVectorizer
+from src.nlp.hashed_vectorizer import HashedTfidfVectorizer
+from src.learner.lasso import LassoLearner
+
+DOCS = [["상승", "실적"], ["상승", "수주"], ["하락", "실적", "실적"], ["상승"], []]
+
+
+def test_hashed_tfidf_matches_vocabulary_tfidf():
+    hashed = HashedTfidfVectorizer(n_features=2 ** 20, min_df=2, max_df=0.85)
+    tfidf = TfidfVectorizer(tokenizer=lambda x: x, lowercase=False, token_pattern=None, min_df=2, max_df=0.85)
+    X_hash = hashed.fit_transform(DOCS).toarray()
+    X_tfidf = tfidf.fit_transform(DOCS).toarray()
+
+    # 충돌이 없으면 컬럼 순서만 다름
+    names = hashed.resolve(hashed.active_buckets_, DOCS)
+    order = [names[int(b)] for b in hashed.active_buckets_]
+    assert sorted(order) == sorted(tfidf.get_feature_names_out())
+    vocab = list(tfidf.get_feature_names_out())
+    assert np.allclose(X_hash, X_tfidf[:, [vocab.index(w) for w in order]])
+
+    # 스트리밍(청크 누적) 통계 == 한 번에 학습 == 참조 횟수 가중
+    streamed = HashedTfidfVectorizer(n_features=2 ** 20, min_df=2, max_df=0.85)
+    streamed.partial_fit(DOCS[:2]).partial_fit(DOCS[2:])
+    assert np.allclose(streamed.transform(DOCS).toarray(), X_hash)
+    weighted = HashedTfidfVectorizer(n_features=2 ** 20, min_df=2, max_df=0.85)
+    weighted.fit(DOCS[:4], doc_counts=[1, 1, 1, 2])
+    assert np.array_equal(weighted.df_, HashedTfidfVectorizer(n_features=2 ** 20, min_df=2).fit(DOCS[:4] + [DOCS[3]]).df_)
+
+
+def test_hashing_engine_dict_uses_words():
+    # 호재/악재가 완전 공선이라 호재_L1 계수는 float64 반올림 오차 수준 -> dtype 고정
+    learner = LassoLearner(lags=2, min_df=1, use_fundamentals=False, decay_rate=0.5,
+                           text_engine="hashing", hash_features=2 ** 16, dtype="float64")
+    rng = np.random.default_rng(0)
+    docs = [["호재"] if r > 0 else ["악재"] for r in rng.normal(size=60)]
+    learner.daily_news = pl.Series("daily_news", docs, dtype=pl.List(pl.String))
+    df = pl.DataFrame({
+        "excess_return": [0.02 if d == ["호재"] else -0.02 for d in docs[1:]],
+        "news_idx_L1": np.arange(1, 60, dtype=np.int32),
+        "news_idx_L2": np.arange(0, 59, dtype=np.int32),
+    })
+    learner.alpha = 1e-4
+    learner.model.alpha = 1e-4
+    design = learner._build_design(df)
+    learner.model.fit(design["X"], design["y"])
+    sentiment_dict = learner._coef_to_dict(design, learner.model.coef_, [])
+    assert sentiment_dict["호재_L1"] > 0
+    assert all(not name.startswith("#") for name in sentiment_dict)
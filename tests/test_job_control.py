@@ -0,0 +1,65 @@
+# tests/test_job_control.py
+import os
+from unittest.mock import MagicMock, patch
+from src.utils.job_control import JobControl, ProgressThrottle, notify_job_stop
+
+
+def _control(status_rows, listening):
+    """LISTEN 스레드 없이 (pid 고정) 상태 조회 결과만 주입한 JobControl"""
+    control = JobControl(poll_seconds=10)
+    control.pid = os.getpid()
+    if listening:
+        control._listening.set()
+    cursor = MagicMock()
+    cursor.fetchone.side_effect = status_rows
+    return control, cursor
+
+
+def test_progress_throttle_coalesces_to_latest_value():
+    writes = []
+    throttle = ProgressThrottle(lambda *args: writes.append(args), interval=5)
+    with patch("src.utils.job_control.time.monotonic", side_effect=[0.0, 1.0, 2.0, 6.0, 6.0, 7.0, 8.0]):
+        throttle.update(1.0, "a")   # 첫 호출은 즉시 기록
+        throttle.update(2.0, "b")
+        throttle.update(3.0, "c")
+        throttle.update(4.0, "d")   # interval 경과 -> 최신 값 기록
+        throttle.update(5.0, "e")
+        throttle.flush()
+        throttle.flush()            # 기록할 값이 없으면 no-op
+    assert writes == [(1.0, "a"), (4.0, "d"), (5.0, "e")]
+
+
+def test_stop_signal_is_pushed_without_polling():
+    control, cursor = _control([{"status": "running"}], listening=True)
+    with patch("src.utils.job_control.get_db_cursor") as mock_cursor:
+        mock_cursor.return_value.__enter__.return_value = cursor
+        assert not control.is_stopped("verification", 7)  # 최초 1회 상태 조회
+        for _ in range(100):
+            assert not control.is_stopped("verification", 7)
+        control._on_notify("verification:7")
+        control._on_notify("job:7")
+        assert control.is_stopped("verification", 7) and control.is_stopped("job", 7)
+        assert not control.is_stopped("verification", None)
+    assert cursor.execute.call_count == 1
+
+    control.forget("verification", 7)
+    assert ("verification", 7) not in control._stopped
+
+
+def test_falls_back_to_rate_limited_polling_without_listener():
+    control, cursor = _control([{"status": "running"}, {"status": "running"}, None], listening=False)
+    with patch("src.utils.job_control.get_db_cursor") as mock_cursor, \
+         patch("src.utils.job_control.time.monotonic", side_effect=[0.0, 5.0, 10.0, 10.0, 15.0, 20.0, 20.0]):
+        mock_cursor.return_value.__enter__.return_value = cursor
+        assert not control.is_stopped("job", 3)   # t=0: 조회
+        assert not control.is_stopped("job", 3)   # t=5: 조회 생략
+        assert not control.is_stopped("job", 3)   # t=10: 조회
+        assert not control.is_stopped("job", 3)   # t=15: 조회 생략
+        assert control.is_stopped("job", 3)       # t=20: 삭제된 작업 -> 중단
+    assert cursor.execute.call_count == 3
+
+
+def test_notify_uses_job_control_channel():
+    cur = MagicMock()
+    notify_job_stop(cur, "job", 12)
+    cur.execute.assert_called_once_with("SELECT pg_notify(%s, %s)", ("job_control", "job:12"))
@@ -0,0 +1,117 @@
+# tests/test_lasso_features.py
+import numpy as np
+import polars as pl
+from datetime import date, timedelta
+from unittest.mock import patch
+from src.learner.lasso import LassoLearner
+from src.utils.calendar import TradingCalendarIndex
+
+TRADING_DAYS = [date(2024, 1, d) for d in (2, 3, 4, 5, 8, 9)]
+
+
+@patch.object(TradingCalendarIndex, "_load_market_sessions", return_value=[])
+@patch.object(TradingCalendarIndex, "_fetch_price_days", return_value=TRADING_DAYS)
+@patch("src.utils.calendar.TRADING_CALENDAR", new_callable=TradingCalendarIndex)
+def test_lagged_matrix_matches_per_lag_transform(_calendar, _mock_days, _mock_sessions):
+    learner = LassoLearner(lags=3, min_df=1, use_fundamentals=False)
+    df_news = pl.DataFrame({
+        "date": [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 6), date(2024, 1, 8)],
+        "content": ["", "", "", ""],
+        "tokens": [["반도체"], ["실적", "상승"], ["주말"], ["하락"]],
+    })
+    df_prices = pl.DataFrame({
+        "date": TRADING_DAYS[2:],
+        "stock_code": ["005930"] * 4,
+        "excess_return": [0.01, -0.02, 0.03, -0.01],
+    })
+    df = learner.prepare_features(df_prices, df_news, pl.DataFrame())
+
+    # 1/8 (Mon): L1 = weekend + Monday news, L2 = 1/5 (none), L3 = 1/4 (none)
+    # 1/4 (Thu): L2 = 1/3 news, L3 = 1/2 news
+    docs = learner.daily_news.to_list()
+    row_jan4 = df.filter(pl.col("date") == date(2024, 1, 4)).row(0, named=True)
+    assert docs[row_jan4["news_idx_L2"]] == ["실적", "상승"]
+    assert docs[row_jan4["news_idx_L3"]] == ["반도체"]
+    row_jan8 = df.filter(pl.col("date") == date(2024, 1, 8)).row(0, named=True)
+    assert sorted(docs[row_jan8["news_idx_L1"]]) == ["주말", "하락"]
+    assert row_jan8["news_idx_L2"] == -1
+
+    X_shift = learner._lagged_text_matrix(df, fit=True)
+
+    # Same frame expressed as legacy per-lag token columns
+    legacy = df.with_columns([
+        pl.Series(f"news_lag{k}", [docs[i] if i >= 0 else [] for i in df[f"news_idx_L{k}"]], dtype=pl.List(pl.String))
+        for k in range(1, 4)
+    ]).drop([f"news_idx_L{k}" for k in range(1, 4)])
+    X_legacy = learner._lagged_text_matrix(legacy, fit=True)
+
+    assert X_shift.shape == X_legacy.shape
+    assert np.allclose(X_shift.toarray(), X_legacy.toarray())
+
+
+def test_feature_plan_fundamentals_and_tech_columns():
+    from src.learner.tech_indicators import TechIndicatorProvider
+    days = [d for d in (date(2024, 1, 1) + timedelta(days=i) for i in range(28)) if d.weekday() < 5]
+    rng = np.random.default_rng(0)
+    df_prices = pl.DataFrame({
+        "date": days,
+        "stock_code": ["005930"] * len(days),
+        "close_price": 100 * np.cumprod(1 + rng.normal(0, 0.01, len(days))),
+        "excess_return": rng.normal(0, 0.01, len(days)),
+    })
+    df_fund = pl.DataFrame({
+        "date": [date(2024, 1, 3), date(2024, 1, 8)],
+        "per": [10.0, 12.0], "pbr": [1.0, 1.1], "roe": [5.0, 6.0], "market_cap": [1e12, 2e12],
+    })
+    df_news = pl.DataFrame({"date": [date(2024, 1, 7)], "tokens": [["주말"]]})
+    learner = LassoLearner(lags=2, use_fundamentals=True, use_tech_indicators=True)
+    with patch("src.utils.calendar.TRADING_CALENDAR", TradingCalendarIndex()), \
+         patch.object(TradingCalendarIndex, "_fetch_price_days", return_value=days), \
+         patch.object(TradingCalendarIndex, "_load_market_sessions", return_value=[]):
+        df = learner.prepare_features(df_prices, df_news, df_fund)
+
+    assert df.columns == [
+        "date", "stock_code", "close_price", "excess_return", "per", "pbr", "roe", "market_cap", "log_market_cap",
+        *TechIndicatorProvider.TECH_COLUMNS, "news_idx_L1", "news_idx_L2",
+    ]
+    assert df["per"].to_list()[:7] == [0.0, 0.0, 10.0, 10.0, 10.0, 12.0, 12.0]
+    expected = TechIndicatorProvider.calculate_indicators(df_prices)
+    assert np.allclose(df["tech_macd_line"].to_numpy(), expected["tech_macd_line"].to_numpy())
+    # 일요일 뉴스 -> 1/8(월) L1, 다음 거래일 1/9의 L2
+    assert df["news_idx_L1"].to_list()[:7] == [-1, -1, -1, -1, -1, 0, -1]
+    assert df["news_idx_L2"].to_list()[:7] == [-1, -1, -1, -1, -1, -1, 0]
+
+
+def test_design_matrix_is_single_csc_in_learner_dtype():
+    rng = np.random.default_rng(0)
+    vocab = [f"w{i}" for i in range(30)]
+    docs = [list(rng.choice(vocab, size=8)) for _ in range(40)]
+    df = pl.DataFrame({
+        "excess_return": rng.normal(0, 0.02, 38),
+        "news_idx_L1": np.arange(1, 39, dtype=np.int32),
+        "news_idx_L2": np.arange(0, 38, dtype=np.int32),
+        **{c: rng.normal(size=38) for c in ["per", "pbr", "roe", "log_market_cap"]},
+    })
+    designs = {}
+    for dtype in ("float64", "float32"):
+        learner = LassoLearner(lags=2, min_df=2, decay_rate=0.5, dtype=dtype)
+        learner.daily_news = pl.Series("daily_news", docs, dtype=pl.List(pl.String))
+        with patch("src.learner.lasso.GLOBAL_LEXICON_CACHE", {"w0"}):
+            designs[dtype] = learner._build_design(df)
+
+    # 기존 방식: MaxAbsScaler -> hstack(dense) -> 컬럼 필터 -> 가중치
+    from scipy import sparse
+    from sklearn.preprocessing import MaxAbsScaler, StandardScaler
+    ref_learner = LassoLearner(lags=2, min_df=2, dtype="float64")
+    ref_learner.daily_news = pl.Series("daily_news", docs, dtype=pl.List(pl.String))
+    X_text = MaxAbsScaler().fit_transform(ref_learner._lagged_text_matrix(df, fit=True))
+    X_dense = StandardScaler().fit_transform(df.select(["per", "pbr", "roe", "log_market_cap"]).to_numpy())
+    X_full = sparse.hstack([X_text, sparse.csr_matrix(X_dense)]).tocsr()
+    d64 = designs["float64"]
+    expected = X_full[:, learner.keep_indices].multiply(d64["weights"]).toarray()
+
+    assert np.allclose(d64["X"].toarray(), expected)
+    d32 = designs["float32"]
+    assert d32["X"].format == "csc" and d32["X"].dtype == np.float32
+    assert d32["feature_names"] == d64["feature_names"]
+    assert np.allclose(d32["X"].toarray(), expected, atol=1e-6)
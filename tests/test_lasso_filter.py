@@ -0,0 +1,34 @@
+# tests/test_lasso_filter.py
+import numpy as np
+import polars as pl
+from scipy import sparse
+from src.learner.lasso import LassoLearner
+
+
+def test_black_swan_filter_keeps_frequent_and_rescued_words():
+    learner = LassoLearner()
+    df = pl.DataFrame({"excess_return": [0.01, -0.01, 0.02, -0.02]})
+    # col0: frequent, col1: rare & calm, col2: rare but critical, col3: never seen
+    X = sparse.csr_matrix(np.array([
+        [1, 0, 0, 0],
+        [1, 1, 0, 0],
+        [1, 0, 1, 0],
+        [1, 0, 0, 0],
+    ], dtype=float))
+    critical = np.array([False, False, True, False])
+    weights, keep = learner.calculate_volatility_weights_with_filter(
+        df, X, min_df=3, critical_mask=critical, rescue_mask=np.zeros(4, dtype=bool)
+    )
+    assert keep == [0, 2]
+    assert np.isclose(weights.mean(), 1.0)
+
+    # Name-based fallback gives the same result
+    _, keep_by_name = learner.calculate_volatility_weights_with_filter(
+        df, X, min_df=3, feature_names=["삼성_L1", "보합_L1", "횡령_L1", "없음_L1"]
+    )
+    assert keep_by_name == keep
+
+
+def test_lag_decay_vector_fixed_rate():
+    learner = LassoLearner(lags=3, decay_rate=0.5)
+    assert np.allclose(learner._lag_decay_vector(None), [1.0, 1 / 1.5, 1 / 2.0])
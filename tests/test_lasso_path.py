@@ -0,0 +1,103 @@
+# tests/test_lasso_path.py
+import os
+import time
+import uuid
+import numpy as np
+from scipy import sparse
+from unittest.mock import patch
+from celer import Lasso
+from src.learner.lasso import LassoLearner
+
+
+def _design(seed=0):
+    rng = np.random.default_rng(seed)
+    X = sparse.random(120, 40, density=0.2, format="csc", random_state=seed)
+    beta = np.zeros(40)
+    beta[:5] = [0.8, -0.6, 0.5, -0.4, 0.3]
+    y = X @ beta + 0.01 * rng.standard_normal(120)
+    return {
+        "X": X,
+        "y": y,
+        "feature_names": [f"w{i}_L1" for i in range(40)],
+        "weights": np.ones(40),
+        "scaler_params": {},
+    }
+
+
+def test_path_matches_independent_fits():
+    learner = LassoLearner()
+    design = _design()
+    alphas = [1e-4, 5e-4, 1e-3, 5e-3]
+
+    with patch.object(learner, "_build_design", return_value=design):
+        dicts, _ = learner.train_path(None, alphas)
+
+    assert set(dicts) == set(alphas)
+    for a in alphas:
+        ref = Lasso(alpha=a, max_iter=10000).fit(design["X"], design["y"]).coef_
+        got = np.array([dicts[a].get(f"w{i}_L1", 0.0) for i in range(40)])
+        assert np.allclose(got, ref, atol=1e-3)
+
+
+def test_retrain_warm_start_remaps_previous_coefficients():
+    learner = LassoLearner(alpha=1e-4, warm_start_retrain=True)
+    learner.train_slot = ("005930", "Main")
+    first = _design()
+    learner._fit_lasso(learner.model, first["X"], first["y"], first, 1e-4)
+
+    # 다음 재학습: 컬럼 순서가 바뀌고 일부 피처가 빠짐
+    order = np.arange(39, 0, -1)
+    second = dict(first, X=first["X"][:, order], feature_names=[first["feature_names"][i] for i in order], weights=np.ones(39))
+    init = learner._warm_start_coef(second, (("005930", "Main"), 1e-4))
+    assert np.isclose(init[list(order).index(1)], learner._warm_coefs[(("005930", "Main"), 1e-4)]["w1_L1"])
+
+    stats = learner._fit_lasso(learner.model, second["X"], second["y"], second, 1e-4)
+    assert stats["warm"] and learner.fit_stats[0]["warm"] is False
+    ref = Lasso(alpha=1e-4, max_iter=10000).fit(second["X"], second["y"]).coef_
+    assert np.allclose(learner.model.coef_, ref, atol=1e-3)
+
+
+def test_parallel_stability_selection_matches_serial():
+    design = _design(seed=1)
+    alphas = [1e-4, 1e-3]
+    results = []
+    for workers, executor in ((1, "process"), (2, "process"), (2, "thread"), (2, "fork"), (2, "spawn")):
+        learner = LassoLearner()
+        learner.stability_workers = workers
+        learner.stability_executor = executor
+        learner.stability_bootstraps = 4
+        learner.stability_sample_fraction = 0.8
+        np.random.seed(7)
+        stable = learner._stability_selection(design["X"], design["y"], design["feature_names"], alphas)
+        results.append({a: stable[a].tolist() for a in alphas})
+    assert results[0] == results[1] == results[2] == results[3] == results[4]
+    assert LassoLearner().stability_executor == "spawn"
+
+
+def _rendezvous_bootstrap(indices, alphas_desc):
+    """두 부트스트랩이 동시에 실행 중이어야만 반환 (순차 실행이면 시간 초과)"""
+    from src.learner import lasso
+    X, y = lasso._BOOTSTRAP_DESIGN
+    assert X.shape[0] == len(y) == 120  # 공유 메모리 행렬에 연결됨
+    rendezvous = os.environ["STABILITY_RENDEZVOUS_DIR"]
+    open(os.path.join(rendezvous, f"{os.getpid()}_{uuid.uuid4().hex}"), "w").close()
+    deadline = time.monotonic() + 120
+    while len(os.listdir(rendezvous)) < 2:
+        if time.monotonic() > deadline:
+            raise RuntimeError("bootstraps did not run concurrently")
+        time.sleep(0.05)
+    return [np.array([0])] * len(alphas_desc)
+
+
+def test_spawn_bootstraps_run_concurrently(tmp_path, monkeypatch):
+    monkeypatch.setenv("STABILITY_RENDEZVOUS_DIR", str(tmp_path))
+    design = _design(seed=2)
+    learner = LassoLearner()
+    learner.stability_workers = 2
+    learner.stability_executor = "spawn"
+    learner.stability_bootstraps = 2
+    with patch("src.learner.lasso._bootstrap_selection", _rendezvous_bootstrap):
+        stable = learner._stability_selection(design["X"], design["y"], design["feature_names"], [1e-3])
+    pids = {int(name.split("_")[0]) for name in os.listdir(tmp_path)}
+    assert len(pids) == 2 and os.getpid() not in pids
+    assert stable[1e-3].tolist() == [0]
@@ -0,0 +1,37 @@
+# tests/test_model_artifact.py
+import numpy as np
+from unittest.mock import patch
+from src.learner.lasso import LassoLearner
+from src.learner.model_artifact import ModelArtifact
+from src.predictor.scoring import Predictor
+
+SENTIMENT_DICT = {"상승_L1": 0.5, "상승_L3": -0.1, "실적 개선_L2": 0.2, "__F_per__": 0.01, "__T_rsi_14": -0.3}
+SCALER = {"cols": ["per"], "mean": [10.0], "scale": [2.0]}
+
+
+def test_artifact_round_trip_is_zero_copy():
+    learner = LassoLearner(lags=3)
+    blob = learner.build_artifact(SENTIMENT_DICT, SCALER, {"train_end_date": "2024-03-01"}).to_bytes()
+    artifact = ModelArtifact.from_bytes(memoryview(blob))
+
+    assert artifact.to_dict() == SENTIMENT_DICT
+    assert artifact.lags == 3 and artifact.scaler_params == SCALER
+    assert artifact.meta["train_end_date"] == "2024-03-01"
+    # lag-major 컬럼 레이아웃, 배열은 blob을 공유
+    assert artifact.words == ["상승", "실적 개선"]
+    assert artifact.kept.tolist() == [0, 3, 4]
+    assert np.shares_memory(artifact.beta, np.frombuffer(blob, dtype=np.uint8))
+
+
+@patch("src.predictor.scoring.get_db_cursor")
+def test_predictor_prefers_artifact_over_dict_rows(mock_cursor):
+    mock_cur = mock_cursor.return_value.__enter__.return_value
+    mock_cur.fetchone.return_value = {"payload": memoryview(ModelArtifact.from_dict(SENTIMENT_DICT).to_bytes())}
+
+    assert Predictor().load_dict("v1", "005930", "Main") == SENTIMENT_DICT
+    mock_cur.fetchall.assert_not_called()
+
+    # artifact가 없으면 기존 사전 행 조회
+    mock_cur.fetchone.return_value = None
+    mock_cur.fetchall.return_value = [{"word": "상승_L1", "beta": 0.5}]
+    assert Predictor().load_dict("v0", "005930", "Main") == {"상승_L1": 0.5}
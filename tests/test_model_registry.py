@@ -0,0 +1,38 @@
+# tests/test_model_registry.py
+from unittest.mock import patch
+from src.learner.model_registry import ModelRegistry
+from src.learner.lasso import LassoLearner
+from src.predictor.scoring import Predictor
+
+
+def test_registry_evicts_oldest_version():
+    registry = ModelRegistry(max_versions=2)
+    for v in ("v1", "v2", "v3"):
+        registry.put("005930", v, "Main", {"상승_L1": 0.1})
+    assert not registry.has_version("005930", "v1")
+    assert registry.get_dict("005930", "v3") == {"상승_L1": 0.1}
+
+
+@patch("src.predictor.scoring.get_db_cursor")
+def test_predictor_reads_registry_without_db(mock_cursor):
+    registry = ModelRegistry()
+    registry.put("005930", "val_60d_2024-01-02", "Buffer", {"상승_L1": 0.5}, {"scaler": {}})
+    predictor = Predictor(registry=registry)
+
+    # Main was not retrained for this version: empty, and no DB fallback
+    assert predictor.load_dict("val_60d_2024-01-02", "005930", "Main") == {}
+    assert predictor.load_dict("val_60d_2024-01-02", "005930", "Buffer") == {"상승_L1": 0.5}
+    mock_cursor.assert_not_called()
+
+
+def test_learner_skips_db_in_registry_mode():
+    learner = LassoLearner()
+    learner.registry = ModelRegistry()
+    meta = learner._training_meta("2024-01-01", "2024-03-01", {"a_L1": 1.0}, {}, True)
+    with patch.object(learner, "save_dict") as save, patch.object(learner, "deactivate_all_versions") as deactivate:
+        learner._store_dict({"a_L1": 1.0}, "v1", "005930", "Main", meta, True, None)
+        save.assert_not_called()
+        deactivate.assert_not_called()
+        learner._store_dict({"a_L1": 1.0}, "prod", "005930", "Main", meta, True, True)
+        save.assert_called_once()
+    assert learner.registry.get_dict("005930", "v1") == {"a_L1": 1.0}
@@ -0,0 +1,43 @@
+# tests/test_mq_publisher.py
+import pytest
+from unittest.mock import MagicMock, patch
+import pika
+import src.utils.mq as mq
+
+
+@pytest.fixture
+def mock_pika():
+    with patch("src.utils.mq.pika.BlockingConnection") as mock_conn_cls:
+        conn = mock_conn_cls.return_value
+        conn.is_closed = False
+        conn.is_open = True
+        channel = conn.channel.return_value
+        channel.is_closed = False
+        mq._publisher = None
+        yield mock_conn_cls, channel
+        mq._publisher = None
+
+
+def test_batch_uses_one_connection_and_one_commit(mock_pika):
+    mock_conn_cls, channel = mock_pika
+    msgs = [{"url": f"https://n.news.naver.com/{i}", "url_hash": str(i)} for i in range(300)]
+
+    assert mq.publish_urls(msgs) == 300
+    mq.publish_url({"url": "x", "url_hash": "y"})
+
+    assert mock_conn_cls.call_count == 1
+    assert channel.basic_publish.call_count == 301
+    assert channel.tx_commit.call_count == 2
+    # Queue declared once per connection, not per message
+    declared = [c.kwargs["queue"] for c in channel.queue_declare.call_args_list if c.kwargs.get("queue") == mq.QUEUE_NAME]
+    assert len(declared) == 1
+
+
+def test_reconnects_once_on_lost_connection(mock_pika):
+    mock_conn_cls, channel = mock_pika
+    channel.tx_commit.side_effect = [pika.exceptions.StreamLostError("lost"), None]
+
+    mq.publish_job({"job_id": 1})
+
+    assert mock_conn_cls.call_count == 2
+    assert channel.tx_commit.call_count == 2
@@ -0,0 +1,82 @@
+# tests/test_optimal_lag.py
+import numpy as np
+import polars as pl
+from unittest.mock import patch, MagicMock
+from src.learner import lasso
+from src.learner.lasso import LassoLearner, _evaluate_lag
+
+MAX_LAG = 3
+
+
+def _frame():
+    rng = np.random.default_rng(3)
+    vocab = [f"w{i}" for i in range(25)]
+    docs = [list(rng.choice(vocab, size=6)) for _ in range(80)]
+    signal = rng.random(80) > 0.5
+    docs = [d + (["호재"] if s else ["악재"]) for d, s in zip(docs, signal)]
+    n = 80 - MAX_LAG
+    # 수익률은 2거래일 전 뉴스(news_idx_L2)의 호재/악재로 결정 -> lag 1은 맞힐 수 없음
+    lag2_doc = np.arange(MAX_LAG - 1, 80 - 1)
+    df = pl.DataFrame({
+        "date": pl.date_range(pl.date(2024, 1, 1), pl.date(2024, 1, 1) + pl.duration(days=n - 1), eager=True),
+        "stock_code": ["005930"] * n,
+        "excess_return": np.where(signal[lag2_doc], 0.02, -0.02) + rng.normal(0, 0.002, n),
+        **{f"news_idx_L{k}": np.arange(MAX_LAG - k + 1, 80 - k + 1, dtype=np.int32) for k in range(1, MAX_LAG + 1)},
+        **{c: rng.normal(size=n) for c in ["per", "pbr", "roe", "log_market_cap"]},
+    })
+    return df, pl.Series("daily_news", docs, dtype=pl.List(pl.String))
+
+
+def _learner(daily_news):
+    learner = LassoLearner(min_df=2, decay_rate=0.5, alpha=1e-4)
+    learner.model.alpha = 1e-4
+    learner.daily_news = daily_news
+    return learner
+
+
+def _run(workers):
+    df, daily_news = _frame()
+    learner = _learner(daily_news)
+    fetch = MagicMock(return_value=(df.select(["date", "stock_code", "excess_return"]), pl.DataFrame(), pl.DataFrame()))
+    with patch.object(learner, "fetch_data", fetch), \
+         patch.object(learner, "prepare_features", return_value=df), \
+         patch.object(lasso, "get_db_cursor"), \
+         patch.object(lasso, "GLOBAL_LEXICON_CACHE", {"w0"}), \
+         patch.object(lasso, "LAG_SEARCH_WORKERS", workers):
+        best = learner.find_optimal_lag("005930", "2024-01-01", "2024-03-31", max_lag=MAX_LAG)
+    return best, fetch, learner
+
+
+def test_optimal_lag_loads_data_once_and_matches_per_lag_frames():
+    best, fetch, learner = _run(workers=1)
+    assert fetch.call_count == 1
+    assert learner.lags == 5  # 원래 lags 복원
+
+    # 기준: lag마다 해당 lag 컬럼만 가진 프레임으로 새 learner를 학습
+    df, daily_news = _frame()
+    split = int(len(df) * 0.8)
+    expected = {}
+    with patch.object(lasso, "GLOBAL_LEXICON_CACHE", {"w0"}):
+        for lag in range(1, MAX_LAG + 1):
+            frame = df.drop([f"news_idx_L{k}" for k in range(lag + 1, MAX_LAG + 1)])
+            _, score, err = _evaluate_lag(lag, _learner(daily_news), frame.head(split), frame.tail(len(frame) - split))
+            assert err is None
+            expected[lag] = score
+    assert expected[2] > expected[1]
+    assert best == max(expected, key=lambda k: (expected[k], -k))
+
+    # spawn 워커 병렬 평가도 같은 결과
+    best_parallel, fetch_parallel, _ = _run(workers=2)
+    assert best_parallel == best
+    assert fetch_parallel.call_count == 1
+
+
+def test_lag_search_pool_is_capped():
+    learner = LassoLearner()
+    with patch.object(lasso.os, "cpu_count", return_value=64), \
+         patch.object(lasso, "LAG_SEARCH_WORKERS", 0):
+        assert learner._lag_search_pool_size(5) == 2
+    with patch.object(lasso, "LAG_SEARCH_WORKERS", 8):
+        assert learner._lag_search_pool_size(5) == 2
+    with patch.object(lasso, "LAG_SEARCH_WORKERS", 1):
+        assert learner._lag_search_pool_size(5) == 1
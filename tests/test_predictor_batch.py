@@ -0,0 +1,51 @@
+# tests/test_predictor_batch.py
+import math
+from unittest.mock import patch
+from src.predictor.scoring import Predictor
+from src.learner.model_registry import ModelRegistry
+
+
+def _predictor():
+    registry = ModelRegistry()
+    registry.put("005930", "val_60d_2024-01-08", "Main", {"상승_L1": 0.004, "하락_L1": -0.003, "실적_L2": 0.002, "상장폐지_L1": -0.001})
+    registry.put("005930", "val_60d_2024-01-08", "Buffer", {"상승_L1": 0.001, "호재_L1": 0.002, "악재_L1": -0.002},
+                 metrics={})
+    registry.put("005930", "val_60d_2024-01-09", "Main", {"상승_L1": -0.002, "호재_L1": 0.005, "실적_L1": 0.005, "급등_L1": 0.005, "공시_L1": 0.005},
+                 metrics={"scaler": {"cols": ["per"], "mean": [10.0], "scale": [2.0]}})
+    registry.put("005930", "val_60d_2024-01-09", "Buffer", {"__F_per": 0.004, "미미_L1": 1e-7})
+    return Predictor(registry=registry)
+
+
+@patch.object(Predictor, "_market_stats", return_value=(1.2, 0.02))
+@patch("src.predictor.scoring.get_db_cursor", side_effect=AssertionError("no DB access expected"))
+def test_predict_batch_matches_per_day_predict_advanced(_cursor, _stats):
+    predictor = _predictor()
+    # 검증기처럼 오늘의 L1 묶음을 다음 날 L2로 같은 list 객체로 넘김
+    shared = ["실적", "상승"]
+    requests = [
+        {"version": "val_60d_2024-01-08", "news_by_lag": {1: ["상승", "하락", "상승", "없음"], 2: ["실적"]}},
+        {"version": "val_60d_2024-01-08", "news_by_lag": {1: shared}},
+        {"version": "val_60d_2024-01-09", "news_by_lag": {1: ["상승"], 2: shared}},
+        {"version": "val_60d_2024-01-08", "news_by_lag": {1: ["호재", "상장폐지", "악재"]}, "fundamentals": {"pbr": 7.5}},
+        # 동률 가중치 4개 -> 상위 3개는 발생 순서
+        {"version": "val_60d_2024-01-09", "news_by_lag": {1: ["공시", "급등", "실적", "호재", "상승", "미미"]},
+         "fundamentals": {"per": 13.0, "pbr": 1.0}},
+        {"version": "val_60d_2024-01-09", "news_by_lag": {}},
+        {"version": "val_60d_2024-01-09", "news_by_lag": {1: [("호재", 0.5), ("상승", 1.0)]}},
+    ]
+
+    batch = predictor.predict_batch("005930", requests)
+    expected = [
+        predictor.predict_advanced("005930", r["news_by_lag"], r["version"], fundamentals=r.get("fundamentals"))
+        for r in requests
+    ]
+
+    assert len(batch) == len(expected)
+    for got, want in zip(batch, expected):
+        assert got["status"] == want["status"]
+        assert got["top_keywords"] == want["top_keywords"]
+        for key in ("expected_alpha", "net_score", "intensity", "confidence_score"):
+            assert math.isclose(got[key], want[key], rel_tol=1e-12, abs_tol=1e-15)
+    assert batch[3]["status"] == "Super Sell"  # 상장폐지 (Critical)
+    assert [c["word"] for c in batch[4]["top_keywords"]["positive"]] == ["공시", "급등", "실적"]
+    assert _stats.call_count == 1 + len(requests)
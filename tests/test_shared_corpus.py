@@ -0,0 +1,42 @@
+# tests/test_shared_corpus.py
+import polars as pl
+from datetime import date
+from src.learner.shared_corpus import SharedNewsCorpus
+
+
+def test_round_trip_and_window_slice(tmp_path):
+    df = pl.DataFrame({
+        "date": [date(2024, 1, 3), date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)],
+        "tokens": [["반도체", "상승"], ["실적"], [], ["상승"]],
+    })
+    corpus = SharedNewsCorpus.build(df, prices={"2024-01-02": 0.01, "2024-01-03": -0.02}, base_dir=str(tmp_path))
+    worker = SharedNewsCorpus.attach(corpus.path)
+
+    full = worker.to_polars()
+    assert full["date"].to_list() == sorted(df["date"].to_list())
+    assert sorted(map(tuple, full["tokens"].to_list())) == sorted(map(tuple, df["tokens"].to_list()))
+
+    window = worker.to_polars(date(2024, 1, 2), date(2024, 1, 3))
+    assert window["date"].to_list() == [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 3)]
+    assert window["tokens"][0].to_list() == []
+
+    assert worker.prices() == {"2024-01-02": 0.01, "2024-01-03": -0.02}
+    corpus.cleanup()
+
+
+def test_group_slice(tmp_path):
+    df = pl.DataFrame({
+        "date": [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)],
+        "tokens": [["a"], ["b", "c"], ["d"], ["e", "f"]],
+        "stock_codes": [["005930"], ["000660", "005930"], ["000660"], ["005930"]],
+    })
+    corpus = SharedNewsCorpus.build(df, base_dir=str(tmp_path), group_col="stock_codes")
+    worker = SharedNewsCorpus.attach(corpus.path)
+
+    samsung = worker.to_polars(group="005930")
+    assert samsung["tokens"].to_list() == [["a"], ["b", "c"], ["e", "f"]]
+    hynix = worker.to_polars(date(2024, 1, 3), None, group="000660")
+    assert hynix["date"].to_list() == [date(2024, 1, 3)]
+    assert hynix["tokens"].to_list() == [["d"]]
+    assert worker.to_polars(group="999999").is_empty()
+    corpus.cleanup()
@@ -0,0 +1,50 @@
+# tests/test_sliding_df.py
+import random
+import numpy as np
+import polars as pl
+from datetime import date, timedelta
+from src.learner.lasso import LassoLearner
+
+DAYS = [date(2024, 1, 1) + timedelta(days=i) for i in range(40)]
+
+
+def _corpus(seed=0):
+    rng = random.Random(seed)
+    vocab = [f"단어{i}" for i in range(300)]
+    weights = [1 / (i + 1) for i in range(300)]
+    return [rng.choices(vocab, weights=weights, k=40) for _ in DAYS]
+
+
+def _window(learner, docs, start, length, lags=3):
+    """daily_news = start-lags+1 .. start+length 구간 문서, 행마다 lag별 일별 문서 인덱스"""
+    first = start - lags + 1
+    learner.daily_news = pl.Series("daily_news", docs[first:start + length], dtype=pl.List(pl.String))
+    learner.daily_news_dates = pl.Series("date", DAYS[first:start + length])
+    rows = np.arange(length) + lags - 1
+    cols = {"excess_return": np.linspace(-0.02, 0.02, length)}
+    for k in range(1, lags + 1):
+        idx = rows - k + 1
+        idx[((np.arange(length) + start) % 7 == 3) & (k == 2)] = -1  # 뉴스 없는 날
+        cols[f"news_idx_L{k}"] = idx.astype(np.int32)
+    return pl.DataFrame(cols)
+
+
+def test_incremental_df_matches_full_recompute():
+    docs = _corpus()
+    inc = LassoLearner(lags=3, min_df=2, max_features=120, incremental_df=True)
+    inc.train_slot = ("005930", "Main")
+    full = LassoLearner(lags=3, min_df=2, max_features=120)
+
+    for start in (2, 5, 10, 11, 20):
+        if start == 10:
+            docs = list(docs)
+            docs[12] = docs[12] + ["정정보도"]  # 같은 날짜의 뉴스 구성이 바뀐 경우
+        X_inc = inc._lagged_text_matrix(_window(inc, docs, start, 15), fit=True)
+        X_full = full._lagged_text_matrix(_window(full, docs, start, 15), fit=True)
+
+        assert list(inc.vectorizer.get_feature_names_out()) == list(full.vectorizer.get_feature_names_out())
+        assert np.allclose(inc.vectorizer.idf_, full.vectorizer.idf_)
+        assert np.allclose(X_inc.toarray(), X_full.toarray())
+        if start == 11:
+            # 1일 이동: 들어오고 나간 날짜와 lag 경계에서 참조 횟수가 바뀐 날짜만 갱신
+            assert inc._df_windows[("005930", "Main")].last_delta <= 2 * 3
@@ -0,0 +1,39 @@
+# tests/test_sparse_fista.py
+import numpy as np
+from scipy import sparse
+from unittest.mock import patch
+from celer import Lasso
+from src.learner.sparse_fista import SparseFISTALasso
+from src.learner.lasso import LassoLearner
+from tests.test_lasso_path import _design
+
+
+def test_sparse_fista_matches_celer_without_densifying():
+    rng = np.random.default_rng(1)
+    X = sparse.random(80, 3000, density=0.01, format="csc", random_state=1)
+    beta = np.zeros(3000)
+    beta[rng.choice(3000, 10, replace=False)] = rng.normal(0, 0.5, 10)
+    y = X @ beta + 0.01 * rng.standard_normal(80) + 0.05
+
+    ref = Lasso(alpha=1e-3, max_iter=10000, tol=1e-8).fit(X, y)
+    with patch.object(sparse.csr_matrix, "toarray", side_effect=AssertionError("densified")):
+        model = SparseFISTALasso(alpha=1e-3, max_iter=10000, tol=1e-8).fit(X, y)
+
+    assert np.allclose(model.coef_, ref.coef_, atol=1e-4)
+    assert abs(model.intercept_ - ref.intercept_) < 1e-4
+    assert np.allclose(model.predict(X), ref.predict(X), atol=1e-4)
+
+
+def test_fista_engine_path_matches_celer():
+    design = _design()
+    alphas = [1e-4, 1e-3, 5e-3]
+    dicts = {}
+    for engine in ("celer", "fista"):
+        learner = LassoLearner(engine=engine)
+        with patch.object(learner, "_build_design", return_value=design):
+            dicts[engine], _ = learner.train_path(None, alphas)
+
+    for a in alphas:
+        for i in range(40):
+            name = f"w{i}_L1"
+            assert abs(dicts["fista"][a].get(name, 0.0) - dicts["celer"][a].get(name, 0.0)) < 1e-3
@@ -0,0 +1,34 @@
+# tests/test_token_store.py
+import pytest
+import polars as pl
+from src.nlp.tokenizer import Tokenizer
+from src.nlp.token_store import NewsTokenStore
+
+TEXT = "삼성전자가 반도체 실적 호조로 주가가 상승했다. 외국인 매수세가 이어졌다."
+
+
+@pytest.fixture(scope="module")
+def store():
+    return NewsTokenStore(Tokenizer())
+
+
+def test_stored_tokens_match_tokenizer(store):
+    stored = store.encode(TEXT)
+    for n in (1, 2, 3):
+        assert store.tokens(TEXT, stored["v"], stored["t"], n_gram=n) == store.tokenizer.tokenize(TEXT, n_gram=n)
+
+
+def test_stale_version_is_retokenized(store):
+    tokens = store.tokens(TEXT, "old-version", "stale tokens", n_gram=1)
+    assert tokens == store.tokenizer.tokenize(TEXT, n_gram=1)
+
+
+def test_add_tokens_column_prefers_stored(store):
+    df = pl.DataFrame({
+        "final_content": [TEXT, TEXT],
+        "token_version": [store.fingerprint, None],
+        "stored_tokens": ["가짜 토큰", None],
+    })
+    out = store.add_tokens_column(df, n_gram=1)
+    assert out["tokens"][0].to_list() == ["가짜", "토큰"]
+    assert out["tokens"][1].to_list() == store.tokenizer.tokenize(TEXT, n_gram=1)
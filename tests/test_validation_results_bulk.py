@@ -0,0 +1,62 @@
+# tests/test_validation_results_bulk.py
+import pytest
+from unittest.mock import patch
+from src.learner.validator import WalkForwardValidator
+from src.learner.awo_engine import AWOEngine
+
+
+def _result(d, score=0.01, actual=0.02):
+    return {"date": d, "prediction": 1, "sentiment_score": score, "actual_alpha": actual, "is_correct": actual > 0, "top_keywords": {}}
+
+
+@patch("psycopg2.extras.execute_values")
+@patch("src.learner.validator.get_db_cursor")
+def test_validation_results_are_buffered_and_flushed_once(mock_cursor, mock_execute_values):
+    validator = WalkForwardValidator("005930")
+    for d in ("2024-01-08", "2024-01-09", "2024-01-10"):
+        validator.save_validation_result(_result(d), v_job_id=7, used_version_tag="3m_0.1_scan")
+    validator.save_validation_result(_result("2024-01-11"))
+    assert not mock_cursor.called  # 루프 중에는 DB 접근 없음
+
+    assert validator.flush_validation_results() == 4
+    assert mock_cursor.call_count == 1
+    verification, predictions = mock_execute_values.call_args_list
+    assert "tb_verification_results" in verification.args[1]
+    assert verification.args[2] == [(7, d, 0.01, 0.02, True, "3m_0.1_scan") for d in ("2024-01-08", "2024-01-09", "2024-01-10")]
+    assert "tb_predictions" in predictions.args[1] and len(predictions.args[2]) == 1
+    assert validator.flush_validation_results() == 0
+
+
+@patch("psycopg2.extras.execute_values")
+@patch("src.learner.validator.get_db_cursor")
+def test_results_are_flushed_when_validation_fails(mock_cursor, mock_execute_values):
+    validator = WalkForwardValidator("005930")
+
+    def failing_range(*args, **kwargs):
+        validator.save_validation_result(_result("2024-01-08"), v_job_id=7)
+        raise RuntimeError("boom")
+
+    with patch.object(validator, "_validate_range", side_effect=failing_range):
+        with pytest.raises(RuntimeError):
+            validator.run_validation("2024-01-08", "2024-01-31", v_job_id=7)
+    assert mock_execute_values.call_count == 1
+    assert len(mock_execute_values.call_args.args[2]) == 1
+
+
+@patch("psycopg2.extras.execute_values")
+@patch("src.learner.awo_engine.get_db_cursor")
+def test_awo_scan_results_and_checkpoints_use_one_statement(mock_cursor, mock_execute_values):
+    engine = AWOEngine("005930")
+    engine.save_scan_results(7, 3, [_result(f"2024-01-{d:02d}") for d in range(8, 13)])
+    engine._save_checkpoints(7, 3, {0.1: (0.6, 0.02), 0.01: (0.55, 0.03)})
+
+    assert mock_cursor.call_count == 2
+    scan, checkpoints = mock_execute_values.call_args_list
+    assert len(scan.args[2]) == 5 and scan.args[2][0][-1] == "3m_scan"
+    assert checkpoints.args[2] == [(7, "005930", 3, 0.1, 0.6, 0.02), (7, "005930", 3, 0.01, 0.55, 0.03)]
+
+    mock_cursor.return_value.__enter__.return_value.fetchall.return_value = [
+        {"alpha": 0.10000000149, "hit_rate": 0.6, "mae": 0.02},  # REAL 컬럼 정밀도
+    ]
+    checkpoints = engine._load_checkpoints(7, 3)
+    assert engine._alpha_key(0.1) in checkpoints and engine._alpha_key(0.01) not in checkpoints
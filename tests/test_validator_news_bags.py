@@ -0,0 +1,48 @@
+# tests/test_validator_news_bags.py
+import polars as pl
+from datetime import date
+from unittest.mock import patch
+from src.learner.validator import WalkForwardValidator
+from src.utils.calendar import TradingCalendarIndex
+
+# 1/5(금), 1/8(월), 1/9(화), 1/10(수)
+TRADING_DAYS = [date(2024, 1, 5), date(2024, 1, 8), date(2024, 1, 9), date(2024, 1, 10)]
+
+
+def _calendar():
+    index = TradingCalendarIndex()
+    index._fetch_price_days = lambda stock_code, after=None: TRADING_DAYS
+    index._market = []
+    return index
+
+
+def test_news_by_lag_is_lookup_over_prefetched_tokens():
+    validator = WalkForwardValidator("005930")
+    df_all_news = pl.DataFrame({
+        "date": [date(2024, 1, 5), date(2024, 1, 6), date(2024, 1, 7), date(2024, 1, 8), date(2024, 1, 10)],
+        "tokens": [["실적"], ["주말"], ["공시"], ["상승"], ["하락"]],
+    })
+    with patch("src.utils.calendar.TRADING_CALENDAR", _calendar()), \
+         patch("src.learner.validator.get_db_cursor", side_effect=AssertionError("no DB access expected")):
+        validator.build_news_bags(df_all_news)
+        news_by_lag = validator.fetch_historical_news_by_lag(date(2024, 1, 9), lag_limit=3)
+        next_day = validator.fetch_historical_news_by_lag(date(2024, 1, 10), lag_limit=3)
+        assert validator.fetch_historical_news_by_lag(date(2024, 1, 7), lag_limit=3) == {}  # 비거래일
+        first_day = validator.fetch_historical_news_by_lag(date(2024, 1, 5), lag_limit=3)
+
+    # 1/9: L1 = 1/9 (뉴스 없음), L2 = 1/8 (주말 + 월요일 뉴스), L3 = 1/5
+    assert 1 not in news_by_lag
+    assert sorted(news_by_lag[2]) == ["공시", "상승", "주말"]
+    assert news_by_lag[3] == ["실적"]
+    assert first_day == {1: ["실적"]}
+    # 다음 검증일은 같은 거래일 묶음을 같은 list 객체로 재사용 (predict_batch가 한 번만 펼침)
+    assert next_day[1] == ["하락"]
+    assert next_day[3] is news_by_lag[2]
+
+
+def test_news_bags_fall_back_to_sql_without_tokens():
+    validator = WalkForwardValidator("005930")
+    validator.build_news_bags(pl.DataFrame({"date": [date(2024, 1, 5)], "content": ["본문"]}))
+    assert validator._news_bags is None
+    validator.build_news_bags(pl.DataFrame())
+    assert validator._news_bags is not None
@@ -0,0 +1,103 @@
+# tests/test_validator_segments.py
+import os
+import pytest
+import polars as pl
+from concurrent.futures import Future
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+from src.learner.validator import WalkForwardValidator
+
+# 2024-01-01(월) ~ 2024-02-09(금) 평일
+DAYS = [d for d in (date(2024, 1, 1) + timedelta(days=i) for i in range(40)) if d.weekday() < 5]
+DATES = [d.strftime('%Y-%m-%d') for d in DAYS]
+
+
+class _InlineExecutor:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def test_segments_start_on_retrain_days_and_cover_all_days():
+    segments = WalkForwardValidator._split_segments(DATES, 'weekly', 3)
+    assert len(segments) == 3
+    assert segments[0][0] == 0 and segments[-1][1] == len(DATES) - 1
+    for (lo, hi), (next_lo, _) in zip(segments, segments[1:]):
+        assert hi == next_lo
+        assert datetime.strptime(DATES[next_lo], '%Y-%m-%d').weekday() == 0  # 월요일 = Main 재학습일
+
+    assert WalkForwardValidator._split_segments(DATES, 'weekly', 1) == [(0, len(DATES) - 1)]
+    daily = WalkForwardValidator._split_segments(DATES, 'daily', 4)
+    assert [hi - lo for lo, hi in daily] == [8, 7, 7, 7]
+
+
+def test_parallel_segments_merge_in_date_order():
+    validator = WalkForwardValidator("005930")
+    prices = {d: (0.01 if i % 2 else -0.01) for i, d in enumerate(DATES)}
+    news = pl.DataFrame({"date": DAYS, "tokens": [["실적"]] * len(DAYS)})
+    calls = []
+
+    def fake_worker(args):
+        seg_start, seg_end, corpus_path = args[7], args[8], args[13]
+        assert os.path.isdir(corpus_path)
+        calls.append((seg_start, seg_end))
+        days = [d for d in DATES if seg_start <= d < seg_end]
+        return {0.1: {"results": [
+            {"date": d, "prediction": 1, "sentiment_score": 0.01, "actual_alpha": prices[d], "is_correct": prices[d] > 0}
+            for d in days
+        ]}}
+
+    progress = []
+    with patch("src.learner.validator.ProcessPoolExecutor", _InlineExecutor), \
+         patch("src.learner.validator._run_segment_worker", side_effect=fake_worker):
+        res = validator.run_validation(DATES[0], DATES[-1], alpha=0.1, dry_run=True, prefetched_df_news=news,
+                                       prefetched_prices=prices, segment_workers=3, progress_callback=progress.append)
+
+    assert len(calls) == 3
+    assert [r["date"] for r in res["results"]] == DATES[:-1]
+    assert res["total_days"] == len(DATES) - 1
+    assert res["hit_rate"] == sum(1 for d in DATES[:-1] if prices[d] > 0) / (len(DATES) - 1)
+    assert progress == sorted(progress) and progress[-1] < 1.0
+
+
+def test_failed_segment_fails_the_whole_run():
+    validator = WalkForwardValidator("005930")
+    prices = {d: 0.01 for d in DATES}
+    news = pl.DataFrame({"date": DAYS, "tokens": [["실적"]] * len(DAYS)})
+    corpus_paths = []
+
+    def fake_worker(args):
+        corpus_paths.append(args[13])
+        if args[7] != DATES[0]:
+            raise MemoryError("worker killed")
+        return {0.1: {"results": [{"date": DATES[0], "prediction": 1, "sentiment_score": 0.01,
+                                   "actual_alpha": 0.01, "is_correct": True}]}}
+
+    with patch("src.learner.validator.ProcessPoolExecutor", _InlineExecutor), \
+         patch("src.learner.validator._run_segment_worker", side_effect=fake_worker), \
+         pytest.raises(RuntimeError, match="segment"):
+        validator.run_validation(DATES[0], DATES[-1], alpha=0.1, dry_run=True, prefetched_df_news=news,
+                                 prefetched_prices=prices, segment_workers=3)
+    assert corpus_paths and not os.path.exists(corpus_paths[0])
+
+
+def test_segment_pool_is_capped():
+    validator = WalkForwardValidator("005930")
+    with patch("src.learner.validator.os.cpu_count", return_value=64), \
+         patch("src.learner.validator.VALIDATION_SEGMENT_WORKERS", 0):
+        assert validator._segment_pool_size(DATES, 'weekly', None) == 3
+        assert validator._segment_pool_size(DATES, 'weekly', 16) == 3
+        assert validator._segment_pool_size(DATES, 'weekly', 1) == 1